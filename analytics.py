@@ -0,0 +1,97 @@
+# analytics.py
+from collections import Counter
+
+# How many entries the summary lists for jobs, companies and majors, and how
+# many of the most recent days it covers
+TOP_ENTRIES = 10
+RECENT_DAYS = 30
+
+
+class ApplicationAnalytics:
+    """Running application counts per job, company, major, status and day.
+
+    Every application is folded in once when the view is built; after that
+    inserts, status changes and removals adjust the counters one record at a
+    time, so the cost of keeping them current does not grow with the number
+    of applications. ``company_of(job_id)`` and ``major_of(candidate_id)``
+    resolve the fields that live on other collections.
+    """
+
+    def __init__(self, applications=(), company_of=lambda job_id: None, major_of=lambda candidate_id: None):
+        self.company_of = company_of
+        self.major_of = major_of
+        self.total = 0
+        self.by_job = Counter()
+        self.by_company = Counter()
+        self.by_major = Counter()
+        self.by_status = Counter()
+        self.by_day = Counter()
+        self._summary = None
+        for app in applications:
+            self.add(app)
+
+    @classmethod
+    def from_counts(cls, by_job, by_company, by_major, by_status, by_day):
+        """Analytics over counts already aggregated elsewhere, as {key: count} dicts."""
+        analytics = cls()
+        analytics.total = sum(by_status.values())
+        analytics.by_job.update(by_job)
+        analytics.by_company.update(by_company)
+        analytics.by_major.update(by_major)
+        analytics.by_status.update(by_status)
+        analytics.by_day.update(by_day)
+        return analytics
+
+    def _fold(self, app, delta):
+        self.total += delta
+        self.by_job[app['job_id']] += delta
+        self.by_company[self.company_of(app['job_id'])] += delta
+        self.by_major[self.major_of(app['candidate_id'])] += delta
+        self.by_status[app['status']] += delta
+        self.by_day[app['application_date']] += delta
+        self._summary = None
+
+    def add(self, app):
+        """Count one application."""
+        self._fold(app, 1)
+
+    def remove(self, app):
+        """Stop counting one application."""
+        self._fold(app, -1)
+
+    def apply_changes(self, changes):
+        """Update the counters for (old_record, new_record) pairs from a write."""
+        for old, new in changes:
+            if old is not None:
+                self.remove(old)
+            if new is not None:
+                self.add(new)
+
+    def summary(self, top=TOP_ENTRIES, days=RECENT_DAYS):
+        """The counters as plain data, computed once per change.
+
+        ``jobs``, ``companies`` and ``majors`` are [key, count] pairs, largest
+        first, limited to ``top``; ``days`` covers the ``days`` most recent
+        application dates, oldest first.
+        """
+        if self._summary is None or self._summary[0] != (top, days):
+            self._summary = ((top, days), {
+                'total': self.total,
+                'statuses': _nonzero(self.by_status),
+                'jobs': _largest(self.by_job, top),
+                'companies': _largest(self.by_company, top),
+                'majors': _largest(self.by_major, top),
+                'days': sorted(_nonzero(self.by_day).items())[-days:],
+            })
+        return self._summary[1]
+
+
+def _nonzero(counter):
+    return {key: count for key, count in counter.items() if count > 0}
+
+
+def _largest(counter, top):
+    """The ``top`` largest counts as [key, count] pairs, ties broken by key."""
+    entries = sorted(((key, count) for key, count in counter.items() if count > 0),
+                     key=lambda entry: (-entry[1], str(entry[0])))
+    return [list(entry) for entry in entries[:top]]
@@ -1,49 +1,60 @@
 # app.py
 from datetime import datetime
-from flask import Flask, jsonify, request, render_template, session, redirect, url_for, flash
+from flask import (Flask, Response, jsonify, request, render_template, session, redirect, url_for, flash,
+                   stream_with_context, g, has_app_context)
 from model import (load_users, save_users, load_jobs, save_jobs, 
                    load_candidates, save_candidates, load_applications, save_applications,
                    load_companies, save_companies, get_company_by_id,
                    authenticate_user, get_applicants, get_applicant_by_id, get_candidate_by_id,
-                   get_job_by_id, get_candidate_by_user_id, generate_id)
+                   get_job_by_id, get_candidate_by_user_id, generate_id,
+                   get_application_index, compact_applications,
+                   migrate_json_to_sqlite, iter_collection, get_application_summary,
+                   create_candidate_account, build_snapshot,
+                   update_application_statuses, APPLICATION_STATUSES, get_analytics_summary,
+                   rank_applicants, recommend_jobs,
+                   UnitOfWork, set_unit_of_work_provider,
+                   search_jobs, parse_deadline, get_open_jobs,
+                   get_applicants_page, iter_applicants, get_jobs_page, APPLICANT_SORTS, JOB_SORTS,
+                   archive_closed_jobs, get_archive_stats, ARCHIVE_HORIZON_DAYS)
+from flask.json.provider import DefaultJSONProvider
+from collections.abc import Mapping
 from functools import wraps
+from bulk_import import IMPORTERS, IMPORT_BATCH_SIZE, import_file
+from export import EXPORT_FORMATS, EXPORT_MIMETYPES, export_applications
+from metrics import metrics
+from response_cache import cached_response
+from traffic import traffic_recorder
+from validation import validate_registration
+import base64
+import click
+import json
 import os
-import re
 
 def is_job_open(job):
     """Check if a job is currently open for applications."""
-    try:
-        current_date = datetime.now().date()
-        deadline = datetime.strptime(job['application_deadline'], '%Y-%m-%d').date()
-        return current_date <= deadline
-    except (ValueError, KeyError):
-        return False
+    deadline = parse_deadline(job.get('application_deadline'))
+    return deadline is not None and datetime.now().date() <= deadline
 
 def get_application_count(job_id):
     """Get the number of applications for a specific job."""
-    applications = load_applications()
-    return len([app for app in applications if app['job_id'] == job_id])
-
-def validate_email(email):
-    """Validate email format using regex."""
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
-
-def username_exists(username):
-    """Check if username already exists."""
-    users = load_users()
-    return any(user['username'].lower() == username.lower() for user in users)
-
-def email_exists(email):
-    """Check if email already exists in candidates."""
-    candidates = load_candidates()
-    return any(candidate['email'].lower() == email.lower() for candidate in candidates)
+    return get_application_index().count_for_job(job_id)
 
 # Initialize the Flask application
 app = Flask(__name__)
 app.secret_key = os.environ.get('SECRET_KEY', 'your-secret-key-change-this-in-production')
 app.config['SESSION_TYPE'] = 'filesystem'
 
+class JobFairJSONProvider(DefaultJSONProvider):
+    """JSON provider that also serializes the compact records from records.py."""
+
+    @staticmethod
+    def default(value):
+        if isinstance(value, Mapping):
+            return dict(value)
+        return DefaultJSONProvider.default(value)
+
+app.json = JobFairJSONProvider(app)
+
 def login_required(f):
     @wraps(f)
     def decorated_function(*args, **kwargs):
@@ -63,6 +74,48 @@ def admin_required(f):
         return f(*args, **kwargs)
     return decorated_function
 
+# Per-request latency and storage I/O, exposed on /admin/metrics
+@app.before_request
+def start_request_metrics():
+    metrics.start_request()
+
+@app.after_request
+def finish_request_metrics(response):
+    route = request.url_rule.rule if request.url_rule else 'unmatched'
+    breakdown = metrics.finish_request(route, request.method, response.status_code, request.path)
+    if breakdown is not None:
+        traffic_recorder.record(request.method, route, request.path, request.args.to_dict(flat=False),
+                                request.form.to_dict(), session.get('user_type', 'anonymous'),
+                                response.status_code, breakdown['duration'])
+    return response
+
+@app.teardown_request
+def abandon_request_metrics(exc):
+    # Only does anything when the request failed before a response was made
+    route = request.url_rule.rule if request.url_rule else 'unmatched'
+    metrics.finish_request(route, request.method, 500, request.path)
+
+# Each request reads a collection at most once and saves all of its changes
+# together when it finishes (see UnitOfWork in model.py). Views that need to
+# report a failed write commit g.unit_of_work themselves before responding.
+set_unit_of_work_provider(lambda: g.get('unit_of_work') if has_app_context() else None)
+
+@app.before_request
+def start_unit_of_work():
+    g.unit_of_work = UnitOfWork()
+
+@app.after_request
+def commit_unit_of_work(response):
+    work = g.pop('unit_of_work', None)
+    if work is not None and response.status_code < 500:
+        work.commit()
+    return response
+
+@app.teardown_request
+def discard_unit_of_work(exc):
+    # Changes left by a request that raised are never written
+    g.pop('unit_of_work', None)
+
 @app.route('/')
 def index():
     if 'user_id' in session:
@@ -105,67 +158,19 @@ def login():
     
     return render_template('login.html')
 
+# Registration form fields, and the ones stored on the candidate profile
+REGISTRATION_FIELDS = ('username', 'password', 'confirm_password', 'first_name', 'last_name',
+                       'email', 'major', 'phone', 'gpa')
+CANDIDATE_FIELDS = ('first_name', 'last_name', 'email', 'major', 'phone', 'gpa')
+
 @app.route('/register', methods=['GET', 'POST'])
 def register():
     if request.method == 'POST':
         # Get form data
-        username = request.form.get('username', '').strip()
-        password = request.form.get('password', '').strip()
-        confirm_password = request.form.get('confirm_password', '').strip()
-        first_name = request.form.get('first_name', '').strip()
-        last_name = request.form.get('last_name', '').strip()
-        email = request.form.get('email', '').strip()
-        major = request.form.get('major', '').strip()
-        phone = request.form.get('phone', '').strip()
-        gpa = request.form.get('gpa', '').strip()
+        fields = {name: request.form.get(name, '').strip() for name in REGISTRATION_FIELDS}
         
         # Validation
-        errors = []
-        
-        # Required field validation
-        if not username:
-            errors.append('Username is required.')
-        elif len(username) < 3:
-            errors.append('Username must be at least 3 characters long.')
-        elif username_exists(username):
-            errors.append('Username already exists. Please choose a different one.')
-            
-        if not password:
-            errors.append('Password is required.')
-        elif len(password) < 6:
-            errors.append('Password must be at least 6 characters long.')
-            
-        if password != confirm_password:
-            errors.append('Passwords do not match.')
-            
-        if not first_name:
-            errors.append('First name is required.')
-            
-        if not last_name:
-            errors.append('Last name is required.')
-            
-        if not email:
-            errors.append('Email is required.')
-        elif not validate_email(email):
-            errors.append('Please enter a valid email address.')
-        elif email_exists(email):
-            errors.append('Email already registered. Please use a different email.')
-            
-        if not major:
-            errors.append('Major is required.')
-            
-        if not phone:
-            errors.append('Phone number is required.')
-            
-        if not gpa:
-            errors.append('GPA is required.')
-        else:
-            try:
-                gpa_float = float(gpa)
-                if gpa_float < 0.0 or gpa_float > 4.0:
-                    errors.append('GPA must be between 0.0 and 4.0.')
-            except ValueError:
-                errors.append('Please enter a valid GPA (e.g., 3.5).')
+        errors = validate_registration(fields)
         
         # If validation fails, return with errors
         if errors:
@@ -173,46 +178,20 @@ def register():
                 flash(error, 'error')
             return render_template('register.html')
         
-        # Create new user and candidate records
+        # Create new user and candidate records, written together. Uniqueness
+        # is checked again under the write lock on commit in case another
+        # request registered the same username or email in the meantime.
         try:
-            # Generate IDs
-            user_id = generate_id(1)  # User ID starts with 1
-            candidate_id = generate_id(2)  # Candidate ID starts with 2
-            
-            # Create user record
-            new_user = {
-                'id': user_id,
-                'username': username,
-                'password': password,  # In production, this should be hashed
-                'user_type': 'candidate',
-                'candidate_id': candidate_id
-            }
-            
-            # Create candidate record
-            new_candidate = {
-                'id': candidate_id,
-                'user_id': user_id,
-                'first_name': first_name,
-                'last_name': last_name,
-                'email': email,
-                'major': major,
-                'phone': phone,
-                'gpa': gpa
-            }
-            
-            # Save to database
-            users = load_users()
-            candidates = load_candidates()
-            
-            users.append(new_user)
-            candidates.append(new_candidate)
-            
-            save_users(users)
-            save_candidates(candidates)
+            create_candidate_account(fields['username'], fields['password'],
+                                     {name: fields[name] for name in CANDIDATE_FIELDS})
+            g.unit_of_work.commit()
             
             flash('Registration successful! You can now log in.', 'success')
             return redirect(url_for('login'))
             
+        except ValueError as e:
+            flash(str(e), 'error')
+            return render_template('register.html')
         except Exception as e:
             flash('An error occurred during registration. Please try again.', 'error')
             return render_template('register.html')
@@ -233,14 +212,41 @@ def dashboard():
     else:
         return redirect(url_for('applicant_dashboard'))
 
+# The applicant and job lists render their first LIST_PAGE_SIZE rows; the
+# page then fetches the others from /api/applicants/rows and /api/jobs/rows
+# as they are scrolled into view (see static/virtual_list.js).
+LIST_PAGE_SIZE = 50
+
+def job_list_entries(jobs):
+    """Copies of jobs for the job list, with company name and location, and application counts for admins."""
+    is_admin = session.get('user_type') == 'admin'
+    application_index = get_application_index() if is_admin else None
+    entries = []
+    for job in jobs:
+        entry = job.copy()
+        if is_admin:
+            entry['application_count'] = application_index.count_for_job(job['id'])
+            entry['is_open'] = is_job_open(job)
+        company = get_company_by_id(job.get('company_id'))
+        if company:
+            entry['company_name'] = company['name']
+            entry['company_location'] = company['location']
+        entries.append(entry)
+    return entries
+
 @app.route('/admin')
 @admin_required
+@cached_response('candidates', 'applications', 'jobs', 'companies', per_user=True)
 def admin_dashboard():
-    applicants = get_applicants()
-    return render_template('applicant_list.html', applicants=applicants)
+    applicant_total, applicants = get_applicants_page(limit=LIST_PAGE_SIZE)
+    summary = get_application_summary()
+    analytics = get_analytics_summary()
+    return render_template('applicant_list.html', applicants=applicants, applicant_total=applicant_total,
+                           page_size=LIST_PAGE_SIZE, summary=summary, analytics=analytics)
 
 @app.route('/admin/jobs')
 @admin_required
+@cached_response('jobs', 'companies', 'applications', per_user=True)
 def admin_jobs():
     """Admin view of all job listings with application counts."""
     jobs = load_jobs()
@@ -248,11 +254,12 @@ def admin_jobs():
     
     # Create company lookup dictionary
     company_dict = {company['id']: company for company in companies}
+    application_index = get_application_index()
     
     jobs_with_counts = []
     for job in jobs:
         job_with_count = job.copy()
-        job_with_count['application_count'] = get_application_count(job['id'])
+        job_with_count['application_count'] = application_index.count_for_job(job['id'])
         job_with_count['is_open'] = is_job_open(job)
         # Add company information
         company = company_dict.get(job['company_id'])
@@ -263,60 +270,74 @@ def admin_jobs():
     
     return render_template('admin_jobs.html', jobs=jobs_with_counts)
 
+@app.route('/admin/metrics')
+@admin_required
+def admin_metrics():
+    """Request latency and storage I/O counters in Prometheus text format."""
+    return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
+
 @app.route('/admin/applicant/<int:applicant_id>')
 @admin_required
 def applicant_details(applicant_id):
-    """Show detailed information for a specific applicant."""
-    applicant = get_applicant_by_id(applicant_id)
+    """Show detailed information for a specific applicant; ?archived=1 adds archived applications."""
+    applicant = get_applicant_by_id(applicant_id, include_archived=request.args.get('archived') in ('1', 'true'))
     if not applicant:
         flash('Applicant not found.', 'error')
         return redirect(url_for('admin_dashboard'))
-    return render_template('applicant_details.html', applicant=applicant)
+    return render_template('applicant_details.html', applicant=applicant, statuses=APPLICATION_STATUSES)
+
+@app.route('/admin/applications/status', methods=['POST'])
+@admin_required
+def update_application_statuses_form():
+    """Set the status of the applications ticked on an applicant's page."""
+    applicant_id = request.form.get('applicant_id', type=int)
+    application_ids = request.form.getlist('application_id', type=int)
+    status = request.form.get('status', '')
+    back = url_for('applicant_details', applicant_id=applicant_id) if applicant_id else url_for('admin_dashboard')
+    if not application_ids:
+        flash('Select at least one application.', 'error')
+        return redirect(back)
+
+    results = update_application_statuses([(application_id, status) for application_id in application_ids])
+    failed = [result for result in results if not result['ok']]
+    updated = len(results) - len(failed)
+    if updated:
+        flash(f"{updated} application{'s' if updated != 1 else ''} set to {status}.", 'success')
+    for error in sorted({result['error'] for result in failed}):
+        count = sum(1 for result in failed if result['error'] == error)
+        flash(f"{count} not updated: {error}", 'error')
+    return redirect(back)
 
 @app.route('/jobs')
 @login_required
+@cached_response('jobs', 'companies', 'applications', 'candidates', per_user=True)
 def applicant_dashboard():
     """Applicant dashboard showing job listings."""
-    jobs = load_jobs()
-    companies = load_companies()
+    # Admins see all jobs with application counts; candidates only see jobs
+    # that are currently open for applications. An optional full-text search
+    # is shown in relevance order.
+    query = request.args.get('q', '').strip()
+    job_total, jobs = get_jobs_page(limit=LIST_PAGE_SIZE, open_only=session.get('user_type') != 'admin', query=query)
     
-    # Create company lookup dictionary
-    company_dict = {company['id']: company for company in companies}
+    # Best-matching open jobs for candidates, above the full listing
+    recommended = []
+    candidate = get_candidate_by_user_id(session.get('user_id')) if session.get('user_type') == 'candidate' else None
+    if candidate and not query:
+        for job, score in recommend_jobs(candidate['id']):
+            company = get_company_by_id(job.get('company_id'))
+            recommended.append(dict(job, score=score, company_name=company['name'] if company else None))
     
-    # Filter jobs based on user type
-    if session.get('user_type') == 'admin':
-        # Admin sees all jobs with application counts
-        filtered_jobs = []
-        for job in jobs:
-            job_with_details = job.copy()
-            job_with_details['application_count'] = get_application_count(job['id'])
-            job_with_details['is_open'] = is_job_open(job)
-            # Add company information
-            company = company_dict.get(job['company_id'])
-            if company:
-                job_with_details['company_name'] = company['name']
-                job_with_details['company_location'] = company['location']
-            filtered_jobs.append(job_with_details)
-    else:
-        # Candidates only see jobs that are currently open for applications
-        filtered_jobs = []
-        for job in jobs:
-            if is_job_open(job) and job.get('application_status') == 'open':
-                job_with_details = job.copy()
-                # Add company information
-                company = company_dict.get(job['company_id'])
-                if company:
-                    job_with_details['company_name'] = company['name']
-                    job_with_details['company_location'] = company['location']
-                filtered_jobs.append(job_with_details)
-    
-    return render_template('jobs.html', jobs=filtered_jobs)
+    return render_template('jobs.html', jobs=job_list_entries(jobs), job_total=job_total, page_size=LIST_PAGE_SIZE,
+                           query=query, recommended=recommended)
+
+RANKED_APPLICANTS_SHOWN = 100
 
 @app.route('/job/<int:job_id>')
 @login_required
+@cached_response('jobs', 'companies', 'candidates', 'applications', per_user=True)
 def job_details(job_id):
-    """Show detailed information for a specific job."""
-    job = get_job_by_id(job_id)
+    """Show detailed information for a specific job; admins can also view archived jobs."""
+    job = get_job_by_id(job_id, include_archived=session.get('user_type') == 'admin')
     if not job:
         flash('Job not found.', 'error')
         return redirect(url_for('applicant_dashboard'))
@@ -329,11 +350,15 @@ def job_details(job_id):
         user_id = session.get('user_id')
         candidate = get_candidate_by_user_id(user_id)
         if candidate:
-            applications = load_applications()
-            has_applied = any(app['candidate_id'] == candidate['id'] and app['job_id'] == job_id 
-                            for app in applications)
+            has_applied = get_application_index().has_applied(candidate['id'], job_id)
     
-    return render_template('job_details.html', job=job, has_applied=has_applied, job_is_open=job_is_open)
+    # Admins see the job's best-matching applicants
+    ranked_applicants = None
+    if session.get('user_type') == 'admin' and not job.get('archived'):
+        ranked_applicants = rank_applicants(job_id, limit=RANKED_APPLICANTS_SHOWN)
+    
+    return render_template('job_details.html', job=job, has_applied=has_applied, job_is_open=job_is_open,
+                           ranked_applicants=ranked_applicants)
 
 @app.route('/apply/<int:job_id>', methods=['POST'])
 @login_required
@@ -362,9 +387,7 @@ def apply_to_job(job_id):
         return redirect(url_for('applicant_dashboard'))
     
     # Check if already applied
-    applications = load_applications()
-    if any(app['candidate_id'] == candidate['id'] and app['job_id'] == job_id 
-           for app in applications):
+    if get_application_index().has_applied(candidate['id'], job_id):
         flash('You have already applied to this job.', 'warning')
         return redirect(url_for('job_details', job_id=job_id))
     
@@ -377,28 +400,392 @@ def apply_to_job(job_id):
         'status': 'pending'
     }
     
-    applications.append(new_application)
-    save_applications(applications)
+    # Committed now rather than at the end of the request so that a
+    # duplicate submitted concurrently is reported to the candidate
+    g.unit_of_work.insert('applications', new_application)
+    try:
+        g.unit_of_work.commit()
+    except ValueError as e:
+        flash(str(e), 'warning')
+        return redirect(url_for('job_details', job_id=job_id))
     
     flash('Application submitted successfully!', 'success')
     return redirect(url_for('applicant_dashboard'))
 
 # API route to get all data from the data_store.
 # This is a Controller function that retrieves data from the Model and returns it.
+# API list endpoints are cursor-paginated: results are ordered by ID and the
+# opaque `cursor` returned with one page fetches the next one.
+API_DEFAULT_LIMIT = 50
+API_MAX_LIMIT = 500
+
+def encode_cursor(last_id):
+    """Encode the last ID of a page as an opaque cursor."""
+    return base64.urlsafe_b64encode(json.dumps({'after': last_id}).encode()).decode()
+
+def decode_cursor(cursor):
+    """Decode a cursor back to the last ID of the previous page (None for the first page)."""
+    if not cursor:
+        return None
+    try:
+        return int(json.loads(base64.urlsafe_b64decode(cursor.encode()))['after'])
+    except (ValueError, KeyError, TypeError):
+        raise ValueError('Invalid cursor.')
+
+def parse_page_args():
+    """Read cursor, limit and fields from the query string."""
+    after_id = decode_cursor(request.args.get('cursor'))
+    try:
+        limit = int(request.args.get('limit', API_DEFAULT_LIMIT))
+    except ValueError:
+        raise ValueError('limit must be an integer.')
+    if limit < 1 or limit > API_MAX_LIMIT:
+        raise ValueError(f'limit must be between 1 and {API_MAX_LIMIT}.')
+    fields = [field for field in request.args.get('fields', '').split(',') if field]
+    return after_id, limit, fields
+
+def parse_int_arg(name):
+    """Read an optional integer query parameter."""
+    value = request.args.get(name)
+    if value in (None, ''):
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f'{name} must be an integer.')
+
+def parse_bool_arg(name):
+    """Read an optional true/false (or 1/0) query parameter."""
+    value = request.args.get(name)
+    if value in (None, ''):
+        return None
+    if value.lower() in ('1', 'true'):
+        return True
+    if value.lower() in ('0', 'false'):
+        return False
+    raise ValueError(f'{name} must be true or false.')
+
+def parse_float_arg(name):
+    """Read an optional float query parameter."""
+    value = request.args.get(name)
+    if value in (None, ''):
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        raise ValueError(f'{name} must be a number.')
+
+def parse_date_arg(name):
+    """Read an optional YYYY-MM-DD query parameter, returned as the original string."""
+    value = request.args.get(name)
+    if not value:
+        return None
+    try:
+        datetime.strptime(value, '%Y-%m-%d')
+    except ValueError:
+        raise ValueError(f'{name} must be a date in YYYY-MM-DD format.')
+    return value
+
+def parse_list_args(sorts):
+    """Read sort, offset and limit for the lazily loaded lists; an empty sort means the default order."""
+    sort = request.args.get('sort') or None
+    if sort is not None and sort not in sorts:
+        raise ValueError(f"sort must be one of: {', '.join(sorts)}.")
+    try:
+        offset = int(request.args.get('offset', 0))
+        limit = int(request.args.get('limit', LIST_PAGE_SIZE))
+    except ValueError:
+        raise ValueError('offset and limit must be integers.')
+    if offset < 0:
+        raise ValueError('offset must not be negative.')
+    if limit < 1 or limit > API_MAX_LIMIT:
+        raise ValueError(f'limit must be between 1 and {API_MAX_LIMIT}.')
+    return sort, offset, limit
+
+def paginated_response(records, limit, fields):
+    """Return one page of records, as a JSON body or streamed when stream=1.
+
+    ``records`` is an iterator in ID order that already skips past the cursor
+    and applies filters; only ``limit + 1`` items are ever pulled from it.
+    """
+    def project(record):
+        return {field: record[field] for field in fields if field in record} if fields else record
+
+    def generate():
+        yield '{"items": ['
+        last_id = None
+        for count, record in enumerate(records):
+            if count == limit:
+                break
+            yield (',' if count else '') + json.dumps(project(record))
+            last_id = record['id']
+        else:
+            last_id = None  # ran out of records: this was the last page
+        yield '], "next_cursor": ' + json.dumps(encode_cursor(last_id) if last_id is not None else None) + '}'
+
+    if request.args.get('stream') in ('1', 'true'):
+        return Response(stream_with_context(generate()), mimetype='application/json')
+    return Response(''.join(generate()), mimetype='application/json')
+
+def api_error(message):
+    """JSON error response for invalid API parameters."""
+    return jsonify({'error': message}), 400
+
 # API routes for jobs
 @app.route('/api/jobs', methods=['GET'])
 @login_required
+@cached_response('jobs')
 def get_jobs():
-    """API endpoint to get all job listings."""
-    jobs = load_jobs()
-    return jsonify(jobs)
+    """API endpoint to list job listings.
+
+    Filters: company (ID), open (true/false), deadline_from, deadline_to (YYYY-MM-DD).
+    """
+    try:
+        after_id, limit, fields = parse_page_args()
+        company_id = parse_int_arg('company')
+        open_filter = parse_bool_arg('open')
+        deadline_from = parse_date_arg('deadline_from')
+        deadline_to = parse_date_arg('deadline_to')
+    except ValueError as e:
+        return api_error(str(e))
+
+    def matches(job):
+        if company_id is not None and job.get('company_id') != company_id:
+            return False
+        if open_filter is not None:
+            job_open = is_job_open(job) and job.get('application_status') == 'open'
+            if job_open != open_filter:
+                return False
+        deadline = job.get('application_deadline') or ''
+        if deadline_from and deadline < deadline_from:
+            return False
+        if deadline_to and deadline > deadline_to:
+            return False
+        return True
+
+    jobs = (job for job in iter_collection('jobs', after_id) if matches(job))
+    return paginated_response(jobs, limit, fields)
+
+@app.route('/api/jobs/search', methods=['GET'])
+@login_required
+@cached_response('jobs', 'companies')
+def search_jobs_api():
+    """API endpoint for ranked full-text job search.
+
+    Candidates only get jobs that are currently open for applications.
+    """
+    query = request.args.get('q', '').strip()
+    try:
+        limit = parse_int_arg('limit')
+    except ValueError as e:
+        return api_error(str(e))
+    if limit is None:
+        limit = 20
+    if not query:
+        return api_error('q is required.')
+    if limit < 1 or limit > API_MAX_LIMIT:
+        return api_error(f'limit must be between 1 and {API_MAX_LIMIT}.')
+    
+    job_ids = None
+    if session.get('user_type') != 'admin':
+        job_ids = {job['id'] for job in get_open_jobs()}
+    
+    results = []
+    for job_id, score in search_jobs(query, limit=limit, job_ids=job_ids):
+        job = get_job_by_id(job_id)
+        job['score'] = round(score, 4)
+        results.append(job)
+    return jsonify({'query': query, 'items': results})
 
 @app.route('/api/applicants', methods=['GET'])
 @admin_required
+@cached_response('candidates', 'applications')
 def get_applicants_api():
-    """API endpoint to get all applicants (admin only)."""
-    applicants = get_applicants()
-    return jsonify(applicants)
+    """API endpoint to list applicants (admin only).
+
+    Filters: major, gpa_min, gpa_max, status (of any of their applications).
+    """
+    try:
+        after_id, limit, fields = parse_page_args()
+        gpa_min = parse_float_arg('gpa_min')
+        gpa_max = parse_float_arg('gpa_max')
+    except ValueError as e:
+        return api_error(str(e))
+    major = request.args.get('major', '').lower()
+    status = request.args.get('status')
+    application_index = get_application_index()
+
+    def matches(applicant):
+        if major and (applicant['major'] or '').lower() != major:
+            return False
+        if gpa_min is not None or gpa_max is not None:
+            try:
+                gpa = float(applicant['gpa'])
+            except (TypeError, ValueError):
+                return False
+            if (gpa_min is not None and gpa < gpa_min) or (gpa_max is not None and gpa > gpa_max):
+                return False
+        if status and not any(app['status'] == status
+                              for app in application_index.for_candidate(applicant['id'])):
+            return False
+        return True
+
+    applicants = (applicant for applicant in iter_applicants(after_id) if matches(applicant))
+    return paginated_response(applicants, limit, fields)
+
+@app.route('/api/applicants/rows', methods=['GET'])
+@admin_required
+@cached_response('candidates', 'applications')
+def get_applicant_rows_api():
+    """Rows of the admin applicant list by offset, for scrolling through it (admin only).
+
+    Parameters: sort (name, date or major), offset, limit.
+    """
+    try:
+        sort, offset, limit = parse_list_args(APPLICANT_SORTS)
+    except ValueError as e:
+        return api_error(str(e))
+    total, applicants = get_applicants_page(sort, offset, limit)
+    return jsonify({'total': total, 'offset': offset, 'items': applicants})
+
+@app.route('/api/jobs/rows', methods=['GET'])
+@login_required
+@cached_response('jobs', 'companies', 'applications')
+def get_job_rows_api():
+    """Rows of the job list by offset, for scrolling through it.
+
+    Parameters: q (search), sort (title, company or deadline; relevance order
+    when empty and q is given), offset, limit. Candidates only get open jobs.
+    """
+    try:
+        sort, offset, limit = parse_list_args(JOB_SORTS)
+    except ValueError as e:
+        return api_error(str(e))
+    query = request.args.get('q', '').strip()
+    total, jobs = get_jobs_page(sort, offset, limit, open_only=session.get('user_type') != 'admin', query=query)
+    return jsonify({'total': total, 'offset': offset, 'items': job_list_entries(jobs)})
+
+@app.route('/api/analytics', methods=['GET'])
+@admin_required
+@cached_response('applications', 'jobs', 'candidates', 'companies')
+def get_analytics_api():
+    """API endpoint with application counts per job, company, major, status and day (admin only)."""
+    return jsonify(get_analytics_summary())
+
+@app.route('/api/applications/export', methods=['GET'])
+@admin_required
+def export_applications_api():
+    """Stream applications joined with candidate, job and company details (admin only).
+
+    Parameters: format (csv or ndjson), job, company, status, date_from, date_to (YYYY-MM-DD).
+    """
+    fmt = request.args.get('format', 'csv')
+    status = request.args.get('status') or None
+    try:
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"format must be one of: {', '.join(EXPORT_FORMATS)}.")
+        if status is not None and status not in APPLICATION_STATUSES:
+            raise ValueError(f"status must be one of: {', '.join(APPLICATION_STATUSES)}.")
+        filters = {
+            'job_id': parse_int_arg('job'),
+            'company_id': parse_int_arg('company'),
+            'status': status,
+            'date_from': parse_date_arg('date_from'),
+            'date_to': parse_date_arg('date_to'),
+        }
+    except ValueError as e:
+        return api_error(str(e))
+    filename = f"applications-{datetime.now().strftime('%Y%m%d')}.{fmt}"
+    return Response(stream_with_context(export_applications(fmt, **filters)), mimetype=EXPORT_MIMETYPES[fmt],
+                    headers={'Content-Disposition': f'attachment; filename={filename}'})
+
+API_MAX_BATCH = 5000
+
+@app.route('/api/applications/status', methods=['POST'])
+@admin_required
+def api_update_application_statuses():
+    """Apply a batch of status changes in one transaction: {"updates": [{"id": ..., "status": ...}, ...]}.
+
+    Responds with a result per update, in order; updates that fail
+    validation are reported and skipped without affecting the others.
+    """
+    payload = request.get_json(silent=True)
+    updates = payload.get('updates') if isinstance(payload, dict) else None
+    if not isinstance(updates, list) or not updates:
+        return api_error('Expected a JSON body with a non-empty "updates" list.')
+    if len(updates) > API_MAX_BATCH:
+        return api_error(f'At most {API_MAX_BATCH} updates can be sent at once.')
+    pairs = [(update.get('id'), update.get('status')) if isinstance(update, dict) else (None, None)
+             for update in updates]
+    results = update_application_statuses(pairs)
+    return jsonify({'updated': sum(1 for result in results if result['ok']), 'results': results})
+
+# Maintenance commands, run with `flask --app app <command>`
+@app.cli.command('compact-applications')
+def compact_applications_command():
+    """Fold the applications journal back into applications.json."""
+    compact_applications()
+    print(f"Compacted {len(load_applications())} applications.")
+
+@app.cli.command('migrate-to-sqlite')
+def migrate_to_sqlite_command():
+    """Copy the JSON data files into the SQLite database (SQLITE_FILE)."""
+    counts = migrate_json_to_sqlite()
+    for name, count in counts.items():
+        print(f"{name}: {count} records")
+    print("Set STORAGE_BACKEND=sqlite to use the database.")
+
+@app.cli.command('build-snapshot')
+def build_snapshot_command():
+    """Compile the JSON data files into a memory-mapped snapshot (SNAPSHOT_FILE)."""
+    counts = build_snapshot()
+    for name, count in counts.items():
+        print(f"{name}: {count} records")
+    print("Rebuild the snapshot after bulk changes; collections changed since are read from JSON.")
+
+@app.cli.command('archive-jobs')
+@click.option('--horizon-days', default=ARCHIVE_HORIZON_DAYS, show_default=True,
+              help='Archive jobs whose application deadline passed more than this many days ago.')
+def archive_jobs_command(horizon_days):
+    """Move long-closed jobs and their applications into monthly archive partitions (ARCHIVE_DIR)."""
+    result = archive_closed_jobs(horizon_days)
+    print(f"Archived {result['jobs']} jobs and {result['applications']} applications"
+          f" into {len(result['partitions'])} partitions.")
+    for key, counts in sorted(get_archive_stats().items()):
+        print(f"{key}: {counts['jobs']} jobs, {counts['applications']} applications")
+
+@app.cli.command('import-data')
+@click.argument('collection', type=click.Choice(sorted(IMPORTERS)))
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--format', 'fmt', type=click.Choice(['csv', 'jsonl']),
+              help='Input format (default: from the file extension).')
+@click.option('--batch-size', default=IMPORT_BATCH_SIZE, show_default=True,
+              help='Rows committed per transaction.')
+@click.option('--rejects', type=click.File('w'), help='Write rejected rows and their errors to this JSONL file.')
+def import_data_command(collection, path, fmt, batch_size, rejects):
+    """Bulk import jobs, candidates or applications from a CSV or JSONL file."""
+    report = import_file(collection, path, fmt=fmt, batch_size=batch_size, rejects_file=rejects,
+                         progress=lambda r: print(f"  {r.imported} imported, {r.rejected} rejected..."))
+    print(report.summary())
+    for line, errors in report.errors:
+        print(f"  line {line}: {' '.join(errors)}")
+    if report.rejected > len(report.errors):
+        print(f"  ... and {report.rejected - len(report.errors)} more rejected rows.")
+
+@app.cli.command('export-applications')
+@click.option('--format', 'fmt', type=click.Choice(EXPORT_FORMATS), default='csv', show_default=True)
+@click.option('--job', 'job_id', type=int, help='Only applications to this job ID.')
+@click.option('--company', 'company_id', type=int, help='Only applications to jobs of this company ID.')
+@click.option('--status', type=click.Choice(APPLICATION_STATUSES))
+@click.option('--from', 'date_from', type=click.DateTime(['%Y-%m-%d']), help='Applied on or after (YYYY-MM-DD).')
+@click.option('--to', 'date_to', type=click.DateTime(['%Y-%m-%d']), help='Applied on or before (YYYY-MM-DD).')
+@click.option('--output', type=click.File('w'), default='-', help='Output file (default: standard output).')
+def export_applications_command(fmt, job_id, company_id, status, date_from, date_to, output):
+    """Export applications with candidate, job and company details as CSV or NDJSON."""
+    for chunk in export_applications(fmt, job_id=job_id, company_id=company_id, status=status,
+                                     date_from=date_from and date_from.strftime('%Y-%m-%d'),
+                                     date_to=date_to and date_to.strftime('%Y-%m-%d')):
+        output.write(chunk)
 
 if __name__ == '__main__':
     # You can change the port and debug settings as needed
@@ -0,0 +1,150 @@
+# archive.py
+"""Partition files holding archived jobs and their applications.
+
+Each partition is one JSON file per month of the jobs' application deadlines
+(``<directory>/YYYY-MM.json``, with ``jobs`` and ``applications`` lists).
+``index.json`` records the partition of every archived job and the
+partitions holding each candidate's applications, so a lookup reads the
+index plus the partitions it names and nothing else.
+"""
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+from records import json_default
+
+MANIFEST_FILE = 'index.json'
+
+# Parsed partitions kept in memory, least recently used dropped first
+ARCHIVE_CACHED_PARTITIONS = int(os.environ.get('ARCHIVE_CACHED_PARTITIONS', 12))
+
+
+def partition_key(deadline):
+    """The partition of a job whose application deadline is the given date."""
+    return deadline.strftime('%Y-%m')
+
+
+def _empty_manifest():
+    return {'partitions': {}, 'jobs': {}, 'candidates': {}, 'max_ids': {}}
+
+
+def _write_json_atomic(path, data):
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f, default=json_default)
+            f.flush()
+            os.fsync(f.fileno())
+        now = time.time_ns()
+        os.utime(tmp_path, ns=(now, now))  # so every rewrite changes the file signature
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class Partition:
+    """The jobs and applications of one partition, indexed by job and candidate."""
+
+    def __init__(self, data):
+        self.jobs = data.get('jobs', [])
+        self.applications = data.get('applications', [])
+        self.jobs_by_id = {job['id']: job for job in self.jobs}
+        self.by_candidate = {}
+        for app in self.applications:
+            self.by_candidate.setdefault(app['candidate_id'], []).append(app)
+
+
+class Archive:
+    """Lazily read archive of jobs and applications in ``directory``.
+
+    Nothing is read until a lookup needs it. The index and the partitions
+    are parsed on first use and reused while their files are unchanged;
+    at most ARCHIVE_CACHED_PARTITIONS partitions are kept at a time.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self._files = OrderedDict()  # file name -> (signature, parsed)
+        self._lock = threading.Lock()
+
+    def _read(self, name, parse, default):
+        path = os.path.join(self.directory, name)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return default
+        signature = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._files.get(name)
+            if cached is not None and cached[0] == signature:
+                self._files.move_to_end(name)
+                return cached[1]
+        with open(path) as f:
+            parsed = parse(json.load(f))
+        with self._lock:
+            self._files[name] = (signature, parsed)
+            partitions = [key for key in self._files if key != MANIFEST_FILE]
+            for key in partitions[:max(0, len(partitions) - ARCHIVE_CACHED_PARTITIONS)]:
+                del self._files[key]
+        return parsed
+
+    def manifest(self):
+        """The archive index: partitions with their record counts, job -> partition, candidate -> partitions."""
+        return self._read(MANIFEST_FILE, lambda data: data, _empty_manifest())
+
+    def partition(self, key):
+        return self._read(f'{key}.json', Partition, Partition({}))
+
+    def get_job(self, job_id):
+        """The archived job with this ID, or None."""
+        key = self.manifest()['jobs'].get(str(job_id))
+        return self.partition(key).jobs_by_id.get(job_id) if key else None
+
+    def applications_for_candidate(self, candidate_id):
+        """A candidate's archived applications, as (application, job) pairs."""
+        pairs = []
+        for key in self.manifest()['candidates'].get(str(candidate_id), ()):
+            partition = self.partition(key)
+            pairs.extend((app, partition.jobs_by_id.get(app['job_id']))
+                         for app in partition.by_candidate.get(candidate_id, ()))
+        return pairs
+
+    def max_id(self, name):
+        """Highest ID ever archived from a collection, or None."""
+        return self.manifest()['max_ids'].get(name)
+
+    def add(self, jobs, applications):
+        """Merge {partition: [records]} of jobs and applications into the archive.
+
+        Partitions are written before the index. Records already in a
+        partition are replaced by ID, so an interrupted run can simply be
+        repeated.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        manifest = json.loads(json.dumps(self.manifest()))
+        for key in sorted(set(jobs) | set(applications)):
+            partition = self.partition(key)
+            merged = {}
+            for name, records in (('jobs', jobs.get(key, ())), ('applications', applications.get(key, ()))):
+                by_id = {record['id']: record for record in getattr(partition, name)}
+                by_id.update((record['id'], record) for record in records)
+                merged[name] = list(by_id.values())
+                if merged[name]:
+                    manifest['max_ids'][name] = max([manifest['max_ids'].get(name) or 0] + list(by_id))
+            _write_json_atomic(os.path.join(self.directory, f'{key}.json'), merged)
+            manifest['partitions'][key] = {name: len(records) for name, records in merged.items()}
+            for job in merged['jobs']:
+                manifest['jobs'][str(job['id'])] = key
+            for app in merged['applications']:
+                keys = manifest['candidates'].setdefault(str(app['candidate_id']), [])
+                if key not in keys:
+                    keys.append(key)
+        _write_json_atomic(os.path.join(self.directory, MANIFEST_FILE), manifest)
@@ -0,0 +1,305 @@
+# benchmark.py
+"""Time the model functions and Flask routes against generated datasets.
+
+Each scale gets a fresh dataset from generate_data.py in a temporary
+directory, so it is safe to run from a working checkout:
+
+    python benchmark.py --scales 1000 10000 100000
+
+Every benchmark is timed once with all caches dropped (cold) and then as
+the median of --repeat further runs (warm). Results, and the growth of each
+timing between consecutive scales, are written to bench_output.txt.
+"""
+import argparse
+import itertools
+import math
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, HERE)
+
+import model  # noqa: E402
+from app import app  # noqa: E402
+from generate_data import generate, write_dataset  # noqa: E402
+from response_cache import response_cache  # noqa: E402
+from sqlite_store import SQLiteStore  # noqa: E402
+
+# Timings that grow faster than n ** SUPERLINEAR_EXPONENT between two
+# scales are flagged; very fast ones are too noisy to judge.
+SUPERLINEAR_EXPONENT = 1.3
+MIN_FLAGGED_MS = 1.0
+
+
+class Context:
+    """Sample records from the dataset that the benchmarks query for."""
+
+    def __init__(self, collections):
+        candidates = collections['candidates']
+        jobs = collections['jobs']
+        self.candidate = candidates[len(candidates) // 2]
+        self.user = next(user for user in collections['users'] if user['id'] == self.candidate['user_id'])
+        self.job = jobs[0]  # the most popular job
+        today = date.today().strftime('%Y-%m-%d')
+        self.open_job_ids = [job['id'] for job in jobs if job['application_deadline'] >= today]
+        self.company_id = self.job['company_id']
+        self.application = collections['applications'][len(collections['applications']) // 2]
+        self._fresh = itertools.count(1)
+
+    def fresh(self):
+        """A number not used by any earlier write benchmark."""
+        return next(self._fresh)
+
+
+def _consume(iterable):
+    for _ in iterable:
+        pass
+
+
+def _append_application(ctx):
+    model.append_application({
+        'id': model.generate_id(4),
+        'job_id': ctx.job['id'],
+        'candidate_id': ctx.candidate['id'],
+        'application_date': '2025-10-01',
+        'status': 'pending'
+    })
+
+
+def _create_candidate_account(ctx):
+    n = ctx.fresh()
+    model.create_candidate_account(f'bench_{n}', 'password123', {
+        'first_name': 'Bench', 'last_name': str(n), 'email': f'bench_{n}@example.edu',
+        'major': 'Computer Science', 'phone': '', 'gpa': '3.0'
+    })
+
+
+# (name, function of the context); read-only benchmarks first
+MODEL_BENCHMARKS = [
+    ('load_users', lambda ctx: model.load_users()),
+    ('load_candidates', lambda ctx: model.load_candidates()),
+    ('load_jobs', lambda ctx: model.load_jobs()),
+    ('load_companies', lambda ctx: model.load_companies()),
+    ('load_applications', lambda ctx: model.load_applications()),
+    ('iter_collection', lambda ctx: _consume(model.iter_collection('candidates', after_id=ctx.candidate['id']))),
+    ('authenticate_user', lambda ctx: model.authenticate_user(ctx.user['username'], ctx.user['password'])),
+    ('find_user_by_username', lambda ctx: model.find_user_by_username(ctx.user['username'])),
+    ('find_candidate_by_email', lambda ctx: model.find_candidate_by_email(ctx.candidate['email'])),
+    ('get_company_by_id', lambda ctx: model.get_company_by_id(ctx.company_id)),
+    ('get_candidate_by_id', lambda ctx: model.get_candidate_by_id(ctx.candidate['id'])),
+    ('get_candidate_by_user_id', lambda ctx: model.get_candidate_by_user_id(ctx.user['id'])),
+    ('get_user_by_candidate_id', lambda ctx: model.get_user_by_candidate_id(ctx.candidate['id'])),
+    ('get_job_by_id', lambda ctx: model.get_job_by_id(ctx.job['id'])),
+    ('get_application_index', lambda ctx: model.get_application_index().count_for_job(ctx.job['id'])),
+    ('get_application_groups', lambda ctx: model.get_application_groups('candidate_id')),
+    ('get_application_summary', lambda ctx: model.get_application_summary()),
+    ('get_applications_with_details', lambda ctx: model.get_applications_with_details()),
+    ('get_applicants', lambda ctx: model.get_applicants()),
+    ('get_applicant_by_id', lambda ctx: model.get_applicant_by_id(ctx.candidate['id'])),
+    ('get_open_jobs', lambda ctx: model.get_open_jobs()),
+    ('search_jobs', lambda ctx: model.search_jobs('python engineer')),
+    ('append_application', _append_application),
+    ('update_application_status', lambda ctx: model.update_application_status(
+        ctx.application['id'], ('approved', 'rejected')[ctx.fresh() % 2])),
+    ('compact_applications', lambda ctx: model.compact_applications()),
+    ('create_candidate_account', _create_candidate_account),
+    ('save_jobs', lambda ctx: model.save_jobs(model.load_jobs())),
+]
+
+def _registration(ctx):
+    n = ctx.fresh()
+    return {'username': f'bench_route_{n}', 'password': 'password123', 'confirm_password': 'password123',
+            'first_name': 'Bench', 'last_name': str(n), 'email': f'bench_route_{n}@example.edu',
+            'major': 'Computer Science', 'phone': '555-0100', 'gpa': '3.0'}
+
+
+def _status_change(ctx):
+    """Alternately approve the sample application and move it back to pending."""
+    return ('pending', 'approved')[ctx.fresh() % 2]
+
+
+# (name, role, method, URL as a function of the context, form data as a function
+# of the context or None). Every route of the app is covered; run_scale()
+# reports any that is not.
+ROUTE_BENCHMARKS = [
+    ('GET /', 'candidate', 'GET', lambda ctx: '/', None),
+    ('GET /login', None, 'GET', lambda ctx: '/login', None),
+    ('POST /login', None, 'POST', lambda ctx: '/login',
+     lambda ctx: {'username': ctx.user['username'], 'password': ctx.user['password']}),
+    ('GET /register', None, 'GET', lambda ctx: '/register', None),
+    ('POST /register', None, 'POST', lambda ctx: '/register', _registration),
+    ('GET /logout', None, 'GET', lambda ctx: '/logout', None),
+    ('GET /dashboard', 'candidate', 'GET', lambda ctx: '/dashboard', None),
+    ('GET /admin', 'admin', 'GET', lambda ctx: '/admin', None),
+    ('GET /admin/jobs', 'admin', 'GET', lambda ctx: '/admin/jobs', None),
+    ('GET /admin/metrics', 'admin', 'GET', lambda ctx: '/admin/metrics', None),
+    ('GET /admin/applicant/<id>', 'admin', 'GET', lambda ctx: f"/admin/applicant/{ctx.candidate['id']}", None),
+    ('POST /admin/applications/status', 'admin', 'POST', lambda ctx: '/admin/applications/status',
+     lambda ctx: {'applicant_id': ctx.application['candidate_id'], 'application_id': ctx.application['id'],
+                  'status': _status_change(ctx)}),
+    ('GET /jobs (admin)', 'admin', 'GET', lambda ctx: '/jobs', None),
+    ('GET /jobs (candidate)', 'candidate', 'GET', lambda ctx: '/jobs', None),
+    ('GET /jobs?q=', 'candidate', 'GET', lambda ctx: '/jobs?q=python+engineer', None),
+    ('GET /job/<id>', 'candidate', 'GET', lambda ctx: f"/job/{ctx.job['id']}", None),
+    ('GET /api/jobs', 'admin', 'GET', lambda ctx: '/api/jobs?limit=100', None),
+    ('GET /api/jobs/search', 'candidate', 'GET', lambda ctx: '/api/jobs/search?q=python', None),
+    ('GET /api/jobs/rows', 'candidate', 'GET', lambda ctx: '/api/jobs/rows?sort=deadline&offset=100', None),
+    ('GET /api/applicants', 'admin', 'GET', lambda ctx: '/api/applicants?limit=100&gpa_min=3.5', None),
+    ('GET /api/applicants/rows', 'admin', 'GET', lambda ctx: '/api/applicants/rows?sort=name&offset=100', None),
+    ('GET /api/analytics', 'admin', 'GET', lambda ctx: '/api/analytics', None),
+    ('GET /api/applications/export', 'admin', 'GET',
+     lambda ctx: f"/api/applications/export?format=csv&company={ctx.company_id}", None),
+    ('POST /api/applications/status', 'admin', 'POST', lambda ctx: '/api/applications/status', None),
+    ('POST /apply/<id>', 'candidate', 'POST',
+     lambda ctx: f"/apply/{ctx.open_job_ids[ctx.fresh() % len(ctx.open_job_ids)]}", None),
+]
+
+
+def unbenchmarked_routes(ctx):
+    """The app's (rule, method) pairs that no entry of ROUTE_BENCHMARKS requests."""
+    adapter = app.url_map.bind('localhost')
+    covered = {adapter.match(url(ctx).split('?')[0], method)[0] for _, _, method, url, _ in ROUTE_BENCHMARKS}
+    return sorted((rule.rule, method) for rule in app.url_map.iter_rules()
+                  for method in rule.methods - {'HEAD', 'OPTIONS'}
+                  if rule.endpoint not in covered and rule.endpoint != 'static')
+
+
+def drop_caches():
+    """Forget every cached collection, derived view and rendered response."""
+    model.invalidate_cache()
+    model._derived.clear()
+    response_cache.clear()
+
+
+def measure(fn, repeat):
+    """Return (cold_ms, warm_ms) for a zero-argument callable."""
+    drop_caches()
+    started = time.perf_counter()
+    fn()
+    cold = (time.perf_counter() - started) * 1000
+    warm = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        warm.append((time.perf_counter() - started) * 1000)
+    return cold, statistics.median(warm)
+
+
+def login(client, username, password):
+    client.post('/login', data={'username': username, 'password': password})
+    client.get('/admin/jobs' if username == 'admin' else '/jobs')  # consume the welcome flash
+
+
+def run_scale(users, repeat, seed):
+    """Generate a dataset of ``users`` users and return ({benchmark: (cold, warm)}, counts)."""
+    workdir = tempfile.mkdtemp(prefix=f'bench-{users}-')
+    previous, store = os.getcwd(), model._store
+    try:
+        collections = generate(users, seed=seed)
+        write_dataset(collections, workdir)
+        counts = {name: len(records) for name, records in collections.items()}
+        ctx = Context(collections)
+        del collections
+        os.chdir(workdir)
+        drop_caches()
+        # ID blocks reserved against the previous dataset's sequences would
+        # collide with this dataset's records
+        model._id_blocks.clear()
+        if model._store is not None:
+            # Benchmark a scratch database, never the configured one
+            model._store = SQLiteStore(os.path.join(workdir, 'jobfair.db'))
+            model.migrate_json_to_sqlite(model._store.path)
+
+        results = {}
+        for name, fn in MODEL_BENCHMARKS:
+            results[f'model.{name}'] = measure(lambda: fn(ctx), repeat)
+
+        app.config['TESTING'] = True
+        clients = {None: app.test_client(), 'admin': app.test_client(), 'candidate': app.test_client()}
+        login(clients['admin'], 'admin', 'admin123')
+        login(clients['candidate'], ctx.user['username'], ctx.user['password'])
+        for name, role, method, url, data in ROUTE_BENCHMARKS:
+            client = clients[role]
+            if name == 'POST /api/applications/status':
+                request = lambda: client.post(url(ctx), json={'updates': [
+                    {'id': ctx.application['id'], 'status': _status_change(ctx)}]}).get_data()
+            else:
+                request = lambda: client.open(url(ctx), method=method, data=data and data(ctx)).get_data()
+            results[f'route {name}'] = measure(request, repeat)
+        for rule, method in unbenchmarked_routes(ctx):
+            print(f'Warning: {method} {rule} is not benchmarked.')
+        return results, counts
+    finally:
+        model._store = store
+        os.chdir(previous)
+        model.invalidate_cache()
+        model._id_blocks.clear()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def format_report(runs, repeat):
+    """Render the per-scale tables and the scaling summary as text."""
+    names = list(runs[0][2])
+    width = max(len(name) for name in names) + 2
+    lines = [f'Backend: {model.STORAGE_BACKEND}; warm = median of {repeat} runs; times in ms.', '']
+    for users, counts, results in runs:
+        lines.append(f"== {users} users: " + ', '.join(f'{count} {name}' for name, count in counts.items()))
+        lines.append(f"{'benchmark':<{width}}{'cold':>12}{'warm':>12}")
+        for name in names:
+            cold, warm = results[name]
+            lines.append(f'{name:<{width}}{cold:>12.3f}{warm:>12.3f}')
+        lines.append('')
+
+    if len(runs) > 1:
+        lines.append(f'== Scaling: exponent k in t ~ n^k between consecutive scales '
+                     f'(! marks k > {SUPERLINEAR_EXPONENT} on a timing over {MIN_FLAGGED_MS} ms)')
+        header = ''.join(f'{f"{a[0]}->{b[0]}":>16}' for a, b in zip(runs, runs[1:]))
+        lines.append(f"{'benchmark (cold / warm)':<{width}}{header}")
+        flagged = []
+        for name in names:
+            cells = []
+            for (n_a, _, results_a), (n_b, _, results_b) in zip(runs, runs[1:]):
+                exponents = []
+                for column in (0, 1):
+                    t_a, t_b = results_a[name][column], results_b[name][column]
+                    k = math.log(max(t_b, 1e-6) / max(t_a, 1e-6)) / math.log(n_b / n_a)
+                    mark = '!' if k > SUPERLINEAR_EXPONENT and t_b > MIN_FLAGGED_MS else ' '
+                    if mark == '!':
+                        flagged.append(f'{name} ({("cold", "warm")[column]}, {n_a}->{n_b})')
+                    exponents.append(f'{k:5.2f}{mark}')
+                cells.append(f"{' / '.join(exponents):>16}")
+            lines.append(f"{name:<{width}}{''.join(cells)}")
+        lines.append('')
+        lines.append('Superlinear: ' + (', '.join(flagged) if flagged else 'none'))
+    return '\n'.join(lines) + '\n'
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scales', type=int, nargs='+', default=[1000, 10000],
+                        help='dataset sizes in users (up to 1000000)')
+    parser.add_argument('--repeat', type=int, default=5, help='warm runs per benchmark')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default=os.path.join(HERE, 'bench_output.txt'))
+    args = parser.parse_args()
+
+    runs = []
+    for users in sorted(args.scales):
+        started = time.perf_counter()
+        results, counts = run_scale(users, args.repeat, args.seed)
+        runs.append((users, counts, results))
+        print(f'{users} users: {len(results)} benchmarks in {time.perf_counter() - started:.1f}s')
+
+    report = format_report(runs, args.repeat)
+    with open(args.output, 'w') as f:
+        f.write(report)
+    print(f'Results written to {args.output}.')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,269 @@
+# bulk_import.py
+"""Streaming bulk import of jobs, candidates and applications.
+
+Rows are read one at a time from CSV or JSONL, validated with the same rules
+as the web forms, and committed in batches: each batch is one transaction
+with a single write per collection and one ID reservation per prefix. Only
+the current batch is held in memory, so file size is not a concern.
+"""
+import csv
+import json
+import time
+from datetime import datetime
+
+from model import (transaction, reserve_ids, find_user_by_username, find_candidate_by_email, get_application_index,
+                   get_candidate_by_id, get_company_by_id, get_job_by_id, APPLICATION_STATUSES)
+from validation import validate_registration
+
+IMPORT_BATCH_SIZE = 5000
+JOB_STATUSES = ('open', 'closed')
+MAX_REPORTED_ERRORS = 20
+# Row fields whose values are not written to the rejects file
+REDACTED_FIELDS = ('password', 'confirm_password')
+REDACTED = '[redacted]'
+
+
+def read_rows(path, fmt=None):
+    """Yield (line_number, row) from a CSV or JSONL file; row is None for an unreadable line."""
+    fmt = fmt or ('csv' if path.lower().endswith('.csv') else 'jsonl')
+    with open(path, newline='') as f:
+        if fmt == 'csv':
+            reader = csv.DictReader(f)
+            for row in reader:
+                yield reader.line_num, row
+        else:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError:
+                    row = None
+                yield line_number, row if isinstance(row, dict) else None
+
+
+def _text(row, field):
+    value = row.get(field)
+    return '' if value is None else str(value).strip()
+
+
+def _valid_date(value):
+    try:
+        datetime.strptime(value, '%Y-%m-%d')
+        return True
+    except ValueError:
+        return False
+
+
+class ImportReport:
+    """Counts, timing and rejected rows for one import run.
+
+    Rejects are held until flush(), which reports them in line order: a
+    batch's rows can be rejected when checked or later when committed.
+    """
+
+    def __init__(self, rejects_file=None):
+        self.read = 0
+        self.imported = 0
+        self.rejected = 0
+        self.errors = []  # first MAX_REPORTED_ERRORS (line, messages)
+        self.rejects_file = rejects_file
+        self.started = time.perf_counter()
+        self._pending = []
+
+    def reject(self, line, messages, row):
+        self.rejected += 1
+        if row is not None:
+            row = {key: REDACTED if key in REDACTED_FIELDS else value for key, value in row.items()}
+        self._pending.append((line, messages, row))
+
+    def flush(self):
+        """Report the rejects held so far, in line order."""
+        self._pending.sort(key=lambda reject: reject[0])
+        for line, messages, row in self._pending:
+            if len(self.errors) < MAX_REPORTED_ERRORS:
+                self.errors.append((line, messages))
+            if self.rejects_file:
+                self.rejects_file.write(json.dumps({'line': line, 'errors': messages, 'row': row}) + '\n')
+        self._pending = []
+
+    @property
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+    def summary(self):
+        rate = self.read / self.elapsed if self.elapsed else 0.0
+        return (f"Read {self.read} rows: {self.imported} imported, {self.rejected} rejected "
+                f"in {self.elapsed:.2f}s ({rate:.0f} rows/s).")
+
+
+# -- per-collection row checks (no lookups) and batch commits (under the lock) --
+
+def _check_candidate(row):
+    fields = {name: _text(row, name) for name in ('username', 'password', 'first_name', 'last_name',
+                                                  'email', 'major', 'phone', 'gpa')}
+    fields['confirm_password'] = fields['password']
+    return fields, validate_registration(fields, check_uniqueness=False)
+
+
+def _commit_candidates(batch, report):
+    with transaction('users', 'candidates') as tx:
+        accepted = []
+        usernames, emails = set(), set()
+        for line, fields in batch:
+            username, email = fields['username'].casefold(), fields['email'].casefold()
+            errors = []
+            if username in usernames or find_user_by_username(fields['username']):
+                errors.append('Username already exists. Please choose a different one.')
+            if email in emails or find_candidate_by_email(fields['email']):
+                errors.append('Email already registered. Please use a different email.')
+            if errors:
+                report.reject(line, errors, fields)
+                continue
+            usernames.add(username)
+            emails.add(email)
+            accepted.append(fields)
+
+        user_ids = reserve_ids(1, len(accepted))
+        candidate_ids = reserve_ids(2, len(accepted))
+        for fields, user_id, candidate_id in zip(accepted, user_ids, candidate_ids):
+            tx['users'].append({
+                'id': user_id,
+                'username': fields['username'],
+                'password': fields['password'],  # In production, this should be hashed
+                'user_type': 'candidate',
+                'candidate_id': candidate_id
+            })
+            tx['candidates'].append({
+                'id': candidate_id,
+                'user_id': user_id,
+                'first_name': fields['first_name'],
+                'last_name': fields['last_name'],
+                'email': fields['email'],
+                'major': fields['major'],
+                'phone': fields['phone'],
+                'gpa': fields['gpa']
+            })
+    report.imported += len(accepted)
+
+
+def _check_job(row):
+    requirements = row.get('requirements') or []
+    if isinstance(requirements, str):
+        requirements = [item.strip() for item in requirements.split(';') if item.strip()]
+    job = {
+        'title': _text(row, 'title'),
+        'company_id': _text(row, 'company_id'),
+        'description': _text(row, 'description'),
+        'requirements': requirements,
+        'posted_date': _text(row, 'posted_date') or datetime.now().strftime('%Y-%m-%d'),
+        'application_deadline': _text(row, 'application_deadline'),
+        'application_status': _text(row, 'application_status') or 'open'
+    }
+    errors = []
+    if not job['title']:
+        errors.append('Title is required.')
+    try:
+        job['company_id'] = int(job['company_id'])
+    except ValueError:
+        errors.append('A numeric company_id is required.')
+    for field in ('posted_date', 'application_deadline'):
+        if not _valid_date(job[field]):
+            errors.append(f'{field} must be a date in YYYY-MM-DD format.')
+    if job['application_status'] not in JOB_STATUSES:
+        errors.append(f"application_status must be one of: {', '.join(JOB_STATUSES)}.")
+    return job, errors
+
+
+def _commit_jobs(batch, report):
+    with transaction('jobs') as tx:
+        accepted = []
+        for line, job in batch:
+            if get_company_by_id(job['company_id']) is None:
+                report.reject(line, ['Company not found.'], job)
+                continue
+            accepted.append(job)
+        for job, job_id in zip(accepted, reserve_ids(3, len(accepted))):
+            tx['jobs'].append(dict({'id': job_id}, **job))
+    report.imported += len(accepted)
+
+
+def _check_application(row):
+    application = {
+        'job_id': _text(row, 'job_id'),
+        'candidate_id': _text(row, 'candidate_id'),
+        'application_date': _text(row, 'application_date') or datetime.now().strftime('%Y-%m-%d'),
+        'status': _text(row, 'status') or 'pending'
+    }
+    errors = []
+    for field in ('job_id', 'candidate_id'):
+        try:
+            application[field] = int(application[field])
+        except ValueError:
+            errors.append(f'A numeric {field} is required.')
+    if not _valid_date(application['application_date']):
+        errors.append('application_date must be a date in YYYY-MM-DD format.')
+    if application['status'] not in APPLICATION_STATUSES:
+        errors.append(f"status must be one of: {', '.join(APPLICATION_STATUSES)}.")
+    return application, errors
+
+
+def _commit_applications(batch, report):
+    with transaction('applications') as tx:
+        application_index = get_application_index()
+        accepted = []
+        pairs = set()
+        for line, application in batch:
+            pair = (application['candidate_id'], application['job_id'])
+            errors = []
+            if get_job_by_id(application['job_id']) is None:
+                errors.append('Job not found.')
+            if get_candidate_by_id(application['candidate_id']) is None:
+                errors.append('Candidate not found.')
+            if pair in pairs or application_index.has_applied(*pair):
+                errors.append('Candidate has already applied to this job.')
+            if errors:
+                report.reject(line, errors, application)
+                continue
+            pairs.add(pair)
+            accepted.append(application)
+        for application, application_id in zip(accepted, reserve_ids(4, len(accepted))):
+            tx.insert('applications', dict({'id': application_id}, **application))
+    report.imported += len(accepted)
+
+
+IMPORTERS = {
+    'candidates': (_check_candidate, _commit_candidates),
+    'jobs': (_check_job, _commit_jobs),
+    'applications': (_check_application, _commit_applications),
+}
+
+
+def import_file(collection, path, fmt=None, batch_size=IMPORT_BATCH_SIZE, rejects_file=None, progress=None):
+    """Import a CSV or JSONL file into a collection and return an ImportReport.
+
+    ``progress`` is called with the report after each committed batch.
+    """
+    check, commit = IMPORTERS[collection]
+    report = ImportReport(rejects_file)
+    batch = []
+    for line, row in read_rows(path, fmt):
+        report.read += 1
+        if row is None:
+            report.reject(line, ['Row could not be parsed.'], None)
+            continue
+        record, errors = check(row)
+        if errors:
+            report.reject(line, errors, row)
+            continue
+        batch.append((line, record))
+        if len(batch) >= batch_size:
+            commit(batch, report)
+            report.flush()
+            batch = []
+            if progress:
+                progress(report)
+    if batch:
+        commit(batch, report)
+    report.flush()
+    return report
@@ -0,0 +1,82 @@
+# export.py
+"""Streaming export of applications joined with their candidate, job and company.
+
+Rows come from a generator over iter_applications_with_details() and are
+encoded EXPORT_CHUNK_ROWS at a time, so memory use stays flat however many
+rows there are, and the header is ready to send before any row is read.
+"""
+import csv
+import io
+import json
+
+from model import iter_applications_with_details
+from records import json_default
+
+EXPORT_FORMATS = ('csv', 'ndjson')
+EXPORT_MIMETYPES = {'csv': 'text/csv', 'ndjson': 'application/x-ndjson'}
+EXPORT_CHUNK_ROWS = 1000
+
+# (column, record, field) for every exported column, in order
+EXPORT_COLUMNS = (
+    ('application_id', 'application', 'id'),
+    ('application_date', 'application', 'application_date'),
+    ('status', 'application', 'status'),
+    ('candidate_id', 'candidate', 'id'),
+    ('first_name', 'candidate', 'first_name'),
+    ('last_name', 'candidate', 'last_name'),
+    ('email', 'candidate', 'email'),
+    ('major', 'candidate', 'major'),
+    ('gpa', 'candidate', 'gpa'),
+    ('job_id', 'job', 'id'),
+    ('job_title', 'job', 'title'),
+    ('posted_date', 'job', 'posted_date'),
+    ('application_deadline', 'job', 'application_deadline'),
+    ('job_status', 'job', 'application_status'),
+    ('company_id', 'company', 'id'),
+    ('company_name', 'company', 'name'),
+    ('company_location', 'company', 'location'),
+    ('company_contact_email', 'company', 'contact_email'),
+)
+
+
+def flatten(detail):
+    """One joined application as a flat {column: value} row."""
+    return {column: (detail[record] or {}).get(field) for column, record, field in EXPORT_COLUMNS}
+
+
+def _csv_chunks(rows):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([column for column, _, _ in EXPORT_COLUMNS])
+    yield buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+    for count, row in enumerate(rows, start=1):
+        writer.writerow(['' if value is None else value for value in row.values()])
+        if count % EXPORT_CHUNK_ROWS == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def _ndjson_chunks(rows):
+    lines = []
+    for row in rows:
+        lines.append(json.dumps(row, default=json_default) + '\n')
+        if len(lines) == EXPORT_CHUNK_ROWS:
+            yield ''.join(lines)
+            lines = []
+    yield ''.join(lines)
+
+
+def export_applications(fmt='csv', **filters):
+    """Yield the export as text chunks in the given format.
+
+    ``filters`` are passed on to iter_applications_with_details(): job_id,
+    company_id, status, date_from and date_to.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Format must be one of: {', '.join(EXPORT_FORMATS)}.")
+    rows = (flatten(detail) for detail in iter_applications_with_details(**filters))
+    return _csv_chunks(rows) if fmt == 'csv' else _ndjson_chunks(rows)
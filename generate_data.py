@@ -0,0 +1,173 @@
+# generate_data.py
+"""Generate a synthetic job-fair dataset of a given size.
+
+The dataset is reproducible for a given --users and --seed, and keeps the
+admin/admin123 account plus candidates whose passwords are password123, so
+the app can be browsed and benchmarked against it:
+
+    python generate_data.py --users 100000 --out /tmp/jobfair-100k
+"""
+import argparse
+import json
+import os
+import random
+from datetime import date, timedelta
+
+FIRST_NAMES = ['James', 'Mary', 'John', 'Patricia', 'Robert', 'Jennifer', 'Michael', 'Linda', 'David',
+               'Elizabeth', 'William', 'Barbara', 'Richard', 'Susan', 'Joseph', 'Jessica', 'Thomas',
+               'Sarah', 'Wei', 'Priya', 'Somchai', 'Aiko', 'Carlos', 'Fatima', 'Olga', 'Kwame']
+LAST_NAMES = ['Smith', 'Johnson', 'Williams', 'Brown', 'Jones', 'Garcia', 'Miller', 'Davis', 'Lee',
+              'Wilson', 'Anderson', 'Taylor', 'Thomas', 'Moore', 'Martin', 'Chen', 'Nguyen', 'Patel',
+              'Kim', 'Sato', 'Silva', 'Okafor', 'Ivanova', 'Srisuk']
+MAJORS = ['Computer Science', 'Business Administration', 'Marketing', 'Data Science', 'Finance',
+          'Mechanical Engineering', 'Electrical Engineering', 'Graphic Design', 'Statistics',
+          'Operations Management', 'Psychology', 'Economics', 'Biology', 'Communications']
+CITIES = ['San Francisco, CA', 'New York, NY', 'Austin, TX', 'Seattle, WA', 'Boston, MA', 'Chicago, IL',
+          'Denver, CO', 'Atlanta, GA', 'Los Angeles, CA', 'Bangkok, TH']
+COMPANY_WORDS = ['Tech', 'Data', 'Global', 'Green', 'Blue', 'Smart', 'Cloud', 'Prime', 'Nova', 'Apex',
+                 'Bright', 'Urban', 'Quantum', 'Summit', 'Vertex', 'Harbor']
+COMPANY_SUFFIXES = ['Corp', 'Systems', 'Labs', 'Solutions', 'Analytics', 'Partners', 'Works', 'Group']
+LEVELS = ['Intern', 'Junior', 'Associate', 'Assistant', 'Trainee']
+ROLES = ['Software Engineer', 'Data Analyst', 'Marketing Specialist', 'Financial Analyst', 'UX Designer',
+         'Operations Coordinator', 'Sales Representative', 'Research Assistant', 'Product Manager',
+         'Mechanical Engineer', 'HR Coordinator', 'Business Analyst', 'QA Engineer', 'Content Writer']
+SKILLS = ['Python', 'JavaScript', 'SQL', 'Excel', 'communication skills', 'teamwork', 'Figma', 'Java',
+          'statistics', 'problem-solving', 'CAD', 'public speaking', 'Tableau', 'machine learning',
+          'project management', 'negotiation', 'C++', 'writing', 'Git', 'customer service']
+
+# Per 1,000 users: 10 companies and 50 jobs; each candidate applies to a
+# geometric number of jobs with this mean, skewed towards popular jobs.
+COMPANIES_PER_USER = 0.01
+JOBS_PER_USER = 0.05
+MEAN_APPLICATIONS = 3.0
+STATUS_WEIGHTS = {'pending': 0.6, 'approved': 0.15, 'rejected': 0.25}
+
+
+def _zipf_picker(rng, count, exponent=1.1):
+    """Return a function picking an index in range(count), skewed towards low indexes."""
+    weights = [1.0 / (rank + 1) ** exponent for rank in range(count)]
+    cumulative = []
+    total = 0.0
+    for weight in weights:
+        total += weight
+        cumulative.append(total)
+    population = range(count)
+    return lambda k=1: rng.choices(population, cum_weights=cumulative, k=k)
+
+
+def generate(users, seed=0, today=None):
+    """Build the five collections for roughly ``users`` users; returns a dict of lists."""
+    rng = random.Random(seed)
+    today = today or date.today()
+    candidate_count = max(users - 1, 1)
+    company_count = max(int(users * COMPANIES_PER_USER), 5)
+    job_count = max(int(users * JOBS_PER_USER), 10)
+
+    companies = []
+    for i in range(company_count):
+        name = f"{rng.choice(COMPANY_WORDS)} {rng.choice(COMPANY_WORDS)} {rng.choice(COMPANY_SUFFIXES)} {i + 1}"
+        slug = name.lower().replace(' ', '')
+        companies.append({
+            'id': 50000001 + i,
+            'name': name,
+            'contact_email': f'hr@{slug}.com',
+            'location': rng.choice(CITIES)
+        })
+
+    # A few large employers post most of the jobs
+    pick_company = _zipf_picker(rng, company_count)
+    jobs = []
+    for i in range(job_count):
+        role = rng.choice(ROLES)
+        skills = rng.sample(SKILLS, rng.randint(2, 4))
+        posted = today - timedelta(days=rng.randint(0, 90))
+        jobs.append({
+            'id': 30000001 + i,
+            'title': f'{role} {rng.choice(LEVELS)}',
+            'company_id': companies[pick_company()[0]]['id'],
+            'description': f"Join our team as a {role.lower()}. You will work with {', '.join(skills)} "
+                           f"on real projects alongside experienced mentors.",
+            'requirements': [f'{rng.choice(MAJORS)} major'] + [f'{skill} experience' for skill in skills[:2]],
+            'posted_date': posted.strftime('%Y-%m-%d'),
+            # Roughly a third of the jobs have already closed
+            'application_deadline': (posted + timedelta(days=rng.randint(14, 120))).strftime('%Y-%m-%d'),
+            'application_status': 'open'
+        })
+
+    users_list = [{'id': 10000001, 'username': 'admin', 'password': 'admin123', 'user_type': 'admin'}]
+    candidates = []
+    for i in range(candidate_count):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        username = f'{first.lower()}_{last.lower()}_{i + 1}'
+        user_id, candidate_id = 10000002 + i, 20000001 + i
+        users_list.append({
+            'id': user_id,
+            'username': username,
+            'password': 'password123',
+            'user_type': 'candidate',
+            'candidate_id': candidate_id
+        })
+        candidates.append({
+            'id': candidate_id,
+            'user_id': user_id,
+            'first_name': first,
+            'last_name': last,
+            'email': f'{username}@student.edu',
+            'major': rng.choice(MAJORS),
+            'phone': f'(555) {rng.randint(100, 999)}-{rng.randint(1000, 9999)}',
+            'gpa': f'{min(max(rng.gauss(3.2, 0.45), 0.0), 4.0):.1f}'
+        })
+
+    # Popular jobs attract most of the applications
+    pick_job = _zipf_picker(rng, job_count, exponent=0.8)
+    statuses, status_weights = list(STATUS_WEIGHTS), list(STATUS_WEIGHTS.values())
+    applications = []
+    stop = 1.0 / (MEAN_APPLICATIONS + 1)
+    for candidate in candidates:
+        applied = set()
+        while rng.random() > stop and len(applied) < job_count:
+            job = jobs[pick_job()[0]]
+            if job['id'] in applied:
+                continue
+            applied.add(job['id'])
+            posted = date.fromisoformat(job['posted_date'])
+            applied_on = min(posted + timedelta(days=rng.randint(0, 30)), today)
+            applications.append({
+                'id': 40000001 + len(applications),
+                'job_id': job['id'],
+                'candidate_id': candidate['id'],
+                'application_date': applied_on.strftime('%Y-%m-%d'),
+                'status': rng.choices(statuses, status_weights)[0]
+            })
+
+    return {
+        'users': users_list,
+        'candidates': candidates,
+        'companies': companies,
+        'jobs': jobs,
+        'applications': applications,
+    }
+
+
+def write_dataset(collections, out_dir):
+    """Write the collections as the app's JSON files into ``out_dir``."""
+    os.makedirs(out_dir, exist_ok=True)
+    for name, records in collections.items():
+        with open(os.path.join(out_dir, f'{name}.json'), 'w') as f:
+            f.write(json.dumps(records))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--users', type=int, default=1000, help='number of users (1 admin, the rest candidates)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--out', required=True, help='directory to write the JSON files to')
+    args = parser.parse_args()
+
+    collections = generate(args.users, seed=args.seed)
+    write_dataset(collections, args.out)
+    print(', '.join(f'{len(records)} {name}' for name, records in collections.items()) + f' written to {args.out}.')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,191 @@
+# matching.py
+import math
+import re
+
+import numpy as np
+
+TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+# A requirement naming the majors a job asks for, e.g. "Computer Science or
+# Cybersecurity major"; the alternatives are split on "or", "and", "/" and
+# commas.
+MAJOR_REQUIREMENT_RE = re.compile(r'^(.*?)\s*\bmajor\b', re.IGNORECASE)
+MAJOR_SEPARATOR_RE = re.compile(r'\s*(?:,|/|\bor\b|\band\b)\s*', re.IGNORECASE)
+
+# Score weights; a candidate matching on every count scores 1.0
+MAJOR_WEIGHT = 0.5  # the candidate's major is one the job asks for
+TERM_WEIGHT = 0.2   # words of the major that appear in the job's requirements
+GPA_WEIGHT = 0.3    # GPA, as a fraction of MAX_GPA
+MAX_GPA = 4.0
+
+
+def tokenize(text):
+    """Split text into lowercase alphanumeric tokens."""
+    return TOKEN_RE.findall(text.lower())
+
+
+def normalize_major(major):
+    """Case- and whitespace-insensitive form of a major, used to compare them."""
+    return ' '.join(tokenize(major or ''))
+
+
+def parse_gpa(value):
+    """GPA as a float clamped to [0, MAX_GPA]; 0.0 if it is missing or not a number."""
+    try:
+        gpa = float(value)
+    except (TypeError, ValueError):
+        return 0.0
+    return min(max(gpa, 0.0), MAX_GPA) if math.isfinite(gpa) else 0.0
+
+
+def required_majors(requirements):
+    """The normalized majors a job's requirements ask for."""
+    majors = set()
+    for requirement in requirements or ():
+        match = MAJOR_REQUIREMENT_RE.match(requirement.strip())
+        if match:
+            majors.update(normalize_major(part) for part in MAJOR_SEPARATOR_RE.split(match.group(1)))
+    majors.discard('')
+    return majors
+
+
+class JobFeatures:
+    """Job requirements encoded as arrays, one row per job.
+
+    ``terms`` holds each job's requirement words as an L2-normalized row
+    over ``vocabulary``; ``required`` holds the majors each job asks for,
+    and ``majors`` maps each of those majors to the rows of the jobs that
+    ask for it.
+    """
+
+    def __init__(self, jobs=()):
+        self.ids = [job['id'] for job in jobs]
+        self.rows = {job_id: row for row, job_id in enumerate(self.ids)}
+        self.vocabulary = {}
+        self.required = []
+        self.majors = {}
+        cells = []
+        for row, job in enumerate(jobs):
+            requirements = job.get('requirements') or []
+            for token in set(tokenize(' '.join(requirements))):
+                cells.append((row, self.vocabulary.setdefault(token, len(self.vocabulary))))
+            self.required.append(required_majors(requirements))
+            for major in self.required[-1]:
+                self.majors.setdefault(major, []).append(row)
+        self.terms = np.zeros((len(self.ids), len(self.vocabulary)), dtype=np.float32)
+        if cells:
+            rows, columns = zip(*cells)
+            self.terms[rows, columns] = 1.0
+        norms = np.linalg.norm(self.terms, axis=1, keepdims=True)
+        np.divide(self.terms, norms, out=self.terms, where=norms > 0)
+        self.majors = {major: np.array(rows, dtype=np.intp) for major, rows in self.majors.items()}
+
+    def apply_changes(self, changes):
+        """Keep the features across a write that changed no job; otherwise they are rebuilt."""
+        return not changes
+
+    def major_vector(self, major):
+        """L2-normalized vector of a major's words over the requirement vocabulary."""
+        vector = np.zeros(len(self.vocabulary), dtype=np.float32)
+        tokens = set(tokenize(major))
+        columns = [self.vocabulary[token] for token in tokens if token in self.vocabulary]
+        if columns:
+            vector[columns] = 1.0 / math.sqrt(len(tokens))
+        return vector
+
+
+class CandidateFeatures:
+    """Candidate GPA and major as arrays, scored against a JobFeatures in batches.
+
+    Each distinct major is encoded once, and candidates refer to it by
+    index. New candidates are appended in place; the arrays are rebuilt
+    from the per-candidate lists the next time they are needed.
+    """
+
+    def __init__(self, candidates=(), jobs=None):
+        self.jobs = jobs if jobs is not None else JobFeatures()
+        self.rows = {}
+        self.major_ids = {}
+        self._majors = []
+        self._gpa = []
+        self._major_index = []
+        self._major_vectors = []
+        self._arrays = None
+        for candidate in candidates:
+            self.add(candidate)
+
+    def add(self, candidate):
+        """Encode one candidate."""
+        if candidate['id'] in self.rows:
+            return
+        major = normalize_major(candidate.get('major'))
+        major_id = self.major_ids.get(major)
+        if major_id is None:
+            major_id = self.major_ids[major] = len(self._majors)
+            self._majors.append(major)
+            self._major_vectors.append(self.jobs.major_vector(major))
+        self.rows[candidate['id']] = len(self._gpa)
+        self._gpa.append(parse_gpa(candidate.get('gpa')))
+        self._major_index.append(major_id)
+        self._arrays = None
+
+    def apply_changes(self, changes):
+        """Encode newly added candidates; other changes return False so the features are rebuilt."""
+        if any(old is not None for old, new in changes):
+            return False
+        for old, new in changes:
+            self.add(new)
+
+    def _get_arrays(self):
+        if self._arrays is None:
+            # Sized explicitly, as np.array() of an empty list or of empty
+            # vectors cannot be reshaped to (majors, vocabulary)
+            major_vectors = np.zeros((len(self._major_vectors), len(self.jobs.vocabulary)), dtype=np.float32)
+            for major_id, vector in enumerate(self._major_vectors):
+                major_vectors[major_id] = vector
+            self._arrays = (np.array(self._gpa, dtype=np.float32) / MAX_GPA,
+                            np.array(self._major_index, dtype=np.intp),
+                            major_vectors)
+        return self._arrays
+
+    def score_candidates(self, candidate_ids, job_id):
+        """Scores of the given candidates for one job, as an array in the same order."""
+        if not len(candidate_ids):
+            return np.zeros(0, dtype=np.float32)
+        gpa, major_index, major_vectors = self._get_arrays()
+        rows = np.array([self.rows.get(candidate_id, -1) for candidate_id in candidate_ids], dtype=np.intp)
+        known = rows >= 0
+        rows = rows[known]
+        job_row = self.jobs.rows.get(job_id)
+        majors = major_index[rows]
+        scores = GPA_WEIGHT * gpa[rows]
+        if job_row is not None:
+            required = [self.major_ids[major] for major in self.jobs.required[job_row] if major in self.major_ids]
+            scores += MAJOR_WEIGHT * np.isin(majors, required)
+            scores += TERM_WEIGHT * (major_vectors[majors] @ self.jobs.terms[job_row])
+        result = np.zeros(len(candidate_ids), dtype=np.float32)
+        result[known] = scores
+        return result
+
+    def score_jobs(self, candidate_id, job_ids):
+        """Scores of one candidate for the given jobs, as an array in the same order."""
+        if not len(job_ids):
+            return np.zeros(0, dtype=np.float32)
+        gpa, major_index, major_vectors = self._get_arrays()
+        row = self.rows.get(candidate_id)
+        if row is None:
+            return np.zeros(len(job_ids), dtype=np.float32)
+        job_rows = np.array([self.jobs.rows.get(job_id, -1) for job_id in job_ids], dtype=np.intp)
+        known = job_rows >= 0
+        scores = np.full(len(job_ids), GPA_WEIGHT * gpa[row], dtype=np.float32)
+        requiring = self.jobs.majors.get(self._majors[major_index[row]])
+        if requiring is not None:
+            scores += MAJOR_WEIGHT * (known & np.isin(job_rows, requiring))
+        scores[known] += TERM_WEIGHT * (self.jobs.terms[job_rows[known]] @ major_vectors[major_index[row]])
+        return scores
+
+
+def rank(ids, scores, limit=None):
+    """(id, score) pairs, best first, ties kept in the given order."""
+    order = np.argsort(-scores, kind='stable')[:limit]
+    return [(ids[i], round(float(scores[i]), 4)) for i in order]
@@ -0,0 +1,155 @@
+# metrics.py
+import json
+import os
+import threading
+import time
+
+# Upper bounds (seconds) of the request latency histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Requests slower than SLOW_REQUEST_SECONDS are appended to SLOW_REQUEST_LOG
+# with their I/O breakdown; 0 turns the log off.
+SLOW_REQUEST_SECONDS = float(os.environ.get('SLOW_REQUEST_SECONDS', 0))
+SLOW_REQUEST_LOG = os.environ.get('SLOW_REQUEST_LOG', 'slow_requests.jsonl')
+
+# Per-request counters, also totalled per collection and per route
+BREAKDOWN_FIELDS = ('loads', 'saves', 'bytes_read', 'bytes_written', 'parse_seconds')
+
+
+class Metrics:
+    """Request latency histograms and collection I/O counters for one process.
+
+    Storage code reports loads, saves, bytes and JSON parse time as they
+    happen; while a request is in progress they are also added to that
+    request's breakdown, which is folded into per-route totals when it ends.
+    Each gunicorn worker keeps its own counters.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.latency = {}      # (route, method) -> [bucket counts..., +Inf count, sum]
+        self.requests = {}     # (route, method, status) -> count
+        self.collections = {}  # collection -> {field: total}
+        self.routes = {}       # route -> {field: total}
+
+    # -- reporting from the storage layer ------------------------------------
+
+    def _add(self, collection, field, amount):
+        with self._lock:
+            totals = self.collections.setdefault(collection, dict.fromkeys(BREAKDOWN_FIELDS, 0))
+            totals[field] += amount
+        current = getattr(self._local, 'request', None)
+        if current is not None:
+            current['totals'][field] += amount
+            per_collection = current['collections'].setdefault(collection, dict.fromkeys(BREAKDOWN_FIELDS, 0))
+            per_collection[field] += amount
+
+    def record_load(self, collection):
+        self._add(collection, 'loads', 1)
+
+    def record_save(self, collection):
+        self._add(collection, 'saves', 1)
+
+    def record_read(self, collection, nbytes, parse_seconds):
+        self._add(collection, 'bytes_read', nbytes)
+        self._add(collection, 'parse_seconds', parse_seconds)
+
+    def record_write(self, collection, nbytes):
+        self._add(collection, 'bytes_written', nbytes)
+
+    # -- request lifecycle -----------------------------------------------------
+
+    def start_request(self):
+        self._local.request = {
+            'started': time.perf_counter(),
+            'totals': dict.fromkeys(BREAKDOWN_FIELDS, 0),
+            'collections': {},
+        }
+
+    def finish_request(self, route, method, status, path=None):
+        """Record the request in progress; returns its breakdown, or None if none was started."""
+        current = getattr(self._local, 'request', None)
+        if current is None:
+            return None
+        self._local.request = None
+        duration = time.perf_counter() - current['started']
+        with self._lock:
+            histogram = self.latency.setdefault((route, method), [0] * (len(LATENCY_BUCKETS) + 2))
+            for i, bound in enumerate(LATENCY_BUCKETS):
+                if duration <= bound:
+                    histogram[i] += 1
+            histogram[-2] += 1
+            histogram[-1] += duration
+            key = (route, method, status)
+            self.requests[key] = self.requests.get(key, 0) + 1
+            totals = self.routes.setdefault(route, dict.fromkeys(BREAKDOWN_FIELDS, 0))
+            for field, amount in current['totals'].items():
+                totals[field] += amount
+        breakdown = dict(current['totals'], duration=duration, collections=current['collections'])
+        if SLOW_REQUEST_SECONDS and duration >= SLOW_REQUEST_SECONDS:
+            self._log_slow(dict(ts=time.time(), route=route, method=method, status=status, path=path, **breakdown))
+        return breakdown
+
+    def _log_slow(self, record):
+        try:
+            with open(SLOW_REQUEST_LOG, 'a') as f:
+                f.write(json.dumps(record) + '\n')
+        except IOError:
+            print(f"Warning: Could not write to {SLOW_REQUEST_LOG}.")
+
+    def reset(self):
+        with self._lock:
+            self.latency.clear()
+            self.requests.clear()
+            self.collections.clear()
+            self.routes.clear()
+
+    # -- Prometheus text exposition ----------------------------------------------
+
+    def render(self):
+        """Return all metrics in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            lines += ['# HELP jobfair_request_duration_seconds Request latency by route.',
+                      '# TYPE jobfair_request_duration_seconds histogram']
+            for (route, method), histogram in sorted(self.latency.items()):
+                labels = f'route="{_escape(route)}",method="{method}"'
+                for bound, count in zip(LATENCY_BUCKETS, histogram):
+                    lines.append(f'jobfair_request_duration_seconds_bucket{{{labels},le="{bound}"}} {count}')
+                lines.append(f'jobfair_request_duration_seconds_bucket{{{labels},le="+Inf"}} {histogram[-2]}')
+                lines.append(f'jobfair_request_duration_seconds_sum{{{labels}}} {histogram[-1]:.6f}')
+                lines.append(f'jobfair_request_duration_seconds_count{{{labels}}} {histogram[-2]}')
+
+            lines += ['# HELP jobfair_requests_total Requests by route, method and status.',
+                      '# TYPE jobfair_requests_total counter']
+            for (route, method, status), count in sorted(self.requests.items()):
+                lines.append(f'jobfair_requests_total{{route="{_escape(route)}",method="{method}",'
+                             f'status="{status}"}} {count}')
+
+            for scope, totals in (('collection', self.collections), ('route', self.routes)):
+                for field, metric, help_text in _COUNTERS:
+                    name = f'jobfair_{scope}_{metric}'
+                    lines += [f'# HELP {name} {help_text} by {scope}.', f'# TYPE {name} counter']
+                    for key, values in sorted(totals.items()):
+                        value = values[field]
+                        value = f'{value:.6f}' if isinstance(value, float) else value
+                        lines.append(f'{name}{{{scope}="{_escape(key)}"}} {value}')
+        return '\n'.join(lines) + '\n'
+
+
+# (breakdown field, metric name suffix, help text)
+_COUNTERS = (
+    ('loads', 'loads_total', 'Collection loads'),
+    ('saves', 'saves_total', 'Collection saves'),
+    ('bytes_read', 'read_bytes_total', 'Bytes read from data files'),
+    ('bytes_written', 'written_bytes_total', 'Bytes written to data files'),
+    ('parse_seconds', 'json_parse_seconds_total', 'Time spent decoding JSON'),
+)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+metrics = Metrics()
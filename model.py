@@ -1,6 +1,26 @@
 # data_manager.py
+import bisect
+import itertools
 import json
 import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from analytics import ApplicationAnalytics
+from archive import Archive, partition_key
+from matching import CandidateFeatures, JobFeatures, rank
+from metrics import metrics
+from records import Application, json_default
+from search import JobSearchIndex
+from snapshot import Snapshot, SnapshotError, write_snapshot
+from sqlite_store import SQLiteStore
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to the single-process dev server
+    fcntl = None
 # Define the file paths for our JSON "databases"
 USERS_FILE = 'users.json'
 JOBS_FILE = 'jobs.json'
@@ -8,191 +28,1446 @@ CANDIDATES_FILE = 'candidates.json'
 APPLICATIONS_FILE = 'applications.json'
 COMPANIES_FILE = 'companies.json'
 
-def load_users():
-    """Loads users data from the JSON file."""
-    if not os.path.exists(USERS_FILE):
-        print(f"Warning: {USERS_FILE} not found. Creating empty users file.")
-        with open(USERS_FILE, 'w') as f:
+# Storage backend: 'json' (default) keeps using the files above, 'sqlite'
+# stores every collection in SQLITE_FILE (see migrate_json_to_sqlite).
+STORAGE_BACKEND = os.environ.get('STORAGE_BACKEND', 'json')
+SQLITE_FILE = os.environ.get('SQLITE_FILE', 'jobfair.db')
+
+COLLECTIONS = {
+    'users': USERS_FILE,
+    'jobs': JOBS_FILE,
+    'candidates': CANDIDATES_FILE,
+    'applications': APPLICATIONS_FILE,
+    'companies': COMPANIES_FILE,
+}
+
+# Applications are written as an append-only journal of inserts and status
+# changes on top of the JSON snapshot, and folded back into the snapshot by
+# compact_applications() once the journal grows too large or too old.
+APPLICATIONS_JOURNAL = 'applications.journal.jsonl'
+JOURNAL_MAX_BYTES = int(os.environ.get('JOURNAL_MAX_BYTES', 1024 * 1024))
+JOURNAL_MAX_AGE = int(os.environ.get('JOURNAL_MAX_AGE', 3600))
+_JOURNALS = {APPLICATIONS_FILE: APPLICATIONS_JOURNAL}
+
+# Collections held in memory as compact records rather than dicts; see
+# records.py. Applications are by far the largest collection.
+_COMPACT_RECORDS = {APPLICATIONS_FILE: Application.from_mapping}
+
+# Collections larger than this are written as compact JSON: indented output
+# goes through the pure-Python JSON encoder and dominates save time for big
+# files, while compact output is encoded in C in one call.
+PRETTY_JSON_MAX_RECORDS = int(os.environ.get('PRETTY_JSON_MAX_RECORDS', 1000))
+
+# Optional compiled snapshot of every collection (see build_snapshot()). ID
+# lookups on a collection that has not changed since the snapshot was built
+# read straight from the memory-mapped file while the collection is not
+# cached, so a fresh worker can answer them without parsing any JSON.
+SNAPSHOT_FILE = os.environ.get('SNAPSHOT_FILE', 'snapshot.bin')
+_snapshot = {'signature': None, 'snapshot': None}
+
+# Next free ID per prefix, persisted so allocation never scans a collection.
+# Each worker reserves a block of ID_BLOCK_SIZE IDs at a time.
+SEQUENCES_FILE = 'id_sequences.json'
+ID_BLOCK_SIZE = int(os.environ.get('ID_BLOCK_SIZE', 10))
+ID_PREFIXES = {1: 'users', 2: 'candidates', 3: 'jobs', 4: 'applications', 5: 'companies'}
+
+# Process-wide cache of parsed collections, keyed by file path. Each entry
+# remembers the file signature it was read from so that writes made by other
+# workers (or by hand) are picked up on the next load.
+_cache = {}
+_cache_lock = threading.Lock()
+_cache_stats = {'hits': 0, 'misses': 0}
+_versions = itertools.count(1)
+
+# Structures derived from a cached collection (indexes and the like), keyed by
+# (path, builder) and tagged with the cache version they were built from.
+_derived = {}
+
+# Advisory locks held by the current thread, so nested operations on the same
+# collection (e.g. a compaction inside a transaction) do not deadlock.
+_held_locks = threading.local()
+
+# Number of transactions open in the current thread. Reads made inside a
+# transaction always see the latest data, never a unit of work's pinned copy.
+_transactions = threading.local()
+
+# Returns the UnitOfWork of the request being handled, or None; the web app
+# installs one with set_unit_of_work_provider().
+_unit_of_work_provider = lambda: None
+
+_store = SQLiteStore(SQLITE_FILE) if STORAGE_BACKEND == 'sqlite' else None
+
+@contextmanager
+def _locked(paths):
+    """Hold exclusive advisory locks on the given collection files.
+
+    Locks live in sidecar ``<file>.lock`` files and are always taken in sorted
+    order so that multi-collection transactions cannot deadlock each other.
+    """
+    held = _held_locks.__dict__.setdefault('paths', set())
+    to_take = sorted(set(paths) - held)
+    handles = []
+    try:
+        for path in to_take:
+            handle = open(path + '.lock', 'a')
+            handles.append(handle)
+            if fcntl is not None:
+                fcntl.flock(handle, fcntl.LOCK_EX)
+            held.add(path)
+        yield
+    finally:
+        for path, handle in zip(to_take, handles):
+            held.discard(path)
+            handle.close()  # closing the descriptor releases the lock
+
+def _write_atomic(path, data):
+    """Write JSON to a temporary file and atomically replace the target.
+
+    The mtime is set explicitly at nanosecond precision so that the cache
+    signature changes on every write, even within one filesystem timestamp
+    tick. Returns the number of bytes written.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            if len(data) > PRETTY_JSON_MAX_RECORDS:
+                f.write(json.dumps(data, default=json_default))
+            else:
+                json.dump(data, f, indent=4, default=json_default)
+            f.flush()
+            os.fsync(f.fileno())
+            size = f.tell()
+        now = time.time_ns()
+        os.utime(tmp_path, ns=(now, now))
+        os.replace(tmp_path, path)
+        return size
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def _file_signature(stat_result):
+    """Return the (inode, mtime, size) triple used to detect file changes."""
+    return (stat_result.st_ino, stat_result.st_mtime_ns, stat_result.st_size)
+
+def _stat_signature(path):
+    """Return the signature of a file, or None if it does not exist."""
+    try:
+        return _file_signature(os.stat(path))
+    except OSError:
+        return None
+
+def _collection_signature(path):
+    """Return the signature of a collection's snapshot plus its journal, if any."""
+    signature = _stat_signature(path)
+    if signature is None or path not in _JOURNALS:
+        return signature
+    return (signature, _stat_signature(_JOURNALS[path]))
+
+def _cache_store(path, data, signature, positions=None):
+    """Store a parsed collection in the cache under a fresh version number.
+
+    ``positions`` optionally maps record IDs to their index in ``data``.
+    """
+    entry = {'data': data, 'signature': signature, 'version': next(_versions), 'positions': positions}
+    with _cache_lock:
+        _cache[path] = entry
+    return entry
+
+def _compact(path, records):
+    """Convert records to the collection's compact record type, if it has one."""
+    make = _COMPACT_RECORDS.get(path)
+    return records if make is None else [make(record) for record in records]
+
+def _apply_journal_ops(data, ops, make=dict, positions=None):
+    """Apply journal (or unit of work) operations to a collection list in place.
+
+    Records are replaced rather than mutated so that lists handed out by
+    earlier loads are unaffected. Inserts of an ID that is already present are
+    skipped, which keeps replay idempotent if a compaction was interrupted;
+    UnitOfWork.commit() rejects such inserts before they reach the journal.
+    New records are built with ``make``. ``positions`` maps record IDs to
+    their index in ``data`` and is kept up to date; it is built if not given.
+    Returns the (old_record, new_record) pairs that were changed; removals
+    have new_record None.
+    """
+    if positions is None:
+        positions = {record['id']: i for i, record in enumerate(data)}
+    changes = []
+    for op in ops:
+        if op['op'] == 'insert':
+            record = make(op['record'])
+            if record['id'] in positions:
+                continue
+            positions[record['id']] = len(data)
+            data.append(record)
+            changes.append((None, record))
+        elif op['op'] == 'status':
+            i = positions.get(op['id'])
+            if i is None:
+                continue
+            old = data[i]
+            data[i] = make(dict(old, status=op['status']))
+            changes.append((old, data[i]))
+        elif op['op'] == 'replace':
+            i = positions.get(op['record']['id'])
+            if i is None:
+                continue
+            old = data[i]
+            data[i] = make(op['record'])
+            changes.append((old, data[i]))
+        elif op['op'] == 'delete':
+            i = positions.get(op['id'])
+            if i is None:
+                continue
+            changes.append((data.pop(i), None))
+            del positions[op['id']]
+            for j in range(i, len(data)):
+                positions[data[j]['id']] = j
+    return changes
+
+def _read_journal(path, name):
+    """Read the operations recorded in a journal file, skipping a torn last line."""
+    ops = []
+    try:
+        with open(path, 'r') as f:
+            lines = f.readlines()
+    except FileNotFoundError:
+        return ops
+    started = time.perf_counter()
+    for line in lines:
+        try:
+            ops.append(json.loads(line))
+        except json.JSONDecodeError:
+            print(f"Warning: Skipping unreadable entry in {path}.")
+    metrics.record_read(name, sum(map(len, lines)), time.perf_counter() - started)
+    return ops
+
+def _current_work():
+    """The unit of work reads should be pinned to, or None inside a transaction."""
+    if getattr(_transactions, 'depth', 0):
+        return None
+    return _unit_of_work_provider()
+
+def _pinned(path, read):
+    """Return read(), remembered for the rest of the current unit of work."""
+    work = _current_work()
+    if work is None:
+        return read()
+    if path not in work.entries:
+        work.entries[path] = read()
+    return work.entries[path]
+
+def _unpin(path):
+    """Forget the current unit of work's copy of a collection after it is written."""
+    work = _unit_of_work_provider()
+    if work is not None:
+        work.entries.pop(path, None)
+
+def _read_entry(path, name, strict=False):
+    """Return the cache entry for a collection, re-reading the file only if it changed.
+
+    Returns None when the file is missing or cannot be decoded; with strict=True
+    a decode error is raised instead, so a write never replaces unreadable data
+    with an empty list. Within a unit of work the entry read first is returned
+    again for the rest of it, except with strict=True.
+    """
+    if strict:
+        return _read_fresh_entry(path, name, strict)
+    return _pinned(path, lambda: _read_fresh_entry(path, name))
+
+def _read_fresh_entry(path, name, strict=False):
+    signature = _collection_signature(path)
+    entry = _cache.get(path)
+    if entry is not None and signature is not None and entry['signature'] == signature:
+        _cache_stats['hits'] += 1
+        return entry
+    _cache_stats['misses'] += 1
+
+    if signature is None:
+        print(f"Warning: {path} not found. Creating empty {name} file.")
+        with open(path, 'w') as f:
             json.dump([], f)
-        return []
+        return None
     try:
-        with open(USERS_FILE, 'r') as f:
-            return json.load(f)
+        with open(path, 'r') as f:
+            text = f.read()
+        started = time.perf_counter()
+        data = json.loads(text)
     except (IOError, json.JSONDecodeError):
-        print(f"Error: Could not read or decode {USERS_FILE}. Returning an empty list.")
-        return []
+        if strict:
+            raise
+        print(f"Error: Could not read or decode {path}. Returning an empty list.")
+        return None
+    metrics.record_read(name, len(text), time.perf_counter() - started)
+    make = _COMPACT_RECORDS.get(path)
+    if make is not None:
+        # Convert in place, so each parsed dict is freed as soon as it is replaced
+        for i, record in enumerate(data):
+            data[i] = make(record)
+    positions = None
+    if path in _JOURNALS:
+        positions = {record['id']: i for i, record in enumerate(data)}
+        _apply_journal_ops(data, _read_journal(_JOURNALS[path], name), _COMPACT_RECORDS.get(path, dict), positions)
+    return _cache_store(path, data, signature, positions)
 
-def save_users(users):
-    """Saves users data to the JSON file."""
+def _load_collection(path, name):
+    """Load a collection through the cache.
+
+    A shallow copy of the cached list is returned so callers can append to it
+    freely; the record dicts themselves are shared and must not be mutated in
+    place. Within a unit of work the collection is read once, and its pending
+    changes are included.
+    """
+    work = _current_work()
+    if work is None or path not in work.entries:
+        metrics.record_load(name)
+    if _store is not None:
+        records = list(_pinned(path, lambda: _store.load(name)))
+    else:
+        entry = _read_entry(path, name)
+        records = list(entry['data']) if entry else []
+    if work is not None:
+        work.apply_pending(name, records)
+    return records
+
+def _derived_view(path, name, builder):
+    """Return builder(collection), rebuilt only when the cached collection changes.
+
+    Views that define apply_changes(changes) are updated incrementally after a
+    journal append instead of being rebuilt.
+    """
+    key = (path, builder)
+    cached = _derived.get(key)
+    if _store is not None:
+        version = ('sqlite', _store.version(name))
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        view = builder(_store.load(name))
+        _derived[key] = (version, view)
+        return view
+    entry = _read_entry(path, name)
+    version = entry['version'] if entry else None
+    if cached is not None and cached[0] == version and version is not None:
+        return cached[1]
+    view = builder(entry['data'] if entry else [])
+    _derived[key] = (version, view)
+    return view
+
+def _collection_version(path, name):
+    """The version derived views of a collection are cached under (None if it is missing)."""
+    if _store is not None:
+        return ('sqlite', _store.version(name))
+    entry = _read_entry(path, name)
+    return entry['version'] if entry else None
+
+def _advance_derived(path, old_version, new_version, changes):
+    """Carry derived views of a collection forward to a new cache version.
+
+    A view's apply_changes() may return False to say it cannot apply the
+    changes incrementally, in which case it is rebuilt on next use.
+    """
+    for key, (version, view) in list(_derived.items()):
+        if key[0] != path or version != old_version:
+            continue
+        if hasattr(view, 'apply_changes') and view.apply_changes(changes) is not False:
+            _derived[key] = (new_version, view)
+        else:
+            del _derived[key]
+
+def _diff_records(old_records, new_records):
+    """Return (old_record, new_record) pairs for records added, changed or removed.
+
+    Additions have old_record None and removals have new_record None.
+    """
+    old_by_id = {record['id']: record for record in old_records}
+    changes = []
+    for record in new_records:
+        old = old_by_id.pop(record['id'], None)
+        if old is None or (old is not record and old != record):
+            changes.append((old, record))
+    changes.extend((old, None) for old in old_by_id.values())
+    return changes
+
+def _save_collection(path, name, data):
+    """Save a collection, or queue the changes on the current unit of work."""
+    work = _unit_of_work_provider()
+    if work is not None:
+        work.save(name, data)
+    else:
+        _write_collection(path, name, data)
+
+def _write_collection(path, name, data):
+    """Atomically write a collection to disk and refresh its cache entry.
+
+    For journaled collections the full snapshot folds in the journal, which is
+    truncated afterwards. Returns False if the file could not be written.
+    """
+    metrics.record_save(name)
+    _unpin(path)
+    if _store is not None:
+        _store.replace_all(name, data)
+        return True
+    data = _compact(path, data)
     try:
-        with open(USERS_FILE, 'w') as f:
-            json.dump(users, f, indent=4)
+        with _locked([path]):
+            entry = _cache.get(path)
+            current = entry is not None and entry['signature'] == _collection_signature(path)
+            metrics.record_write(name, _write_atomic(path, data))
+            if path in _JOURNALS:
+                open(_JOURNALS[path], 'w').close()
+            signature = _collection_signature(path)
     except IOError:
-        print(f"Error: Could not save users to {USERS_FILE}.")
+        print(f"Error: Could not save {name} to {path}.")
+        invalidate_cache(path)
+        return False
+    new_entry = _cache_store(path, list(data), signature)
+    if current:
+        # Let derived views catch up with just the records that changed
+        _advance_derived(path, entry['version'], new_entry['version'], _diff_records(entry['data'], data))
+    return True
+
+def _append_journal(path, name, ops):
+    """Append operations to a collection's journal as a single small write."""
+    metrics.record_save(name)
+    _unpin(path)
+    if _store is not None:
+        _store.apply_ops(name, ops)
+        return True
+    journal = _JOURNALS[path]
+    now = time.time()
+    payload = ''.join(json.dumps(dict(op, ts=now), default=json_default) + '\n' for op in ops)
+    with _locked([path]):
+        entry = _cache.get(path)
+        signature = _collection_signature(path)
+        try:
+            with open(journal, 'a') as f:
+                f.write(payload)
+                f.flush()
+                size = f.tell()
+            metrics.record_write(name, len(payload))
+        except IOError:
+            print(f"Error: Could not append {name} to {journal}.")
+            invalidate_cache(path)
+            return False
+
+        # We hold the lock, so if the cache was current before the write it
+        # can be brought up to date without re-reading anything. The cached
+        # list is updated in place, as the entry is replaced right away and
+        # loads hand out copies, so an append costs the same at any size.
+        if entry is not None and signature is not None and entry['signature'] == signature:
+            data = entry['data']
+            positions = entry['positions']
+            if positions is None:
+                positions = {record['id']: i for i, record in enumerate(data)}
+            changes = _apply_journal_ops(data, ops, _COMPACT_RECORDS.get(path, dict), positions)
+            new_entry = _cache_store(path, data, _collection_signature(path), positions)
+            _advance_derived(path, entry['version'], new_entry['version'], changes)
+        else:
+            invalidate_cache(path)
+
+        if _journal_due_for_compaction(journal, size, now):
+            compact_applications()
+    return True
+
+class Transaction:
+    """Locked read-modify-write over a set of collections.
+
+    Collections read through ``tx[name]`` are loaded fresh under the lock and
+    written back atomically on commit if their contents changed. ``insert`` on
+    a journaled collection that was not otherwise touched becomes a journal
+    append instead of a rewrite.
+    """
+
+    def __init__(self, names):
+        self.names = tuple(names)
+        self._loaded = {}
+        self._originals = {}
+        self._journal_ops = {}
+
+    def __getitem__(self, name):
+        if name not in self.names:
+            raise KeyError(f"Collection {name!r} is not part of this transaction.")
+        if name not in self._loaded:
+            metrics.record_load(name)
+            if _store is not None:
+                original = _store.load(name)
+            else:
+                entry = _read_entry(COLLECTIONS[name], name, strict=True)
+                original = entry['data'] if entry else []
+            self._originals[name] = original
+            self._loaded[name] = list(original)
+        return self._loaded[name]
+
+    def insert(self, name, record):
+        """Add a record to a collection as part of this transaction."""
+        if COLLECTIONS[name] in _JOURNALS and name not in self._loaded:
+            if name not in self.names:
+                raise KeyError(f"Collection {name!r} is not part of this transaction.")
+            self._journal_ops.setdefault(name, []).append({'op': 'insert', 'record': record})
+        else:
+            self[name].append(record)
+
+    def set_status(self, name, record_id, status):
+        """Change a record's status as part of this transaction."""
+        if COLLECTIONS[name] in _JOURNALS and name not in self._loaded:
+            if name not in self.names:
+                raise KeyError(f"Collection {name!r} is not part of this transaction.")
+            self._journal_ops.setdefault(name, []).append({'op': 'status', 'id': record_id, 'status': status})
+            return
+        records = self[name]
+        for i, record in enumerate(records):
+            if record['id'] == record_id:
+                records[i] = dict(record, status=status)
+
+    def commit(self):
+        """Write back every collection that changed and flush journal operations.
+
+        If any write fails, collections already rewritten are restored and
+        IOError is raised, so the transaction is applied in full or not at all.
+        """
+        written = []
+        for name, data in self._loaded.items():
+            original = self._originals[name]
+            if len(data) != len(original) or any(a is not b for a, b in zip(data, original)):
+                if _store is not None:
+                    metrics.record_save(name)
+                    _unpin(COLLECTIONS[name])
+                    _store.write_changes(name, original, data)
+                elif _write_collection(COLLECTIONS[name], name, data):
+                    written.append(name)
+                else:
+                    self._restore(written)
+                    raise IOError(f"Could not save {name}; the transaction was not applied.")
+        for name, ops in self._journal_ops.items():
+            if not _append_journal(COLLECTIONS[name], name, ops):
+                self._restore(written)
+                raise IOError(f"Could not save {name}; the transaction was not applied.")
+        self._journal_ops = {}
+
+    def _restore(self, names):
+        for name in names:
+            _write_collection(COLLECTIONS[name], name, self._originals[name])
+
+@contextmanager
+def transaction(*names):
+    """Run a locked read-modify-write over the named collections.
+
+    Usage::
+
+        with transaction('users', 'candidates') as tx:
+            tx['users'].append(new_user)
+
+    Changes are committed when the block exits normally and discarded if it
+    raises.
+    """
+    tx = Transaction(names)
+    _transactions.depth = getattr(_transactions, 'depth', 0) + 1
+    try:
+        if _store is not None:
+            with _store.transaction():
+                yield tx
+                tx.commit()
+            return
+        with _locked([COLLECTIONS[name] for name in names]):
+            yield tx
+            tx.commit()
+    finally:
+        _transactions.depth -= 1
+
+class UnitOfWork:
+    """The reads and writes of one request, committed together.
+
+    The first read of a collection is kept in ``entries`` and served again
+    for the rest of the unit of work, so a request parses and checks each
+    collection once and sees a single version of it. Changes made with
+    ``insert``, ``set_status`` or the save_* functions are queued per
+    collection and written by ``commit()`` in one transaction: new records
+    are checked for duplicates under the write lock, and if a check or a
+    write fails nothing is written. Loads include the queued changes; the
+    indexes and lookups built on a collection do not until it is committed.
+    """
+
+    def __init__(self):
+        self.entries = {}  # path -> collection as first read by this unit of work
+        self._ops = {}     # collection name -> queued operations, in order
+
+    @property
+    def dirty(self):
+        """Names of the collections with uncommitted changes."""
+        return tuple(self._ops)
+
+    def _queue(self, name, op):
+        if name not in COLLECTIONS:
+            raise KeyError(f"Unknown collection {name!r}.")
+        self._ops.setdefault(name, []).append(op)
+
+    def insert(self, name, record):
+        """Queue a new record."""
+        self._queue(name, {'op': 'insert', 'record': record})
+
+    def set_status(self, name, record_id, status):
+        """Queue a status change."""
+        self._queue(name, {'op': 'status', 'id': record_id, 'status': status})
+
+    def save(self, name, records):
+        """Queue whatever differs between records and the collection as loaded."""
+        for old, new in _diff_records(_load_collection(COLLECTIONS[name], name), records):
+            if old is None:
+                self.insert(name, new)
+            elif new is None:
+                self._queue(name, {'op': 'delete', 'id': old['id']})
+            else:
+                self._queue(name, {'op': 'replace', 'record': new})
+
+    def apply_pending(self, name, records):
+        """Apply this unit of work's queued changes to a loaded list in place."""
+        if name in self._ops:
+            _apply_journal_ops(records, self._ops[name], _COMPACT_RECORDS.get(COLLECTIONS[name], dict))
+
+    def commit(self):
+        """Write every queued change in one transaction; raises ValueError on a duplicate."""
+        if not self._ops:
+            return
+        ops, self._ops = self._ops, {}
+        with transaction(*ops) as tx:
+            for name, queued in ops.items():
+                inserted = set()
+                for op in queued:
+                    if op['op'] == 'insert':
+                        _check_new_record(name, op['record'], inserted)
+                        inserted.add(op['record']['id'])
+                if COLLECTIONS[name] in _JOURNALS and all(op['op'] in ('insert', 'status') for op in queued):
+                    for op in queued:
+                        if op['op'] == 'insert':
+                            tx.insert(name, op['record'])
+                        else:
+                            tx.set_status(name, op['id'], op['status'])
+                else:
+                    _apply_journal_ops(tx[name], queued, _COMPACT_RECORDS.get(COLLECTIONS[name], dict))
+
+    def rollback(self):
+        """Discard the queued changes."""
+        self._ops = {}
+
+def set_unit_of_work_provider(provider):
+    """Install a function returning the current UnitOfWork, or None outside one."""
+    global _unit_of_work_provider
+    _unit_of_work_provider = provider
+
+@contextmanager
+def unit_of_work():
+    """Use the current unit of work, or a new one committed when the block exits."""
+    work = _unit_of_work_provider()
+    if work is not None:
+        yield work
+        return
+    work = UnitOfWork()
+    yield work
+    work.commit()
+
+def _record_exists(name, record_id):
+    """Whether a collection already holds a record with this ID."""
+    if _store is not None:
+        return _store.select_one(name, 'WHERE id = ?', (record_id,)) is not None
+    # The indexes of the collections records are inserted into are kept up
+    # to date as records are added, so the check does not rescan them
+    if name == 'applications':
+        return get_application_index().get(record_id) is not None
+    if name == 'users':
+        return record_id in _derived_view(USERS_FILE, 'users', UserIndex).by_id
+    if name == 'candidates':
+        return record_id in _derived_view(CANDIDATES_FILE, 'candidates', CandidateIndex).by_id
+    return record_id in _derived_view(COLLECTIONS[name], name, _index_by_id)
+
+def _check_new_record(name, record, inserted=()):
+    """Raise ValueError if a record about to be inserted duplicates an existing one.
+
+    ``inserted`` holds the IDs inserted earlier in the same commit.
+    """
+    if record['id'] in inserted or _record_exists(name, record['id']):
+        raise ValueError(f"A record with ID {record['id']} already exists in {name}.")
+    if name == 'users' and record.get('username') and find_user_by_username(record['username']):
+        raise ValueError('Username already exists. Please choose a different one.')
+    if name == 'candidates' and record.get('email') and find_candidate_by_email(record['email']):
+        raise ValueError('Email already registered. Please use a different email.')
+    if name == 'applications' and get_application_index().has_applied(record.get('candidate_id'),
+                                                                       record.get('job_id')):
+        raise ValueError('You have already applied to this job.')
+
+def _journal_due_for_compaction(journal, size, now):
+    """Whether a journal has outgrown the size or age threshold."""
+    if size >= JOURNAL_MAX_BYTES:
+        return True
+    try:
+        with open(journal, 'r') as f:
+            first = json.loads(f.readline())
+    except (IOError, ValueError):
+        return False
+    return now - first.get('ts', now) >= JOURNAL_MAX_AGE
+
+def get_data_version(name):
+    """Opaque token that changes whenever a collection is written, by any worker."""
+    if _store is not None:
+        return _store.version(name)
+    return _collection_signature(COLLECTIONS[name])
+
+def invalidate_cache(path=None):
+    """Drop one cached collection (or all of them) so the next load re-reads the file."""
+    with _cache_lock:
+        if path is None:
+            _cache.clear()
+        else:
+            _cache.pop(path, None)
+
+def get_cache_stats():
+    """Return cache hit/miss counters and the cached collection sizes."""
+    return {
+        'hits': _cache_stats['hits'],
+        'misses': _cache_stats['misses'],
+        'entries': {path: len(entry['data']) for path, entry in _cache.items()},
+    }
+
+def reset_cache_stats():
+    """Reset the cache hit/miss counters."""
+    _cache_stats['hits'] = 0
+    _cache_stats['misses'] = 0
+
+def load_users():
+    """Loads users data from the JSON file."""
+    return _load_collection(USERS_FILE, 'users')
+
+def save_users(users):
+    """Saves users data to the JSON file."""
+    _save_collection(USERS_FILE, 'users', users)
 
 def load_jobs():
     """Loads jobs data from the JSON file."""
-    if not os.path.exists(JOBS_FILE):
-        print(f"Warning: {JOBS_FILE} not found. Creating empty jobs file.")
-        with open(JOBS_FILE, 'w') as f:
-            json.dump([], f)
-        return []
-    try:
-        with open(JOBS_FILE, 'r') as f:
-            return json.load(f)
-    except (IOError, json.JSONDecodeError):
-        print(f"Error: Could not read or decode {JOBS_FILE}. Returning an empty list.")
-        return []
+    return _load_collection(JOBS_FILE, 'jobs')
 
 def save_jobs(jobs):
     """Saves jobs data to the JSON file."""
-    try:
-        with open(JOBS_FILE, 'w') as f:
-            json.dump(jobs, f, indent=4)
-    except IOError:
-        print(f"Error: Could not save jobs to {JOBS_FILE}.")
+    _save_collection(JOBS_FILE, 'jobs', jobs)
 
 def authenticate_user(username, password):
     """Authenticate user credentials and return user data if valid."""
-    users = load_users()
-    for user in users:
-        if user['username'] == username and user['password'] == password:
-            return user
+    if _store is not None:
+        return _store.authenticate_user(username, password)
+    user = _derived_view(USERS_FILE, 'users', UserIndex).by_username.get(username)
+    if user and user['password'] == password:
+        return user
     return None
 
 def load_candidates():
     """Loads candidates data from the JSON file."""
-    if not os.path.exists(CANDIDATES_FILE):
-        print(f"Warning: {CANDIDATES_FILE} not found. Creating empty candidates file.")
-        with open(CANDIDATES_FILE, 'w') as f:
-            json.dump([], f)
-        return []
-    try:
-        with open(CANDIDATES_FILE, 'r') as f:
-            return json.load(f)
-    except (IOError, json.JSONDecodeError):
-        print(f"Error: Could not read or decode {CANDIDATES_FILE}. Returning an empty list.")
-        return []
+    return _load_collection(CANDIDATES_FILE, 'candidates')
 
 def save_candidates(candidates):
     """Saves candidates data to the JSON file."""
-    try:
-        with open(CANDIDATES_FILE, 'w') as f:
-            json.dump(candidates, f, indent=4)
-    except IOError:
-        print(f"Error: Could not save candidates to {CANDIDATES_FILE}.")
+    _save_collection(CANDIDATES_FILE, 'candidates', candidates)
 
 def load_applications():
     """Loads applications data from the JSON file."""
-    if not os.path.exists(APPLICATIONS_FILE):
-        print(f"Warning: {APPLICATIONS_FILE} not found. Creating empty applications file.")
-        with open(APPLICATIONS_FILE, 'w') as f:
-            json.dump([], f)
-        return []
-    try:
-        with open(APPLICATIONS_FILE, 'r') as f:
-            return json.load(f)
-    except (IOError, json.JSONDecodeError):
-        print(f"Error: Could not read or decode {APPLICATIONS_FILE}. Returning an empty list.")
-        return []
+    return _load_collection(APPLICATIONS_FILE, 'applications')
 
 def save_applications(applications):
     """Saves applications data to the JSON file."""
-    try:
-        with open(APPLICATIONS_FILE, 'w') as f:
-            json.dump(applications, f, indent=4)
-    except IOError:
-        print(f"Error: Could not save applications to {APPLICATIONS_FILE}.")
+    _save_collection(APPLICATIONS_FILE, 'applications', applications)
+
+def append_application(application):
+    """Record a new application by appending it to the applications journal."""
+    return _append_journal(APPLICATIONS_FILE, 'applications',
+                           [{'op': 'insert', 'record': application}])
+
+def update_application_status(application_id, status):
+    """Record a status change for an application in the applications journal."""
+    return _append_journal(APPLICATIONS_FILE, 'applications',
+                           [{'op': 'status', 'id': application_id, 'status': status}])
+
+# Application statuses, and the changes reviewers may make: a decision is
+# made on a pending application and can be reopened, but not flipped directly.
+APPLICATION_STATUSES = ('pending', 'approved', 'rejected')
+STATUS_TRANSITIONS = {
+    'pending': ('approved', 'rejected'),
+    'approved': ('pending',),
+    'rejected': ('pending',),
+}
+
+def update_application_statuses(updates):
+    """Apply many (application_id, status) changes in one transaction and one write.
+
+    Each update is checked against STATUS_TRANSITIONS, taking earlier updates
+    in the batch into account. Returns one result dict per update, in order,
+    with ``id``, ``status``, ``ok`` and either ``previous`` or ``error``.
+    Setting an application to the status it already has succeeds without a
+    write.
+    """
+    results = []
+    with transaction('applications') as tx:
+        index = get_application_index()
+        current = {}
+        for application_id, status in updates:
+            result = {'id': application_id, 'status': status, 'ok': False}
+            results.append(result)
+            application = index.get(application_id) if isinstance(application_id, int) else None
+            if application is None:
+                result['error'] = 'Application not found.'
+                continue
+            if status not in APPLICATION_STATUSES:
+                result['error'] = f"Status must be one of: {', '.join(APPLICATION_STATUSES)}."
+                continue
+            previous = current.get(application_id, application['status'])
+            if status != previous and status not in STATUS_TRANSITIONS.get(previous, ()):
+                result['error'] = f'Cannot change status from {previous} to {status}.'
+                continue
+            result.update(ok=True, previous=previous)
+            if status != previous:
+                current[application_id] = status
+                tx.set_status('applications', application_id, status)
+    return results
+
+def compact_applications():
+    """Fold the applications journal back into the JSON snapshot."""
+    if _store is not None:
+        return
+    entry = _read_entry(APPLICATIONS_FILE, 'applications', strict=True)
+    _write_collection(APPLICATIONS_FILE, 'applications', entry['data'] if entry else [])
 
 def load_companies():
     """Loads companies data from the JSON file."""
-    if not os.path.exists(COMPANIES_FILE):
-        print(f"Warning: {COMPANIES_FILE} not found. Creating empty companies file.")
-        with open(COMPANIES_FILE, 'w') as f:
-            json.dump([], f)
-        return []
-    try:
-        with open(COMPANIES_FILE, 'r') as f:
-            return json.load(f)
-    except (IOError, json.JSONDecodeError):
-        print(f"Error: Could not read or decode {COMPANIES_FILE}. Returning an empty list.")
-        return []
+    return _load_collection(COMPANIES_FILE, 'companies')
 
 def save_companies(companies):
     """Saves companies data to the JSON file."""
+    _save_collection(COMPANIES_FILE, 'companies', companies)
+
+class ApplicationIndex:
+    """Secondary indexes over the applications collection.
+
+    Gives per-job counts, per-candidate application lists and constant-time
+    "has this candidate applied to this job" checks without rescanning.
+    """
+
+    def __init__(self, applications=()):
+        self.by_id = {}
+        self.by_job = {}
+        self.by_candidate = {}
+        self.pairs = set()
+        for app in applications:
+            self.add(app)
+
+    def add(self, app):
+        """Index a single application record."""
+        self.by_id[app['id']] = app
+        self.by_job.setdefault(app['job_id'], []).append(app)
+        self.by_candidate.setdefault(app['candidate_id'], []).append(app)
+        self.pairs.add((app['candidate_id'], app['job_id']))
+
+    def apply_changes(self, changes):
+        """Update the index for (old_record, new_record) pairs from a write.
+
+        Only inserts and changes that keep the ID, job and candidate are
+        handled; anything else returns False so the index is rebuilt.
+        """
+        if any(new is None or (old is not None and (old['id'], old['job_id'], old['candidate_id']) !=
+                               (new['id'], new['job_id'], new['candidate_id']))
+               for old, new in changes):
+            return False
+        for old, new in changes:
+            if old is None:
+                self.add(new)
+                continue
+            self.by_id[new['id']] = new
+            for bucket in (self.by_job[old['job_id']], self.by_candidate[old['candidate_id']]):
+                bucket[:] = [new if app is old else app for app in bucket]
+
+    def count_for_job(self, job_id):
+        """Number of applications submitted to a job."""
+        return len(self.by_job.get(job_id, ()))
+
+    def for_job(self, job_id):
+        """All applications submitted to a job."""
+        return list(self.by_job.get(job_id, ()))
+
+    def for_candidate(self, candidate_id):
+        """All applications submitted by a candidate."""
+        return list(self.by_candidate.get(candidate_id, ()))
+
+    def has_applied(self, candidate_id, job_id):
+        """Whether the candidate already has an application for the job."""
+        return (candidate_id, job_id) in self.pairs
+
+    def get(self, application_id):
+        """The application with this ID, or None."""
+        return self.by_id.get(application_id)
+
+def get_application_index():
+    """Get the application index, rebuilt whenever the applications change."""
+    if _store is not None:
+        return _store.application_index()
+    return _derived_view(APPLICATIONS_FILE, 'applications', ApplicationIndex)
+
+class ApplicationGroups(dict):
+    """Applications grouped by a key in a single pass, with a summary per group.
+
+    Each group is a dict with ``count``, ``latest_date`` (the most recent
+    application_date) and ``statuses`` ({status: count}). ``key`` is a field
+    name or a function of the application.
+    """
+
+    def __init__(self, applications=(), key='candidate_id'):
+        super().__init__()
+        self.key = key if callable(key) else (lambda app, field=key: app[field])
+        for app in applications:
+            self.add(app)
+
+    def add(self, app):
+        """Fold one application into its group."""
+        group = self.get(self.key(app))
+        if group is None:
+            group = self[self.key(app)] = {'count': 0, 'latest_date': None, 'statuses': {}}
+        group['count'] += 1
+        if group['latest_date'] is None or app['application_date'] > group['latest_date']:
+            group['latest_date'] = app['application_date']
+        group['statuses'][app['status']] = group['statuses'].get(app['status'], 0) + 1
+
+    def apply_changes(self, changes):
+        """Update the groups for (old_record, new_record) pairs from a write.
+
+        Only inserts and status changes are handled; anything else returns
+        False so the groups are rebuilt.
+        """
+        for old, new in changes:
+            if new is None or (old is not None and (self.key(old) != self.key(new) or
+                                                    old['application_date'] != new['application_date'])):
+                return False
+        for old, new in changes:
+            if old is None:
+                self.add(new)
+                continue
+            statuses = self[self.key(old)]['statuses']
+            statuses[old['status']] -= 1
+            if not statuses[old['status']]:
+                del statuses[old['status']]
+            statuses[new['status']] = statuses.get(new['status'], 0) + 1
+
+def group_applications(applications, key):
+    """Group applications by a field name or key function in a single pass."""
+    return ApplicationGroups(applications, key)
+
+def _groups_by_candidate(applications):
+    return ApplicationGroups(applications, 'candidate_id')
+
+def _groups_by_job(applications):
+    return ApplicationGroups(applications, 'job_id')
+
+def _groups_overall(applications):
+    return ApplicationGroups(applications, lambda app: 'all')
+
+_GROUP_BUILDERS = {'candidate_id': _groups_by_candidate, 'job_id': _groups_by_job, 'all': _groups_overall}
+
+def get_application_groups(key):
+    """Get applications grouped by 'candidate_id', 'job_id' or 'all', kept in sync with the data."""
+    return _derived_view(APPLICATIONS_FILE, 'applications', _GROUP_BUILDERS[key])
+
+def get_application_summary():
+    """Overall application count, latest date and status breakdown."""
+    if _store is not None:
+        summary = _store.application_summary()
+    else:
+        summary = get_application_groups('all').get('all')
+    return summary or {'count': 0, 'latest_date': None, 'statuses': {}}
+
+def _index_by_id(records):
+    return {record['id']: record for record in records}
+
+class UserIndex:
+    """Hash lookups over users: by ID, exact username, case-folded username and candidate ID."""
+
+    def __init__(self, users=()):
+        self.by_id = {}
+        self.by_username = {}
+        self.by_username_folded = {}
+        self.by_candidate_id = {}
+        for user in users:
+            self.add(user)
+
+    def add(self, user):
+        """Index a single user record."""
+        self.by_id.setdefault(user['id'], user)
+        self.by_username.setdefault(user['username'], user)
+        self.by_username_folded.setdefault(user['username'].casefold(), user)
+        if user.get('candidate_id') is not None:
+            self.by_candidate_id.setdefault(user['candidate_id'], user)
+
+    def apply_changes(self, changes):
+        """Index newly added users; other changes return False so the index is rebuilt."""
+        if any(old is not None for old, new in changes):
+            return False
+        for old, new in changes:
+            self.add(new)
+
+class CandidateIndex:
+    """Hash lookups over candidates: by ID, case-folded email and user ID."""
+
+    def __init__(self, candidates=()):
+        self.by_id = {}
+        self.by_email_folded = {}
+        self.by_user_id = {}
+        for candidate in candidates:
+            self.add(candidate)
+
+    def add(self, candidate):
+        """Index a single candidate record."""
+        self.by_id.setdefault(candidate['id'], candidate)
+        self.by_email_folded.setdefault(candidate['email'].casefold(), candidate)
+        if candidate.get('user_id') is not None:
+            self.by_user_id.setdefault(candidate['user_id'], candidate)
+
+    def apply_changes(self, changes):
+        """Index newly added candidates; other changes return False so the index is rebuilt."""
+        if any(old is not None for old, new in changes):
+            return False
+        for old, new in changes:
+            self.add(new)
+
+def find_user_by_username(username):
+    """Get a user by username, ignoring case."""
+    if _store is not None:
+        return _store.select_one('users', 'WHERE username = ? COLLATE NOCASE', (username,))
+    return _derived_view(USERS_FILE, 'users', UserIndex).by_username_folded.get(username.casefold())
+
+def find_candidate_by_email(email):
+    """Get a candidate by email address, ignoring case."""
+    if _store is not None:
+        return _store.select_one('candidates', 'WHERE email = ? COLLATE NOCASE', (email,))
+    return _derived_view(CANDIDATES_FILE, 'candidates', CandidateIndex).by_email_folded.get(email.casefold())
+
+def create_candidate_account(username, password, candidate_fields):
+    """Create a candidate user and its candidate profile together.
+
+    Both records are committed with the current unit of work, or straight
+    away outside one. Username and email uniqueness (case-insensitive) is
+    checked again under the write lock when they are committed, so two
+    concurrent registrations cannot both succeed. Raises ValueError if either
+    is already taken. Returns the new (user, candidate).
+    """
+    with unit_of_work() as work:
+        if find_user_by_username(username):
+            raise ValueError('Username already exists. Please choose a different one.')
+        if find_candidate_by_email(candidate_fields['email']):
+            raise ValueError('Email already registered. Please use a different email.')
+        
+        user_id = generate_id(1)  # User ID starts with 1
+        candidate_id = generate_id(2)  # Candidate ID starts with 2
+        new_user = {
+            'id': user_id,
+            'username': username,
+            'password': password,  # In production, this should be hashed
+            'user_type': 'candidate',
+            'candidate_id': candidate_id
+        }
+        new_candidate = dict({'id': candidate_id, 'user_id': user_id}, **candidate_fields)
+        work.insert('users', new_user)
+        work.insert('candidates', new_candidate)
+    return new_user, new_candidate
+
+class SortedById:
+    """A collection ordered by ID, so cursor pagination can start with a bisect."""
+
+    def __init__(self, records=()):
+        self.records = sorted(records, key=lambda record: record['id'])
+        self.ids = [record['id'] for record in self.records]
+
+    def after(self, last_id=None):
+        """Iterate over the records whose ID is greater than last_id."""
+        start = 0 if last_id is None else bisect.bisect_right(self.ids, last_id)
+        return itertools.islice(self.records, start, None)
+
+def iter_collection(name, after_id=None):
+    """Iterate over a collection in ID order, starting after the given ID."""
+    if _store is not None:
+        return _store.iterate(name, 'WHERE id > ? ORDER BY id', (-1 if after_id is None else after_id,))
+    return _derived_view(COLLECTIONS[name], name, SortedById).after(after_id)
+
+@lru_cache(maxsize=4096)
+def parse_deadline(value):
+    """Parse a YYYY-MM-DD deadline string to a date (None if missing or invalid)."""
     try:
-        with open(COMPANIES_FILE, 'w') as f:
-            json.dump(companies, f, indent=4)
-    except IOError:
-        print(f"Error: Could not save companies to {COMPANIES_FILE}.")
+        return datetime.strptime(value, '%Y-%m-%d').date()
+    except (TypeError, ValueError):
+        return None
+
+class OpenJobsIndex:
+    """Jobs sorted by pre-parsed application deadline.
+
+    The jobs open on a given day are those from the first deadline on or after
+    that day onwards, found with a bisect; the result is remembered until the
+    date changes.
+    """
+
+    def __init__(self, jobs=()):
+        self.total = len(jobs)
+        entries = []
+        for position, job in enumerate(jobs):
+            deadline = parse_deadline(job.get('application_deadline'))
+            if deadline is not None:
+                entries.append((deadline, position, job))
+        entries.sort(key=lambda entry: (entry[0], entry[1]))
+        self.deadlines = [entry[0] for entry in entries]
+        self.entries = entries
+        self._open = None  # (day, open jobs in collection order)
+
+    def _open_on(self, today):
+        today = today or date.today()
+        if self._open is None or self._open[0] != today:
+            start = bisect.bisect_left(self.deadlines, today)
+            current = sorted((entry for entry in self.entries[start:]
+                              if entry[2].get('application_status') == 'open'),
+                             key=lambda entry: entry[1])
+            self._open = (today, [entry[2] for entry in current])
+        return self._open[1]
+
+    def open_jobs(self, today=None):
+        """Jobs whose deadline has not passed and whose status is open, in collection order."""
+        return list(self._open_on(today))
+
+    def count_open(self, today=None):
+        """Number of jobs open for applications."""
+        return len(self._open_on(today))
+
+def get_open_jobs(today=None):
+    """Get the jobs currently open for applications."""
+    return _derived_view(JOBS_FILE, 'jobs', OpenJobsIndex).open_jobs(today)
+
+def _build_job_search_index(jobs):
+    companies = _derived_view(COMPANIES_FILE, 'companies', _index_by_id)
+    index = JobSearchIndex(jobs, {company_id: company['name'] for company_id, company in companies.items()})
+    index.companies = companies
+    return index
+
+def get_job_search_index():
+    """Get the job search index, updated as jobs are saved and rebuilt if companies change."""
+    index = _derived_view(JOBS_FILE, 'jobs', _build_job_search_index)
+    if index.companies is not _derived_view(COMPANIES_FILE, 'companies', _index_by_id):
+        _derived.pop((JOBS_FILE, _build_job_search_index), None)
+        index = _derived_view(JOBS_FILE, 'jobs', _build_job_search_index)
+    return index
+
+def search_jobs(query, limit=20, job_ids=None):
+    """Full-text search over jobs; returns [(job_id, score)], best match first."""
+    return get_job_search_index().search(query, limit=limit, job_ids=job_ids)
+
+JOB_SORTS = ('title', 'company', 'deadline')
+
+class JobListing:
+    """The jobs, in each order the job list can be sorted by.
+
+    Orders are sorted the first time they are asked for, and the open jobs
+    are picked out of each once a day, so serving a page of the list costs
+    the same however many jobs there are. ``companies`` maps company IDs to
+    companies, for sorting by company name.
+    """
+
+    def __init__(self, jobs, companies):
+        self.companies = companies
+        self._orders = {None: list(jobs)}
+        self._ranks = {}
+        self._open = {}
+
+    def company_name(self, job):
+        company = self.companies.get(job.get('company_id'))
+        return company['name'] if company else job.get('company') or ''
+
+    def _sort_key(self, sort):
+        if sort == 'title':
+            return lambda job: (job.get('title') or '').casefold()
+        if sort == 'company':
+            return lambda job: self.company_name(job).casefold()
+        # No deadline sorts last
+        return lambda job: (parse_deadline(job.get('application_deadline')) or date.max)
+
+    def ordered(self, sort=None):
+        """All jobs, sorted by one of JOB_SORTS or in collection order."""
+        if sort not in self._orders:
+            self._orders[sort] = sorted(self._orders[None], key=self._sort_key(sort))
+        return self._orders[sort]
+
+    def ordered_open(self, open_index, sort=None, today=None):
+        """The jobs open on ``today`` according to an OpenJobsIndex, in the same order as ordered(sort)."""
+        key = (sort, today or date.today())
+        if key not in self._open:
+            open_ids = {job['id'] for job in open_index.open_jobs(key[1])}
+            self._open = {k: jobs for k, jobs in self._open.items() if k[1] == key[1]}
+            self._open[key] = [job for job in self.ordered(sort) if job['id'] in open_ids]
+        return self._open[key]
+
+    def rank(self, sort):
+        """{job_id: position} in ordered(sort), used to sort a subset of the jobs."""
+        if sort not in self._ranks:
+            self._ranks[sort] = {job['id']: position for position, job in enumerate(self.ordered(sort))}
+        return self._ranks[sort]
+
+def _build_job_listing(jobs):
+    return JobListing(jobs, _derived_view(COMPANIES_FILE, 'companies', _index_by_id))
+
+def get_job_listing():
+    """Get the sorted job listing, rebuilt when jobs or companies change."""
+    listing = _derived_view(JOBS_FILE, 'jobs', _build_job_listing)
+    if listing.companies is not _derived_view(COMPANIES_FILE, 'companies', _index_by_id):
+        _derived.pop((JOBS_FILE, _build_job_listing), None)
+        listing = _derived_view(JOBS_FILE, 'jobs', _build_job_listing)
+    return listing
+
+def get_jobs_page(sort=None, offset=0, limit=50, open_only=False, query=None, today=None):
+    """One page of the job list; returns (total, jobs).
+
+    With ``open_only`` only jobs open for applications are listed. A
+    ``query`` limits the list to the jobs matching it, in relevance order
+    unless ``sort`` is one of JOB_SORTS.
+    """
+    listing = get_job_listing()
+    open_index = _derived_view(JOBS_FILE, 'jobs', OpenJobsIndex) if open_only else None
+    if not query:
+        ordered = listing.ordered_open(open_index, sort, today) if open_only else listing.ordered(sort)
+        return len(ordered), ordered[offset:offset + limit]
+    job_ids = {job['id'] for job in open_index.open_jobs(today)} if open_only else None
+    matches = [job_id for job_id, score in search_jobs(query, limit=None, job_ids=job_ids)]
+    if sort is not None:
+        rank = listing.rank(sort)
+        matches.sort(key=lambda job_id: rank.get(job_id, len(rank)))
+    jobs = _derived_view(JOBS_FILE, 'jobs', _index_by_id)
+    return len(matches), [jobs[job_id] for job_id in matches[offset:offset + limit]]
+
+def _build_candidate_features(candidates):
+    return CandidateFeatures(candidates, _derived_view(JOBS_FILE, 'jobs', JobFeatures))
+
+def get_match_features():
+    """Get the candidate and job feature arrays used for match scoring.
+
+    Job features are rebuilt when jobs change, and candidate features with
+    them; new candidates are added to the existing arrays.
+    """
+    features = _derived_view(CANDIDATES_FILE, 'candidates', _build_candidate_features)
+    if features.jobs is not _derived_view(JOBS_FILE, 'jobs', JobFeatures):
+        _derived.pop((CANDIDATES_FILE, _build_candidate_features), None)
+        features = _derived_view(CANDIDATES_FILE, 'candidates', _build_candidate_features)
+    return features
+
+def rank_applicants(job_id, limit=None):
+    """A job's applicants, best match first.
+
+    Returns up to ``limit`` dicts with ``candidate``, ``application`` and
+    ``score`` (0 to 1); every applicant is scored in one batch.
+    """
+    if _store is not None:
+        find_candidate = get_candidate_by_id
+    else:
+        find_candidate = _derived_view(CANDIDATES_FILE, 'candidates', CandidateIndex).by_id.get
+    applicants = []
+    for app in get_application_index().for_job(job_id):
+        candidate = find_candidate(app['candidate_id'])
+        if candidate:
+            applicants.append({'candidate': candidate, 'application': app})
+    scores = get_match_features().score_candidates([a['candidate']['id'] for a in applicants], job_id)
+    return [dict(applicants[i], score=score) for i, score in rank(range(len(applicants)), scores, limit)]
+
+def recommend_jobs(candidate_id, limit=5, today=None):
+    """Open jobs the candidate has not applied to, best match first, as (job, score) pairs."""
+    index = get_application_index()
+    jobs = [job for job in get_open_jobs(today) if not index.has_applied(candidate_id, job['id'])]
+    scores = get_match_features().score_jobs(candidate_id, [job['id'] for job in jobs])
+    return [(jobs[i], score) for i, score in rank(range(len(jobs)), scores, limit)]
+
+def _build_application_analytics(applications):
+    jobs = _derived_view(JOBS_FILE, 'jobs', _index_by_id)
+    candidates = _derived_view(CANDIDATES_FILE, 'candidates', CandidateIndex)
+    analytics = ApplicationAnalytics(
+        applications,
+        company_of=lambda job_id: (jobs.get(job_id) or {}).get('company_id'),
+        major_of=lambda candidate_id: (candidates.by_id.get(candidate_id) or {}).get('major'))
+    analytics.sources = (jobs, candidates)
+    return analytics
+
+def get_application_analytics():
+    """Get the running application counters, updated as applications are written.
+
+    They are rebuilt only when the jobs or candidates they were resolved
+    against change in some other way than candidates being added. With the
+    SQLite store they are counted by SQL aggregates instead, again whenever
+    the applications, jobs or candidates table changes.
+    """
+    if _store is not None:
+        versions = tuple(_store.version(name) for name in ('applications', 'jobs', 'candidates'))
+        cached = _derived.get(('sqlite', ApplicationAnalytics))
+        if cached is None or cached[0] != versions:
+            cached = (versions, ApplicationAnalytics.from_counts(**_store.application_counts()))
+            _derived[('sqlite', ApplicationAnalytics)] = cached
+        return cached[1]
+    analytics = _derived_view(APPLICATIONS_FILE, 'applications', _build_application_analytics)
+    sources = (_derived_view(JOBS_FILE, 'jobs', _index_by_id),
+               _derived_view(CANDIDATES_FILE, 'candidates', CandidateIndex))
+    if any(current is not used for current, used in zip(sources, analytics.sources)):
+        _derived.pop((APPLICATIONS_FILE, _build_application_analytics), None)
+        analytics = _derived_view(APPLICATIONS_FILE, 'applications', _build_application_analytics)
+    return analytics
+
+def get_analytics_summary(today=None):
+    """Application counts per job, company, major, status and day, and open vs. closed jobs.
+
+    Jobs and companies are listed with their names. The cost depends on the
+    number of distinct jobs, companies, majors and days with changes since
+    the last call, not on the number of applications.
+    """
+    summary = dict(get_application_analytics().summary())
+    jobs = _derived_view(JOBS_FILE, 'jobs', _index_by_id)
+    companies = _derived_view(COMPANIES_FILE, 'companies', _index_by_id)
+    summary['jobs'] = [{'id': job_id, 'title': (jobs.get(job_id) or {}).get('title'), 'count': count}
+                       for job_id, count in summary['jobs']]
+    summary['companies'] = [{'id': company_id, 'name': (companies.get(company_id) or {}).get('name'),
+                             'count': count} for company_id, count in summary['companies']]
+    summary['majors'] = [{'major': major, 'count': count} for major, count in summary['majors']]
+    summary['days'] = [{'date': day, 'count': count} for day, count in summary['days']]
+    open_jobs = _derived_view(JOBS_FILE, 'jobs', OpenJobsIndex)
+    opened = open_jobs.count_open(today)
+    summary['open_jobs'] = opened
+    summary['closed_jobs'] = open_jobs.total - opened
+    return summary
+
+def _signature_token(signature):
+    """A collection signature in the JSON form stored in snapshots."""
+    return json.loads(json.dumps(signature))
+
+def _open_snapshot():
+    """Return the memory-mapped snapshot, reopened if the file was replaced, or None."""
+    signature = _stat_signature(SNAPSHOT_FILE)
+    if signature != _snapshot['signature']:
+        snapshot = None
+        if signature is not None:
+            try:
+                snapshot = Snapshot(SNAPSHOT_FILE)
+            except (OSError, SnapshotError) as e:
+                print(f"Warning: Ignoring snapshot {SNAPSHOT_FILE}: {e}")
+        # A replaced mapping is closed when the last reference goes away
+        _snapshot.update(signature=signature, snapshot=snapshot)
+    return _snapshot['snapshot']
+
+def _snapshot_lookup(path, name, record_id):
+    """Look a record up in the snapshot instead of loading the collection.
+
+    Returns (True, record or None) when the collection is not cached and the
+    snapshot is current for it, and (False, None) otherwise.
+    """
+    if not isinstance(record_id, int):
+        return False, None
+    signature = _collection_signature(path)
+    entry = _cache.get(path)
+    if signature is None or (entry is not None and entry['signature'] == signature):
+        return False, None
+    snapshot = _open_snapshot()
+    if snapshot is None or snapshot.signature(name) != _signature_token(signature):
+        return False, None
+    return True, snapshot.get(name, record_id)
+
+def build_snapshot(path=None):
+    """Compile every collection into a snapshot file (SNAPSHOT_FILE); returns the record counts."""
+    collections, signatures = {}, {}
+    with _locked(list(COLLECTIONS.values())):
+        for name, collection_path in COLLECTIONS.items():
+            entry = _read_entry(collection_path, name, strict=True)
+            collections[name] = entry['data'] if entry else []
+            signatures[name] = _signature_token(entry['signature']) if entry else None
+    write_snapshot(path or SNAPSHOT_FILE, collections, signatures)
+    return {name: len(records) for name, records in collections.items()}
 
 def get_company_by_id(company_id):
     """Get a specific company by ID."""
-    companies = load_companies()
-    for company in companies:
-        if company['id'] == company_id:
-            return company
-    return None
+    if _store is not None:
+        return _store.get_company_by_id(company_id)
+    found, company = _snapshot_lookup(COMPANIES_FILE, 'companies', company_id)
+    if found:
+        return company
+    return _derived_view(COMPANIES_FILE, 'companies', _index_by_id).get(company_id)
 
 def get_candidate_by_id(candidate_id):
     """Get a specific candidate by ID."""
-    candidates = load_candidates()
-    for candidate in candidates:
-        if candidate['id'] == candidate_id:
-            return candidate
-    return None
+    if _store is not None:
+        return _store.get_candidate_by_id(candidate_id)
+    found, candidate = _snapshot_lookup(CANDIDATES_FILE, 'candidates', candidate_id)
+    if found:
+        return candidate
+    return _derived_view(CANDIDATES_FILE, 'candidates', CandidateIndex).by_id.get(candidate_id)
 
 def get_user_by_candidate_id(candidate_id):
     """Get user information by candidate ID."""
-    users = load_users()
-    for user in users:
-        if user.get('candidate_id') == candidate_id:
-            return user
-    return None
+    if _store is not None:
+        return _store.get_user_by_candidate_id(candidate_id)
+    return _derived_view(USERS_FILE, 'users', UserIndex).by_candidate_id.get(candidate_id)
 
 def get_applications_with_details():
-    """Get all applications with candidate and job details."""
-    applications = load_applications()
-    candidates = load_candidates()
-    jobs = load_jobs()
-    
-    # Create lookup dictionaries
-    candidate_dict = {c['id']: c for c in candidates}
-    job_dict = {j['id']: j for j in jobs}
-    
-    # Combine application data with candidate and job details
-    detailed_applications = []
+    """Get all applications with candidate, job and company details."""
+    return list(iter_applications_with_details())
+
+def iter_applications_with_details(job_id=None, company_id=None, status=None, date_from=None, date_to=None):
+    """Yield applications joined with their candidate, job and company, one at a time.
+
+    Each item is a dict with ``application``, ``candidate``, ``job`` and
+    ``company`` (None if the job's company is missing); applications whose
+    candidate or job no longer exists are skipped. Filters are optional;
+    ``date_from`` and ``date_to`` are inclusive YYYY-MM-DD strings.
+    Nothing is copied up front, so memory use does not grow with the
+    number of applications yielded.
+    """
+    if _store is not None:
+        conditions, params = [], []
+        for condition, value in (('a.job_id = ?', job_id), ('j.company_id = ?', company_id),
+                                 ('a.status = ?', status), ('a.application_date >= ?', date_from),
+                                 ('a.application_date <= ?', date_to)):
+            if value is not None:
+                conditions.append(condition)
+                params.append(value)
+        yield from _store.iter_application_details('WHERE ' + ' AND '.join(conditions) if conditions else '',
+                                                   params)
+        return
+    candidates = _derived_view(CANDIDATES_FILE, 'candidates', CandidateIndex).by_id
+    jobs = _derived_view(JOBS_FILE, 'jobs', _index_by_id)
+    companies = _derived_view(COMPANIES_FILE, 'companies', _index_by_id)
+    if job_id is not None:
+        applications = get_application_index().for_job(job_id)
+    else:
+        # Cached lists are replaced on write, never changed, so this one can be iterated as it is
+        entry = _read_entry(APPLICATIONS_FILE, 'applications')
+        applications = entry['data'] if entry else []
     for app in applications:
-        candidate = candidate_dict.get(app['candidate_id'])
-        job = job_dict.get(app['job_id'])
-        
-        if candidate and job:
-            detailed_app = {
-                'application': app,
-                'candidate': candidate,
-                'job': job
-            }
-            detailed_applications.append(detailed_app)
-    
-    return detailed_applications
+        if status is not None and app['status'] != status:
+            continue
+        if (date_from is not None and app['application_date'] < date_from) or \
+                (date_to is not None and app['application_date'] > date_to):
+            continue
+        job = jobs.get(app['job_id'])
+        if job is None or (company_id is not None and job.get('company_id') != company_id):
+            continue
+        candidate = candidates.get(app['candidate_id'])
+        if candidate is None:
+            continue
+        yield {'application': app, 'candidate': candidate, 'job': job, 'company': companies.get(job.get('company_id'))}
 
 def get_applicants():
     """Get all candidates who have made applications."""
-    applications = load_applications()
+    if _store is not None:
+        return _store.get_applicants()
     candidates = load_candidates()
-    
-    # Get unique candidate IDs from applications
-    candidate_ids = list(set(app['candidate_id'] for app in applications))
+    groups = get_application_groups('candidate_id')
     
     # Get candidate details for those who have applied
     applicants = []
     for candidate in candidates:
-        if candidate['id'] in candidate_ids:
-            # Get the most recent application date for this candidate
-            candidate_applications = [app for app in applications if app['candidate_id'] == candidate['id']]
-            most_recent_app = max(candidate_applications, key=lambda x: x['application_date'])
-            
-            # Combine candidate info with application info
+        group = groups.get(candidate['id'])
+        if group:
+            # Combine candidate info with the most recent application date
             applicant = {
                 'id': candidate['id'],
                 'full_name': f"{candidate['first_name']} {candidate['last_name']}",
@@ -202,33 +1477,96 @@ def get_applicants():
                 'major': candidate['major'],
                 'phone': candidate.get('phone', ''),
                 'gpa': candidate.get('gpa', ''),
-                'application_date': most_recent_app['application_date']
+                'application_date': group['latest_date']
             }
             applicants.append(applicant)
     
     return applicants
 
-def get_applicant_by_id(applicant_id):
-    """Get a specific applicant (candidate) by ID with application details."""
+APPLICANT_SORTS = {
+    'name': lambda applicant: (applicant['full_name'].casefold(), applicant['id']),
+    'date': lambda applicant: (applicant['application_date'] or '', applicant['id']),
+    'major': lambda applicant: ((applicant['major'] or '').casefold(), applicant['id']),
+}
+
+class ApplicantList:
+    """The applicants, in each order the applicant list can be sorted by.
+
+    Each order is sorted the first time it is asked for and kept until the
+    applications or candidates change, so serving a page of it costs the
+    same however many applicants there are.
+    """
+
+    def __init__(self, applicants):
+        self._orders = {None: applicants}
+        self._by_id = None
+
+    def after(self, last_id=None):
+        """Iterate over the applicants in ID order, starting after last_id."""
+        if self._by_id is None:
+            self._by_id = SortedById(self._orders[None])
+        return self._by_id.after(last_id)
+
+    def ordered(self, sort=None):
+        """All applicants, sorted by one of APPLICANT_SORTS or in collection order."""
+        if sort not in self._orders:
+            self._orders[sort] = sorted(self._orders[None], key=APPLICANT_SORTS[sort])
+        return self._orders[sort]
+
+def get_applicant_list():
+    """Get the sorted applicant list, rebuilt when applications or candidates change.
+
+    It is built from get_applicants(), so neither collection is loaded in
+    full with the SQLite store.
+    """
+    versions = (_collection_version(APPLICATIONS_FILE, 'applications'),
+                _collection_version(CANDIDATES_FILE, 'candidates'))
+    cached = _derived.get((None, ApplicantList))
+    if cached is None or cached[0] != versions or None in versions:
+        cached = (versions, ApplicantList(get_applicants()))
+        _derived[(None, ApplicantList)] = cached
+    return cached[1]
+
+def iter_applicants(after_id=None):
+    """Iterate over get_applicants() in ID order, starting after the given ID."""
+    return get_applicant_list().after(after_id)
+
+def get_applicants_page(sort=None, offset=0, limit=50):
+    """One page of get_applicants(), sorted by one of APPLICANT_SORTS; returns (total, applicants)."""
+    ordered = get_applicant_list().ordered(sort)
+    return len(ordered), ordered[offset:offset + limit]
+
+def get_applicant_by_id(applicant_id, include_archived=False):
+    """Get a specific applicant (candidate) by ID with application details.
+
+    With ``include_archived``, applications to archived jobs are read from
+    the archive and listed separately under ``archived_applications``.
+    """
     candidate = get_candidate_by_id(applicant_id)
     if not candidate:
         return None
     
-    applications = load_applications()
-    jobs = load_jobs()
-    
-    # Get all applications for this candidate
-    candidate_applications = [app for app in applications if app['candidate_id'] == applicant_id]
+    if _store is not None:
+        application_details = [{'application': detail['application'], 'job': detail['job']}
+                               for detail in _store.get_application_details('WHERE a.candidate_id = ?',
+                                                                            (applicant_id,))]
+    else:
+        jobs = _derived_view(JOBS_FILE, 'jobs', _index_by_id)
+        
+        # Get job details for each of this candidate's applications
+        application_details = []
+        for app in get_application_index().for_candidate(applicant_id):
+            job = jobs.get(app['job_id'])
+            if job:
+                application_details.append({
+                    'application': app,
+                    'job': job
+                })
     
-    # Get job details for each application
-    application_details = []
-    for app in candidate_applications:
-        job = next((j for j in jobs if j['id'] == app['job_id']), None)
-        if job:
-            application_details.append({
-                'application': app,
-                'job': job
-            })
+    if _store is not None:
+        group = _store.application_summary('WHERE candidate_id = ?', (applicant_id,))
+    else:
+        group = get_application_groups('candidate_id').get(applicant_id)
     
     # Combine candidate info with application details
     applicant = {
@@ -240,70 +1578,158 @@ def get_applicant_by_id(applicant_id):
         'major': candidate['major'],
         'phone': candidate.get('phone', ''),
         'gpa': candidate.get('gpa', ''),
-        'applications': application_details
+        'applications': application_details,
+        'status_counts': dict(group['statuses']) if group else {}
     }
     
+    if include_archived:
+        # Skip records a repeated archive run has yet to remove from the active collections
+        active_ids = {detail['application']['id'] for detail in application_details}
+        applicant['archived_applications'] = [
+            {'application': app, 'job': job}
+            for app, job in _archive.applications_for_candidate(applicant_id)
+            if job is not None and app['id'] not in active_ids
+        ]
     return applicant
 
-def get_job_by_id(job_id):
-    """Get a specific job by ID with company information."""
-    jobs = load_jobs()
-    companies = load_companies()
-    
-    # Create company lookup dictionary
-    company_dict = {company['id']: company for company in companies}
-    
-    for job in jobs:
-        if job['id'] == job_id:
-            # Add company information to job
-            job_with_company = job.copy()
-            company = company_dict.get(job['company_id'])
-            if company:
-                job_with_company['company_name'] = company['name']
-                job_with_company['company_location'] = company['location']
-                job_with_company['company_contact_email'] = company['contact_email']
-            return job_with_company
-    return None
+def get_job_by_id(job_id, include_archived=False):
+    """Get a specific job by ID with company information.
+
+    With ``include_archived``, a job that is no longer active is looked up in
+    the archive and returned with ``archived`` set.
+    """
+    if _store is not None:
+        job = _store.get_job_by_id(job_id)
+        if job is None and include_archived:
+            return _get_archived_job(job_id)
+        return job
+    found, job = _snapshot_lookup(JOBS_FILE, 'jobs', job_id)
+    if not found:
+        job = _derived_view(JOBS_FILE, 'jobs', _index_by_id).get(job_id)
+    if job is None:
+        return _get_archived_job(job_id) if include_archived else None
+    return _with_company(job)
+
+def _get_archived_job(job_id):
+    job = _archive.get_job(job_id)
+    return dict(_with_company(job), archived=True) if job is not None else None
+
+def _with_company(job):
+    """Copy of a job with its company's name, location and contact email added."""
+    job_with_company = job.copy()
+    company = get_company_by_id(job['company_id'])
+    if company:
+        job_with_company['company_name'] = company['name']
+        job_with_company['company_location'] = company['location']
+        job_with_company['company_contact_email'] = company['contact_email']
+    return job_with_company
 
 def get_candidate_by_user_id(user_id):
     """Get candidate information by user ID."""
-    users = load_users()
-    candidates = load_candidates()
-    
-    # First find the user
-    user = next((u for u in users if u['id'] == user_id), None)
+    if _store is not None:
+        return _store.get_candidate_by_user_id(user_id)
+    user = _derived_view(USERS_FILE, 'users', UserIndex).by_id.get(user_id)
     if not user or user.get('user_type') != 'candidate':
         return None
-    
-    # Then find the candidate with matching user_id
-    candidate = next((c for c in candidates if c.get('user_id') == user_id), None)
-    return candidate
+    return _derived_view(CANDIDATES_FILE, 'candidates', CandidateIndex).by_user_id.get(user_id)
+
+def migrate_json_to_sqlite(path=None):
+    """Copy every collection from the JSON files into a SQLite database.
+
+    Existing rows in the database are replaced. Returns the record counts.
+    """
+    store = SQLiteStore(path or SQLITE_FILE)
+    collections = {}
+    for name, collection_path in COLLECTIONS.items():
+        entry = _read_entry(collection_path, name, strict=True)
+        collections[name] = entry['data'] if entry else []
+    store.migrate(collections)
+    return {name: len(records) for name, records in collections.items()}
+
+# Closed jobs whose deadline passed more than ARCHIVE_HORIZON_DAYS ago can be
+# moved, with their applications, out of the active collections into monthly
+# partition files in ARCHIVE_DIR (see archive_closed_jobs()). Loaders only
+# read the active collections; archived records are read when asked for.
+ARCHIVE_DIR = os.environ.get('ARCHIVE_DIR', 'archive')
+ARCHIVE_HORIZON_DAYS = int(os.environ.get('ARCHIVE_HORIZON_DAYS', 365))
+_archive = Archive(ARCHIVE_DIR)
+
+def archive_closed_jobs(horizon_days=ARCHIVE_HORIZON_DAYS, today=None):
+    """Move jobs whose deadline passed over ``horizon_days`` ago, and their applications, to the archive.
+
+    Jobs go to the partition of their deadline's month. The partitions are
+    written before the jobs and applications are removed from the active
+    collections, all under the collections' locks, so an interrupted run
+    leaves every record in place and can simply be repeated. Returns the
+    number of jobs and applications moved, and the partitions written.
+    """
+    cutoff = (today or date.today()) - timedelta(days=horizon_days)
+    with transaction('jobs', 'applications') as tx:
+        jobs, applications = tx['jobs'], tx['applications']
+        partitions = {}  # job ID -> partition
+        for job in jobs:
+            deadline = parse_deadline(job.get('application_deadline'))
+            if deadline is not None and deadline < cutoff:
+                partitions[job['id']] = partition_key(deadline)
+        archived_jobs, archived_applications = {}, {}
+        for job in jobs:
+            if job['id'] in partitions:
+                archived_jobs.setdefault(partitions[job['id']], []).append(job)
+        for app in applications:
+            if app['job_id'] in partitions:
+                archived_applications.setdefault(partitions[app['job_id']], []).append(app)
+        if partitions:
+            _archive.add(archived_jobs, archived_applications)
+            jobs[:] = [job for job in jobs if job['id'] not in partitions]
+            applications[:] = [app for app in applications if app['job_id'] not in partitions]
+    return {
+        'jobs': sum(len(records) for records in archived_jobs.values()),
+        'applications': sum(len(records) for records in archived_applications.values()),
+        'partitions': sorted(archived_jobs),
+    }
+
+def get_archive_stats():
+    """Record counts per archive partition."""
+    return _archive.manifest()['partitions']
+
+# Per-process ID blocks: prefix -> [next_id, end_id, pid]
+_id_blocks = {}
+_id_lock = threading.Lock()
+
+def _seed_sequence(prefix):
+    """Find the next free ID for a prefix by scanning its collection once."""
+    name = ID_PREFIXES[prefix]
+    max_id = prefix * 10**7 - 1  # Start at prefix0000000
+    for record in _load_collection(COLLECTIONS[name], name):
+        existing_id = record['id']
+        if str(existing_id).startswith(str(prefix)) and existing_id > max_id:
+            max_id = existing_id
+    # Archived records keep their IDs, so those are never handed out again
+    return max(max_id, _archive.max_id(name) or 0) + 1
+
+def reserve_ids(prefix, count):
+    """Reserve a range of consecutive new IDs with the specified prefix."""
+    if prefix not in ID_PREFIXES:
+        raise ValueError(f"Unknown ID prefix: {prefix}")
+    with _locked([SEQUENCES_FILE]):
+        try:
+            with open(SEQUENCES_FILE, 'r') as f:
+                sequences = json.load(f)
+        except FileNotFoundError:
+            sequences = {}
+        start = sequences.get(str(prefix)) or _seed_sequence(prefix)
+        sequences[str(prefix)] = start + count
+        _write_atomic(SEQUENCES_FILE, sequences)
+    return range(start, start + count)
 
 def generate_id(prefix):
     """Generate a new 8-digit ID with the specified prefix."""
-    import random
-    
-    # Get all existing IDs based on prefix
-    all_ids = []
-    
-    if prefix == 1:  # Users
-        users = load_users()
-        all_ids = [user['id'] for user in users]
-    elif prefix == 2:  # Candidates
-        candidates = load_candidates()
-        all_ids = [candidate['id'] for candidate in candidates]
-    elif prefix == 3:  # Jobs
-        jobs = load_jobs()
-        all_ids = [job['id'] for job in jobs]
-    elif prefix == 4:  # Applications
-        applications = load_applications()
-        all_ids = [app['id'] for app in applications]
-        
-    # Find the maximum existing ID with the given prefix
-    max_id = prefix * 10**7 - 1  # Start at prefix0000000
-    for existing_id in all_ids:
-        if str(existing_id).startswith(str(prefix)):
-            if existing_id > max_id:
-                max_id = existing_id
-    new_id = max_id + 1
-    return new_id
\ No newline at end of file
+    with _id_lock:
+        block = _id_blocks.get(prefix)
+        # Blocks are discarded after a fork so that workers never share one
+        if block is None or block[0] >= block[1] or block[2] != os.getpid():
+            ids = reserve_ids(prefix, ID_BLOCK_SIZE)
+            block = _id_blocks[prefix] = [ids.start, ids.stop, os.getpid()]
+        new_id = block[0]
+        block[0] += 1
+    return new_id
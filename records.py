@@ -0,0 +1,110 @@
+# records.py
+from collections.abc import Mapping
+
+_MISSING = object()
+
+# Values repeated across many records (job IDs, dates, statuses) are kept
+# once and shared. Only low-cardinality fields go through this table, so it
+# stays small.
+_shared = {}
+
+
+class Application(Mapping):
+    """Compact, read-only application record.
+
+    Behaves like the dict it was built from (``record['status']``,
+    ``record.get()``, ``dict(record)``, equality with dicts) but keeps its
+    fields in slots instead of a per-record dict, and shares job IDs, dates
+    and statuses between records. Fields beyond the usual five are kept in
+    ``extra``. Like the dicts they replace, records handed out by the model
+    must not be modified; use ``replace()`` to get a changed copy.
+    """
+
+    __slots__ = ('id', 'job_id', 'candidate_id', 'application_date', 'status', 'extra')
+    FIELDS = ('id', 'job_id', 'candidate_id', 'application_date', 'status')
+
+    def __init__(self, id=_MISSING, job_id=_MISSING, candidate_id=_MISSING, application_date=_MISSING,
+                 status=_MISSING, extra=None, share=_shared.setdefault):
+        self.id = id
+        self.job_id = share(job_id, job_id)
+        self.candidate_id = candidate_id
+        self.application_date = share(application_date, application_date)
+        self.status = share(status, status)
+        self.extra = extra or None
+
+    @classmethod
+    def from_mapping(cls, record):
+        """Build a record from a dict; compact records are returned as they are."""
+        if record.__class__ is cls:
+            return record
+        if len(record) == 5 and record.keys() == _FIELD_SET:
+            return cls(record['id'], record['job_id'], record['candidate_id'],
+                       record['application_date'], record['status'])
+        get = record.get
+        extra = {key: value for key, value in record.items() if key not in _FIELD_SET}
+        return cls(get('id', _MISSING), get('job_id', _MISSING), get('candidate_id', _MISSING),
+                   get('application_date', _MISSING), get('status', _MISSING), extra)
+
+    def replace(self, **changes):
+        """A copy of the record with some fields changed."""
+        return Application.from_mapping(dict(self, **changes))
+
+    def __getitem__(self, key):
+        if key in _FIELD_SET:
+            value = getattr(self, key)
+            if value is not _MISSING:
+                return value
+        elif self.extra is not None and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        if key in _FIELD_SET:
+            value = getattr(self, key)
+            return default if value is _MISSING else value
+        return self.extra.get(key, default) if self.extra is not None else default
+
+    def __contains__(self, key):
+        if key in _FIELD_SET:
+            return getattr(self, key) is not _MISSING
+        return self.extra is not None and key in self.extra
+
+    def __iter__(self):
+        for field in self.FIELDS:
+            if getattr(self, field) is not _MISSING:
+                yield field
+        if self.extra is not None:
+            yield from self.extra
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __eq__(self, other):
+        if isinstance(other, Application):
+            return (all(getattr(self, field) == getattr(other, field) for field in self.FIELDS)
+                    and self.extra == other.extra)
+        if isinstance(other, Mapping):
+            return dict(self) == dict(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def copy(self):
+        """A plain, mutable dict copy of the record."""
+        return dict(self)
+
+    def __reduce__(self):
+        return (Application.from_mapping, (dict(self),))
+
+    def __repr__(self):
+        return f'Application({dict(self)!r})'
+
+
+_FIELD_SET = frozenset(Application.FIELDS)
+
+
+def json_default(value):
+    """``default`` hook for json.dump(s) that serializes compact records as dicts."""
+    if isinstance(value, Mapping):
+        return dict(value)
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
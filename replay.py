@@ -0,0 +1,261 @@
+# replay.py
+"""Replay captured traffic against the app and report latency per route.
+
+Capture traffic by running the app with TRAFFIC_CAPTURE=1 (see traffic.py),
+then replay it in-process through the WSGI app or over HTTP:
+
+    python replay.py traffic.jsonl --concurrency 8
+    python replay.py traffic.jsonl --concurrency 8 --mode processes
+    python replay.py traffic.jsonl --concurrency 16 --gunicorn 4
+    python replay.py traffic.jsonl --url http://127.0.0.1:8000
+
+Each worker keeps one logged-in session per user type and sends its share
+of the log as fast as it can. Replayed writes (applications, registrations)
+really happen, so replay against a copy of the data.
+"""
+import argparse
+import http.cookiejar
+import math
+import multiprocessing
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+import uuid
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, HERE)
+
+from traffic import REDACTED, read_traffic  # noqa: E402
+
+DEFAULT_ACCOUNTS = {'admin': 'admin:admin123', 'candidate': 'john_doe:password123'}
+
+# Values put in place of redacted registration fields, for a new account
+# with a unique username and email per replayed request
+SYNTHETIC_FIELDS = {
+    'username': 'replay_{token}',
+    'email': 'replay_{token}@example.edu',
+    'first_name': 'Replay',
+    'last_name': '{token}',
+    'major': 'Computer Science',
+    'phone': '555-0100',
+    'gpa': '3.0',
+}
+
+
+class WSGIClient:
+    """Sends requests straight to the Flask app through its test client."""
+
+    def __init__(self):
+        from app import app
+        self.client = app.test_client()
+
+    def request(self, method, path, args=None, form=None):
+        response = self.client.open(path, method=method, query_string=args, data=form)
+        response.close()
+        return response.status_code
+
+
+class _NoRedirect(urllib.request.HTTPRedirectHandler):
+    def redirect_request(self, *args, **kwargs):
+        return None
+
+
+class HTTPClient:
+    """Sends requests to a running server, keeping cookies and not following redirects."""
+
+    def __init__(self, base_url):
+        self.base_url = base_url.rstrip('/')
+        self.opener = urllib.request.build_opener(
+            urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar()), _NoRedirect)
+
+    def request(self, method, path, args=None, form=None):
+        url = self.base_url + path
+        if args:
+            url += '?' + urllib.parse.urlencode(args, doseq=True)
+        data = urllib.parse.urlencode(form).encode() if form is not None and method != 'GET' else None
+        try:
+            with self.opener.open(urllib.request.Request(url, data=data, method=method)) as response:
+                response.read()
+                return response.status
+        except urllib.error.HTTPError as error:
+            error.read()
+            return error.code
+
+
+def _make_client(url):
+    return HTTPClient(url) if url else WSGIClient()
+
+
+def _sessions(url, accounts):
+    """One client per user type, logged in with the given accounts."""
+    clients = {'anonymous': _make_client(url)}
+    for user_type, (username, password) in accounts.items():
+        client = _make_client(url)
+        client.request('POST', '/login', form={'username': username, 'password': password})
+        clients[user_type] = client
+    return clients
+
+
+def _fill_form(entry, accounts):
+    """The captured form with redacted values synthesized.
+
+    Logins use the replaying account, passwords are the account's password
+    and other fields get SYNTHETIC_FIELDS values.
+    """
+    form = dict(entry.get('form') or {})
+    username, password = accounts.get(entry.get('user_type'), accounts.get('candidate', ('', '')))
+    token = uuid.uuid4().hex[:12]
+    for key, value in form.items():
+        if value != REDACTED:
+            continue
+        if key in ('password', 'confirm_password'):
+            form[key] = password
+        elif key == 'username' and entry['path'] == '/login':
+            form[key] = username
+        else:
+            form[key] = SYNTHETIC_FIELDS.get(key, '').format(token=token)
+    return form
+
+
+def replay_entries(entries, url, accounts):
+    """Send entries in order; return {route: [latency_ms...]} and {route: error count}."""
+    clients = _sessions(url, accounts)
+    latencies, errors = {}, {}
+    for entry in entries:
+        client = clients.get(entry.get('user_type'), clients['anonymous'])
+        form = _fill_form(entry, accounts) if entry['method'] != 'GET' else None
+        started = time.perf_counter()
+        try:
+            status = client.request(entry['method'], entry['path'], entry.get('args'), form)
+        except OSError:
+            status = 599
+        elapsed = (time.perf_counter() - started) * 1000
+        route = f"{entry['method']} {entry.get('route', entry['path'])}"
+        latencies.setdefault(route, []).append(elapsed)
+        if status >= 500:
+            errors[route] = errors.get(route, 0) + 1
+    return latencies, errors
+
+
+def _replay_worker(args):
+    return replay_entries(*args)
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    rank = max(math.ceil(fraction * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+def run_replay(entries, concurrency, mode, url, accounts):
+    """Split entries round-robin over workers and replay them; returns (results, elapsed)."""
+    shares = [(entries[i::concurrency], url, accounts) for i in range(concurrency)]
+    started = time.perf_counter()
+    if mode == 'processes':
+        with multiprocessing.Pool(concurrency) as pool:
+            results = pool.map(_replay_worker, shares)
+    else:
+        results = [None] * concurrency
+
+        def run(i):
+            results[i] = replay_entries(*shares[i])
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(concurrency)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    return results, time.perf_counter() - started
+
+
+def format_report(results, elapsed, concurrency, mode, target):
+    latencies, errors = {}, {}
+    for worker_latencies, worker_errors in results:
+        for route, values in worker_latencies.items():
+            latencies.setdefault(route, []).extend(values)
+        for route, count in worker_errors.items():
+            errors[route] = errors.get(route, 0) + count
+    total = sum(len(values) for values in latencies.values())
+    width = max([len(route) for route in latencies] + [len('route')]) + 2
+    lines = [f'{total} requests in {elapsed:.2f}s ({total / elapsed:.1f} req/s) '
+             f'with {concurrency} {mode} against {target}; latencies in ms.',
+             f"{'route':<{width}}{'count':>8}{'req/s':>10}{'p50':>10}{'p95':>10}{'p99':>10}{'errors':>8}"]
+    everything = []
+    for route in sorted(latencies, key=lambda route: -len(latencies[route])):
+        values = sorted(latencies[route])
+        everything.extend(values)
+        lines.append(f'{route:<{width}}{len(values):>8}{len(values) / elapsed:>10.1f}'
+                     f'{percentile(values, 0.50):>10.2f}{percentile(values, 0.95):>10.2f}'
+                     f'{percentile(values, 0.99):>10.2f}{errors.get(route, 0):>8}')
+    if everything:
+        everything.sort()
+        lines.append(f"{'all':<{width}}{total:>8}{total / elapsed:>10.1f}{percentile(everything, 0.50):>10.2f}"
+                     f"{percentile(everything, 0.95):>10.2f}{percentile(everything, 0.99):>10.2f}"
+                     f"{sum(errors.values()):>8}")
+    return '\n'.join(lines)
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_gunicorn(workers):
+    """Start a local gunicorn serving the app; returns (process, base URL) once it accepts connections."""
+    port = _free_port()
+    process = subprocess.Popen([sys.executable, '-m', 'gunicorn', '-w', str(workers), '-b', f'127.0.0.1:{port}',
+                                '--log-level', 'warning', 'app:app'], cwd=os.getcwd(),
+                               env=dict(os.environ, PYTHONPATH=HERE))
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=1).close()
+            return process, f'http://127.0.0.1:{port}'
+        except OSError:
+            if process.poll() is not None:
+                break
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError('gunicorn did not start')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('log', help='traffic log captured with TRAFFIC_CAPTURE=1')
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--mode', choices=['threads', 'processes'], default='threads')
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument('--url', help='replay over HTTP against a running server instead of the WSGI app')
+    target.add_argument('--gunicorn', type=int, metavar='WORKERS',
+                        help='start a local gunicorn with this many workers and replay against it')
+    parser.add_argument('--repeat', type=int, default=1, help='replay the log this many times')
+    parser.add_argument('--limit', type=int, help='only replay the first N captured requests')
+    parser.add_argument('--admin', default=DEFAULT_ACCOUNTS['admin'], help='username:password')
+    parser.add_argument('--candidate', default=DEFAULT_ACCOUNTS['candidate'], help='username:password')
+    args = parser.parse_args()
+
+    entries = list(read_traffic(args.log))[:args.limit] * args.repeat
+    if not entries:
+        sys.exit(f'No requests found in {args.log}.')
+    accounts = {'admin': tuple(args.admin.split(':', 1)), 'candidate': tuple(args.candidate.split(':', 1))}
+
+    server, url = None, args.url
+    if args.gunicorn:
+        server, url = start_gunicorn(args.gunicorn)
+    try:
+        results, elapsed = run_replay(entries, args.concurrency, args.mode, url, accounts)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+    print(format_report(results, elapsed, args.concurrency, args.mode, url or 'the WSGI app'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+# response_cache.py
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from datetime import date
+from functools import wraps
+
+from flask import Response, make_response, request, session
+
+from model import get_data_version
+
+RESPONSE_CACHE_MAX_ENTRIES = int(os.environ.get('RESPONSE_CACHE_MAX_ENTRIES', 1024))
+RESPONSE_CACHE_MAX_BYTES = int(os.environ.get('RESPONSE_CACHE_MAX_BYTES', 32 * 1024 * 1024))
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def _build_token():
+    """Identify the deployed code and templates, so a deploy never serves stale ETags."""
+    paths = [os.path.join(HERE, name) for name in os.listdir(HERE) if name.endswith('.py')]
+    templates = os.path.join(HERE, 'templates')
+    paths += [os.path.join(templates, name) for name in os.listdir(templates)]
+    return max(os.stat(path).st_mtime_ns for path in paths)
+
+
+class ResponseCache:
+    """LRU cache of rendered response bodies, bounded by entry count and total bytes."""
+
+    def __init__(self, max_entries=RESPONSE_CACHE_MAX_ENTRIES, max_bytes=RESPONSE_CACHE_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()  # key -> (etag, body, mimetype)
+        self.size = 0
+        self.stats = {'hits': 0, 'misses': 0, 'not_modified': 0, 'evictions': 0}
+        self._lock = threading.Lock()
+
+    def get(self, key, etag):
+        """Return the cached (body, mimetype) for key if it was stored under this etag."""
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None or entry[0] != etag:
+                self.stats['misses'] += 1
+                return None
+            self.entries.move_to_end(key)
+            self.stats['hits'] += 1
+            return entry[1], entry[2]
+
+    def put(self, key, etag, body, mimetype):
+        """Store a rendered body, evicting least recently used entries to stay within the caps."""
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            old = self.entries.pop(key, None)
+            if old is not None:
+                self.size -= len(old[1])
+            self.entries[key] = (etag, body, mimetype)
+            self.size += len(body)
+            while len(self.entries) > self.max_entries or self.size > self.max_bytes:
+                _, evicted = self.entries.popitem(last=False)
+                self.size -= len(evicted[1])
+                self.stats['evictions'] += 1
+
+    def clear(self):
+        with self._lock:
+            self.entries.clear()
+            self.size = 0
+
+
+response_cache = ResponseCache()
+_BUILD_TOKEN = _build_token()
+
+
+def cached_response(*collections, per_user=False):
+    """Cache a GET view's output until one of the collections it reads changes.
+
+    The cache key covers the endpoint, URL and query parameters, the user's
+    role (or the user themself with per_user=True, for pages that greet
+    them by name) and today's date. The key plus the current data versions of
+    ``collections`` give a strong ETag, so a matching If-None-Match gets a 304
+    without the view running at all. Requests with pending flash messages
+    bypass the cache, since those are rendered once and then discarded.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if session.get('_flashes'):
+                return view(*args, **kwargs)
+
+            key = (request.endpoint, tuple(sorted(kwargs.items())), tuple(sorted(request.args.items(multi=True))),
+                   session.get('user_type'), session.get('user_id') if per_user else None,
+                   date.today().isoformat())
+            versions = tuple(get_data_version(name) for name in collections)
+            etag = hashlib.sha1(repr((key, versions, _BUILD_TOKEN)).encode()).hexdigest()
+
+            if etag in request.if_none_match:
+                response_cache.stats['not_modified'] += 1
+                response = Response(status=304)
+            else:
+                cached = response_cache.get(key, etag)
+                if cached is not None:
+                    response = Response(cached[0], mimetype=cached[1])
+                else:
+                    response = make_response(view(*args, **kwargs))
+                    if response.status_code != 200 or response.is_streamed:
+                        return response
+                    response_cache.put(key, etag, response.get_data(), response.mimetype)
+            response.set_etag(etag)
+            response.headers['Cache-Control'] = 'private, no-cache'
+            return response
+        return wrapper
+    return decorator
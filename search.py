@@ -0,0 +1,139 @@
+# search.py
+import math
+import re
+from bisect import bisect_left
+
+TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+# How much a term occurrence in each field counts towards the job's score
+FIELD_WEIGHTS = {
+    'title': 3.0,
+    'company_name': 2.0,
+    'requirements': 1.5,
+    'description': 1.0,
+}
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+# Prefix matches count for less than exact matches, and a short prefix
+# only expands to its most common terms
+PREFIX_WEIGHT = 0.5
+MAX_PREFIX_EXPANSIONS = 20
+
+
+def tokenize(text):
+    """Split text into lowercase alphanumeric tokens."""
+    return TOKEN_RE.findall(text.lower())
+
+
+class JobSearchIndex:
+    """In-memory inverted index over job title, description, requirements and company name.
+
+    Jobs can be added and removed one at a time, so the index is kept up to
+    date as jobs are saved instead of being rebuilt for every query. Queries
+    are ranked with BM25 over field-weighted term frequencies, and each query
+    token also matches indexed terms that start with it.
+    """
+
+    def __init__(self, jobs=(), company_names=None):
+        self.company_names = company_names if company_names is not None else {}
+        self.postings = {}      # term -> {job_id: weighted term frequency}
+        self.doc_terms = {}     # job_id -> {term: weighted term frequency}
+        self.doc_lengths = {}   # job_id -> weighted document length
+        self.total_length = 0.0
+        self._vocabulary = []   # sorted terms, rebuilt lazily for prefix lookups
+        self._vocabulary_stale = False
+        for job in jobs:
+            self.add(job)
+
+    def _job_terms(self, job):
+        fields = {
+            'title': job.get('title', ''),
+            'company_name': self.company_names.get(job.get('company_id'), ''),
+            'requirements': ' '.join(job.get('requirements') or []),
+            'description': job.get('description', ''),
+        }
+        terms = {}
+        for field, text in fields.items():
+            for token in tokenize(text):
+                terms[token] = terms.get(token, 0.0) + FIELD_WEIGHTS[field]
+        return terms
+
+    def add(self, job):
+        """Index a job, replacing any previous version of it."""
+        self.remove(job['id'])
+        terms = self._job_terms(job)
+        for term, weight in terms.items():
+            if term not in self.postings:
+                self.postings[term] = {}
+                self._vocabulary_stale = True
+            self.postings[term][job['id']] = weight
+        self.doc_terms[job['id']] = terms
+        self.doc_lengths[job['id']] = length = sum(terms.values())
+        self.total_length += length
+
+    def remove(self, job_id):
+        """Drop a job from the index."""
+        terms = self.doc_terms.pop(job_id, None)
+        if terms is None:
+            return
+        for term in terms:
+            postings = self.postings[term]
+            del postings[job_id]
+            if not postings:
+                del self.postings[term]
+                self._vocabulary_stale = True
+        self.total_length -= self.doc_lengths.pop(job_id)
+
+    def apply_changes(self, changes):
+        """Update the index for (old_record, new_record) pairs from a save."""
+        for old, new in changes:
+            if new is None:
+                self.remove(old['id'])
+            else:
+                if old is not None and old['id'] != new['id']:
+                    self.remove(old['id'])
+                self.add(new)
+
+    def _expand(self, token):
+        """Terms matched by a query token: itself, plus terms it is a prefix of."""
+        if self._vocabulary_stale:
+            self._vocabulary = sorted(self.postings)
+            self._vocabulary_stale = False
+        matches = {}
+        if token in self.postings:
+            matches[token] = 1.0
+        prefixed = []
+        i = bisect_left(self._vocabulary, token)
+        while i < len(self._vocabulary) and self._vocabulary[i].startswith(token):
+            if self._vocabulary[i] != token:
+                prefixed.append(self._vocabulary[i])
+            i += 1
+        prefixed.sort(key=lambda term: len(self.postings[term]), reverse=True)
+        for term in prefixed[:MAX_PREFIX_EXPANSIONS]:
+            matches[term] = PREFIX_WEIGHT
+        return matches
+
+    def search(self, query, limit=20, job_ids=None):
+        """Return [(job_id, score)] for the best matches, highest score first.
+
+        If ``job_ids`` is given, only those jobs are considered.
+        """
+        doc_count = len(self.doc_lengths)
+        if not doc_count:
+            return []
+        average_length = self.total_length / doc_count
+        scores = {}
+        for token in set(tokenize(query)):
+            for term, term_weight in self._expand(token).items():
+                postings = self.postings[term]
+                idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for job_id, tf in postings.items():
+                    if job_ids is not None and job_id not in job_ids:
+                        continue
+                    norm = K1 * (1 - B + B * self.doc_lengths[job_id] / average_length)
+                    scores[job_id] = scores.get(job_id, 0.0) + term_weight * idf * tf * (K1 + 1) / (tf + norm)
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return ranked[:limit] if limit else ranked
@@ -0,0 +1,196 @@
+# snapshot.py
+import json
+import mmap
+import os
+import struct
+import tempfile
+from bisect import bisect_left
+
+# File layout:
+#   header      MAGIC, then the offset and length of the metadata block
+#   per collection:
+#     records   fixed-width rows: presence bitmask, JSON bitmask, one 8-byte
+#               slot per field (an int64, or the offset and length of a
+#               string in the string table)
+#     ids       sorted int64 record IDs, then the uint32 row of each
+#   strings     UTF-8 string table; each distinct string is stored once
+#   metadata    JSON: fields, kinds, offsets, counts and the signature of the
+#               source data each collection was built from
+MAGIC = b'JFSNAP01'
+HEADER = struct.Struct('<8sQQ')
+MAX_FIELDS = 64
+
+
+class SnapshotError(Exception):
+    """Raised when a snapshot file is missing, truncated or not a snapshot."""
+
+
+def _field_kinds(records):
+    """Ordered field names and their kind: 'i' if every value is an int, else 's'."""
+    kinds = {}
+    for record in records:
+        for key, value in record.items():
+            is_int = isinstance(value, int) and not isinstance(value, bool) and -2**63 <= value < 2**63
+            kinds[key] = 'i' if kinds.get(key, 'i') == 'i' and is_int else 's'
+    if len(kinds) > MAX_FIELDS:
+        raise SnapshotError(f'Collections with more than {MAX_FIELDS} distinct fields are not supported.')
+    return list(kinds), [kinds[field] for field in kinds]
+
+
+def _row_struct(kinds):
+    return struct.Struct('<QQ' + ''.join('q' if kind == 'i' else 'II' for kind in kinds))
+
+
+def write_snapshot(path, collections, signatures):
+    """Write {name: records} to a snapshot file atomically.
+
+    ``signatures`` maps each name to a JSON-serializable token identifying the
+    source data, returned later by Snapshot.signature().
+    """
+    strings = {}
+    string_table = bytearray()
+
+    def intern(text):
+        offset = strings.get(text)
+        if offset is None:
+            encoded = text.encode('utf-8')
+            offset = strings[text] = (len(string_table), len(encoded))
+            string_table.extend(encoded)
+        return offset
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, 0, 0))
+            meta = {'collections': {}}
+            for name, records in collections.items():
+                fields, kinds = _field_kinds(records)
+                row = _row_struct(kinds)
+                records_offset = f.tell()
+                indexed = []
+                for position, record in enumerate(records):
+                    present = json_mask = 0
+                    values = []
+                    for bit, (field, kind) in enumerate(zip(fields, kinds)):
+                        value = record.get(field)
+                        if field in record:
+                            present |= 1 << bit
+                        if kind == 'i':
+                            values.append(value if value is not None else 0)
+                            continue
+                        if not isinstance(value, str):
+                            json_mask |= 1 << bit
+                            value = json.dumps(value)
+                        values.extend(intern(value))
+                    f.write(row.pack(present, json_mask, *values))
+                    record_id = record.get('id')
+                    if isinstance(record_id, int) and not isinstance(record_id, bool):
+                        indexed.append((record_id, position))
+                indexed.sort()
+                ids_offset = f.tell()
+                f.write(struct.pack(f'<{len(indexed)}q', *(record_id for record_id, _ in indexed)))
+                f.write(struct.pack(f'<{len(indexed)}I', *(position for _, position in indexed)))
+                meta['collections'][name] = {
+                    'fields': fields, 'kinds': kinds, 'count': len(records), 'records': records_offset,
+                    'ids': ids_offset, 'indexed': len(indexed), 'signature': signatures.get(name),
+                }
+            meta['strings'] = f.tell()
+            f.write(string_table)
+            encoded_meta = json.dumps(meta).encode('utf-8')
+            meta_offset = f.tell()
+            f.write(encoded_meta)
+            f.seek(0)
+            f.write(HEADER.pack(MAGIC, meta_offset, len(encoded_meta)))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class Snapshot:
+    """Read-only, memory-mapped view of a snapshot file.
+
+    Nothing is decoded up front: opening costs the same whatever the size of
+    the data, records are decoded one at a time on lookup, and every worker
+    mapping the same file shares its pages through the OS page cache.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            try:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # empty file
+                raise SnapshotError(f'{path} is empty.')
+        if len(self._map) < HEADER.size:
+            raise SnapshotError(f'{path} is truncated.')
+        magic, meta_offset, meta_length = HEADER.unpack_from(self._map)
+        if magic != MAGIC or meta_offset + meta_length > len(self._map):
+            raise SnapshotError(f'{path} is not a job fair snapshot.')
+        meta = json.loads(self._map[meta_offset:meta_offset + meta_length])
+        self._strings = meta['strings']
+        self._collections = meta['collections']
+        self._view = view = memoryview(self._map)
+        for info in self._collections.values():
+            info['row'] = _row_struct(info['kinds'])
+            ids_end = info['ids'] + 8 * info['indexed']
+            info['id_list'] = view[info['ids']:ids_end].cast('q')
+            info['positions'] = view[ids_end:ids_end + 4 * info['indexed']].cast('I')
+
+    def __contains__(self, name):
+        return name in self._collections
+
+    def signature(self, name):
+        """The source signature a collection was built from, or None if it is absent."""
+        info = self._collections.get(name)
+        return info['signature'] if info else None
+
+    def count(self, name):
+        return self._collections[name]['count']
+
+    def _decode(self, info, position):
+        row = info['row']
+        values = row.unpack_from(self._map, info['records'] + position * row.size)
+        present, json_mask = values[0], values[1]
+        record = {}
+        slot = 2
+        for bit, (field, kind) in enumerate(zip(info['fields'], info['kinds'])):
+            if kind == 'i':
+                value = values[slot]
+                slot += 1
+            else:
+                start = self._strings + values[slot]
+                value = self._map[start:start + values[slot + 1]].decode('utf-8')
+                if json_mask >> bit & 1:
+                    value = json.loads(value)
+                slot += 2
+            if present >> bit & 1:
+                record[field] = value
+        return record
+
+    def get(self, name, record_id):
+        """Decode the record with this ID, or return None."""
+        info = self._collections[name]
+        ids = info['id_list']
+        i = bisect_left(ids, record_id)
+        if i < len(ids) and ids[i] == record_id:
+            return self._decode(info, info['positions'][i])
+        return None
+
+    def records(self, name):
+        """Decode every record of a collection, in the original order."""
+        info = self._collections[name]
+        return [self._decode(info, position) for position in range(info['count'])]
+
+    def close(self):
+        for info in self._collections.values():
+            info['id_list'].release()
+            info['positions'].release()
+        self._view.release()
+        self._map.close()
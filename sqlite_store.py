@@ -0,0 +1,362 @@
+# sqlite_store.py
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+# Column definitions per collection. Keys of a record that are not listed here
+# are kept in the `extra` column so that records round-trip unchanged.
+SCHEMA = {
+    'users': [
+        ('id', 'INTEGER PRIMARY KEY'),
+        ('username', 'TEXT NOT NULL'),
+        ('password', 'TEXT'),
+        ('user_type', 'TEXT'),
+        ('candidate_id', 'INTEGER'),
+    ],
+    'candidates': [
+        ('id', 'INTEGER PRIMARY KEY'),
+        ('user_id', 'INTEGER'),
+        ('first_name', 'TEXT'),
+        ('last_name', 'TEXT'),
+        ('email', 'TEXT'),
+        ('major', 'TEXT'),
+        ('phone', 'TEXT'),
+        ('gpa', 'TEXT'),
+    ],
+    'jobs': [
+        ('id', 'INTEGER PRIMARY KEY'),
+        ('title', 'TEXT'),
+        ('company_id', 'INTEGER'),
+        ('description', 'TEXT'),
+        ('requirements', 'TEXT'),
+        ('posted_date', 'TEXT'),
+        ('application_deadline', 'TEXT'),
+        ('application_status', 'TEXT'),
+    ],
+    'applications': [
+        ('id', 'INTEGER PRIMARY KEY'),
+        ('job_id', 'INTEGER NOT NULL'),
+        ('candidate_id', 'INTEGER NOT NULL'),
+        ('application_date', 'TEXT'),
+        ('status', 'TEXT'),
+    ],
+    'companies': [
+        ('id', 'INTEGER PRIMARY KEY'),
+        ('name', 'TEXT'),
+        ('contact_email', 'TEXT'),
+        ('location', 'TEXT'),
+    ],
+}
+
+# Columns holding lists or dicts, stored as JSON text
+JSON_COLUMNS = {'jobs': {'requirements'}}
+
+INDEXES = [
+    'CREATE INDEX IF NOT EXISTS idx_users_username ON users(username)',
+    'CREATE INDEX IF NOT EXISTS idx_users_username_nocase ON users(username COLLATE NOCASE)',
+    'CREATE INDEX IF NOT EXISTS idx_users_candidate_id ON users(candidate_id)',
+    'CREATE INDEX IF NOT EXISTS idx_candidates_user_id ON candidates(user_id)',
+    'CREATE INDEX IF NOT EXISTS idx_candidates_email_nocase ON candidates(email COLLATE NOCASE)',
+    'CREATE INDEX IF NOT EXISTS idx_jobs_company_id ON jobs(company_id)',
+    'CREATE INDEX IF NOT EXISTS idx_jobs_deadline ON jobs(application_deadline)',
+    'CREATE INDEX IF NOT EXISTS idx_applications_job_id ON applications(job_id)',
+    'CREATE INDEX IF NOT EXISTS idx_applications_candidate_job ON applications(candidate_id, job_id)',
+]
+
+
+def _columns(name):
+    return [column for column, _ in SCHEMA[name]]
+
+
+class SQLiteApplicationIndex:
+    """ApplicationIndex look-alike that answers each lookup with an indexed query."""
+
+    def __init__(self, store):
+        self.store = store
+
+    def count_for_job(self, job_id):
+        """Number of applications submitted to a job."""
+        row = self.store.query_one('SELECT COUNT(*) AS n FROM applications WHERE job_id = ?', (job_id,))
+        return row['n']
+
+    def for_job(self, job_id):
+        """All applications submitted to a job."""
+        return self.store.select('applications', 'WHERE job_id = ? ORDER BY id', (job_id,))
+
+    def for_candidate(self, candidate_id):
+        """All applications submitted by a candidate."""
+        return self.store.select('applications', 'WHERE candidate_id = ? ORDER BY id', (candidate_id,))
+
+    def has_applied(self, candidate_id, job_id):
+        """Whether the candidate already has an application for the job."""
+        row = self.store.query_one('SELECT 1 FROM applications WHERE candidate_id = ? AND job_id = ? LIMIT 1',
+                                   (candidate_id, job_id))
+        return row is not None
+
+    def get(self, application_id):
+        """The application with this ID, or None."""
+        return self.store.select_one('applications', 'WHERE id = ?', (application_id,))
+
+
+class SQLiteStore:
+    """SQLite storage for the five collections, with the model.py return shapes.
+
+    Each table has a row in the `versions` table that triggers bump on every
+    insert, update or delete, so in-memory structures derived from a table can
+    tell when to rebuild, across processes.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        self._create_schema()
+
+    # -- connection handling -------------------------------------------------
+
+    @property
+    def conn(self):
+        """A connection for the current thread, reopened after a fork."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    @contextmanager
+    def transaction(self):
+        """Run a block inside one write transaction; nested calls join the outer one."""
+        conn = self.conn
+        if conn.in_transaction:
+            yield conn
+            return
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            yield conn
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        conn.execute('COMMIT')
+
+    def _create_schema(self):
+        with self.transaction() as conn:
+            conn.execute('CREATE TABLE IF NOT EXISTS versions (name TEXT PRIMARY KEY, version INTEGER NOT NULL)')
+            for name, columns in SCHEMA.items():
+                definition = ', '.join(f'{column} {kind}' for column, kind in columns)
+                conn.execute(f'CREATE TABLE IF NOT EXISTS {name} ({definition}, extra TEXT)')
+                conn.execute('INSERT OR IGNORE INTO versions (name, version) VALUES (?, 0)', (name,))
+                for event in ('INSERT', 'UPDATE', 'DELETE'):
+                    conn.execute(
+                        f'CREATE TRIGGER IF NOT EXISTS {name}_{event.lower()}_version AFTER {event} ON {name} '
+                        f"BEGIN UPDATE versions SET version = version + 1 WHERE name = '{name}'; END")
+            for statement in INDEXES:
+                conn.execute(statement)
+
+    # -- row conversion ------------------------------------------------------
+
+    def _to_row(self, name, record):
+        json_columns = JSON_COLUMNS.get(name, ())
+        values = []
+        for column in _columns(name):
+            value = record.get(column)
+            if column in json_columns and value is not None:
+                value = json.dumps(value)
+            values.append(value)
+        extra = {key: value for key, value in record.items() if key not in _columns(name)}
+        values.append(json.dumps(extra) if extra else None)
+        return values
+
+    def _to_record(self, name, row, prefix=''):
+        json_columns = JSON_COLUMNS.get(name, ())
+        record = {}
+        for column in _columns(name):
+            value = row[prefix + column]
+            if value is None:
+                continue
+            record[column] = json.loads(value) if column in json_columns else value
+        extra = row[prefix + 'extra']
+        if extra:
+            record.update(json.loads(extra))
+        return record
+
+    # -- generic access ------------------------------------------------------
+
+    def query_one(self, sql, params=()):
+        return self.conn.execute(sql, params).fetchone()
+
+    def select(self, name, where='', params=()):
+        """Select records from a table as dicts shaped like the JSON records."""
+        rows = self.conn.execute(f'SELECT * FROM {name} {where}', params)
+        return [self._to_record(name, row) for row in rows]
+
+    def iterate(self, name, where='', params=()):
+        """Like select(), but yields records one at a time from the cursor."""
+        for row in self.conn.execute(f'SELECT * FROM {name} {where}', params):
+            yield self._to_record(name, row)
+
+    def select_one(self, name, where, params=()):
+        row = self.conn.execute(f'SELECT * FROM {name} {where} LIMIT 1', params).fetchone()
+        return self._to_record(name, row) if row else None
+
+    def load(self, name):
+        """Load a whole collection in file order."""
+        return self.select(name, 'ORDER BY rowid')
+
+    def version(self, name):
+        """Change counter for a collection, bumped by triggers on every write."""
+        return self.query_one('SELECT version FROM versions WHERE name = ?', (name,))['version']
+
+    def _insert_sql(self, name, verb='INSERT'):
+        columns = _columns(name) + ['extra']
+        placeholders = ', '.join('?' for _ in columns)
+        return f'{verb} INTO {name} ({", ".join(columns)}) VALUES ({placeholders})'
+
+    def replace_all(self, name, records):
+        """Replace the contents of a collection."""
+        with self.transaction() as conn:
+            conn.execute(f'DELETE FROM {name}')
+            conn.executemany(self._insert_sql(name), (self._to_row(name, r) for r in records))
+
+    def write_changes(self, name, original, data):
+        """Persist the difference between two versions of a collection list.
+
+        Records that are the same objects as in ``original`` are left alone,
+        so only new or replaced records and removed IDs touch the database.
+        """
+        unchanged = {id(record) for record in original}
+        kept_ids = {record['id'] for record in data}
+        with self.transaction() as conn:
+            removed = [(record['id'],) for record in original if record['id'] not in kept_ids]
+            conn.executemany(f'DELETE FROM {name} WHERE id = ?', removed)
+            conn.executemany(self._insert_sql(name, 'INSERT OR REPLACE'),
+                             (self._to_row(name, r) for r in data if id(r) not in unchanged))
+
+    def apply_ops(self, name, ops):
+        """Apply journal-style operations (insert / status) to a collection."""
+        with self.transaction() as conn:
+            for op in ops:
+                if op['op'] == 'insert':
+                    conn.execute(self._insert_sql(name, 'INSERT OR IGNORE'), self._to_row(name, op['record']))
+                elif op['op'] == 'status':
+                    conn.execute(f'UPDATE {name} SET status = ? WHERE id = ?', (op['status'], op['id']))
+
+    def migrate(self, collections):
+        """One-shot import of {name: records} from the JSON files."""
+        with self.transaction():
+            for name, records in collections.items():
+                self.replace_all(name, records)
+
+    # -- model.py queries ----------------------------------------------------
+
+    def authenticate_user(self, username, password):
+        return self.select_one('users', 'WHERE username = ? AND password = ?', (username, password))
+
+    def get_company_by_id(self, company_id):
+        return self.select_one('companies', 'WHERE id = ?', (company_id,))
+
+    def get_candidate_by_id(self, candidate_id):
+        return self.select_one('candidates', 'WHERE id = ?', (candidate_id,))
+
+    def get_user_by_candidate_id(self, candidate_id):
+        return self.select_one('users', 'WHERE candidate_id = ? ORDER BY rowid', (candidate_id,))
+
+    def get_candidate_by_user_id(self, user_id):
+        row = self.conn.execute(
+            'SELECT c.* FROM candidates c JOIN users u ON u.id = c.user_id '
+            "WHERE u.id = ? AND u.user_type = 'candidate' ORDER BY c.rowid LIMIT 1", (user_id,)).fetchone()
+        return self._to_record('candidates', row) if row else None
+
+    def get_job_by_id(self, job_id):
+        row = self.conn.execute(
+            'SELECT j.*, c.name AS company_name, c.location AS company_location, '
+            'c.contact_email AS company_contact_email, c.id AS company_found '
+            'FROM jobs j LEFT JOIN companies c ON c.id = j.company_id WHERE j.id = ?', (job_id,)).fetchone()
+        if row is None:
+            return None
+        job = self._to_record('jobs', row)
+        if row['company_found'] is not None:
+            job['company_name'] = row['company_name']
+            job['company_location'] = row['company_location']
+            job['company_contact_email'] = row['company_contact_email']
+        return job
+
+    def get_applicants(self):
+        rows = self.conn.execute(
+            'SELECT c.*, MAX(a.application_date) AS latest_application_date '
+            'FROM candidates c JOIN applications a ON a.candidate_id = c.id '
+            'GROUP BY c.id ORDER BY c.rowid')
+        applicants = []
+        for row in rows:
+            candidate = self._to_record('candidates', row)
+            applicants.append({
+                'id': candidate['id'],
+                'full_name': f"{candidate['first_name']} {candidate['last_name']}",
+                'first_name': candidate['first_name'],
+                'last_name': candidate['last_name'],
+                'email': candidate['email'],
+                'major': candidate['major'],
+                'phone': candidate.get('phone', ''),
+                'gpa': candidate.get('gpa', ''),
+                'application_date': row['latest_application_date'],
+            })
+        return applicants
+
+    def application_summary(self, where='', params=()):
+        """Count, latest date and status breakdown of the matching applications, or None if there are none."""
+        rows = self.conn.execute(
+            f'SELECT status, COUNT(*) AS count, MAX(application_date) AS latest_date FROM applications {where} '
+            'GROUP BY status', params).fetchall()
+        if not rows:
+            return None
+        return {'count': sum(row['count'] for row in rows),
+                'latest_date': max((row['latest_date'] for row in rows if row['latest_date'] is not None), default=None),
+                'statuses': {row['status']: row['count'] for row in rows}}
+
+    def application_counts(self):
+        """Application counts per job, company, major, status and day, as {key: count} dicts.
+
+        Shaped as ApplicationAnalytics.from_counts() takes them; applications
+        whose job or candidate is missing are counted under None.
+        """
+        queries = {
+            'by_job': 'SELECT a.job_id, COUNT(*) FROM applications a GROUP BY a.job_id',
+            'by_company': 'SELECT j.company_id, COUNT(*) FROM applications a '
+                          'LEFT JOIN jobs j ON j.id = a.job_id GROUP BY j.company_id',
+            'by_major': 'SELECT c.major, COUNT(*) FROM applications a '
+                        'LEFT JOIN candidates c ON c.id = a.candidate_id GROUP BY c.major',
+            'by_status': 'SELECT a.status, COUNT(*) FROM applications a GROUP BY a.status',
+            'by_day': 'SELECT a.application_date, COUNT(*) FROM applications a GROUP BY a.application_date',
+        }
+        return {name: {row[0]: row[1] for row in self.conn.execute(sql)} for name, sql in queries.items()}
+
+    def get_application_details(self, where='', params=()):
+        """Applications joined with their candidate, job and company, as the JSON backend returns them."""
+        return list(self.iter_application_details(where, params))
+
+    def iter_application_details(self, where='', params=()):
+        """Like get_application_details(), but yields rows one at a time from the cursor."""
+        job_columns = ', '.join(f'j.{column} AS job_{column}' for column in _columns('jobs') + ['extra'])
+        candidate_columns = ', '.join(f'c.{column} AS candidate_{column}'
+                                      for column in _columns('candidates') + ['extra'])
+        company_columns = ', '.join(f'co.{column} AS company_{column}'
+                                    for column in _columns('companies') + ['extra'])
+        rows = self.conn.execute(
+            f'SELECT a.*, {job_columns}, {candidate_columns}, {company_columns} FROM applications a '
+            'JOIN jobs j ON j.id = a.job_id JOIN candidates c ON c.id = a.candidate_id '
+            'LEFT JOIN companies co ON co.id = j.company_id '
+            f'{where} ORDER BY a.rowid', params)
+        for row in rows:
+            yield {
+                'application': self._to_record('applications', row),
+                'candidate': self._to_record('candidates', row, 'candidate_'),
+                'job': self._to_record('jobs', row, 'job_'),
+                'company': self._to_record('companies', row, 'company_') if row['company_id'] is not None else None,
+            }
+
+    def application_index(self):
+        return SQLiteApplicationIndex(self)
@@ -0,0 +1,129 @@
+// virtual_list.js
+// A scrolling list that keeps only the rows in view in the page and fetches
+// the others a page at a time, as they are scrolled to, from a JSON endpoint
+// answering ?offset=&limit= with {"total": ..., "offset": ..., "items": [...]}.
+// Every row is as tall as the first row rendered by the server.
+
+const VIRTUAL_LIST_OVERSCAN = 10;   // rows rendered above and below the visible ones
+const VIRTUAL_LIST_MAX_PAGES = 20;  // fetched pages kept around for scrolling back
+
+function escapeHtml(value) {
+    const entities = {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'};
+    return String(value ?? '').replace(/[&<>"']/g, character => entities[character]);
+}
+
+class VirtualList {
+    constructor(container, {url, params = {}, total, pageSize, firstPage, renderRow, emptyHtml}) {
+        this.container = container;
+        this.url = url;
+        this.params = params;
+        this.total = total;
+        this.pageSize = pageSize;
+        this.renderRow = renderRow;
+        this.emptyHtml = emptyHtml;
+        this.pages = new Map([[0, firstPage]]);
+        this.loading = new Set();
+        this.generation = 0;
+        this.frame = null;
+
+        // Measure a server-rendered row before taking the list over
+        const firstRow = container.firstElementChild;
+        this.gap = parseFloat(getComputedStyle(container).rowGap) || 0;
+        this.rowHeight = (firstRow && firstRow.offsetHeight ? firstRow.offsetHeight : 80) + this.gap;
+
+        container.classList.add('virtual-list');
+        container.innerHTML = '<div class="virtual-list-rows"></div>';
+        this.rows = container.firstElementChild;
+        container.addEventListener('scroll', () => this.scheduleRender());
+        window.addEventListener('resize', () => this.scheduleRender());
+        this.render();
+    }
+
+    // Show the list for different query parameters (e.g. another sort order), from the top
+    setParams(params) {
+        this.params = Object.assign({}, this.params, params);
+        this.generation++;
+        this.pages.clear();
+        this.loading.clear();
+        this.container.scrollTop = 0;
+        this.render();
+    }
+
+    scheduleRender() {
+        if (this.frame === null) {
+            this.frame = requestAnimationFrame(() => this.render());
+        }
+    }
+
+    load(page) {
+        if (this.loading.has(page)) {
+            return;
+        }
+        this.loading.add(page);
+        const generation = this.generation;
+        const query = new URLSearchParams(Object.assign({}, this.params, {
+            offset: page * this.pageSize,
+            limit: this.pageSize,
+        }));
+        fetch(`${this.url}?${query}`, {credentials: 'same-origin'})
+            .then(response => {
+                if (!response.ok) {
+                    throw new Error(`${response.status} ${response.statusText}`);
+                }
+                return response.json();
+            })
+            .then(data => {
+                if (generation === this.generation) {
+                    this.pages.set(page, data.items);
+                    this.total = data.total;
+                    this.scheduleRender();
+                }
+            })
+            .catch(error => console.error('Could not load list page', page, error))
+            .finally(() => {
+                if (generation === this.generation) {
+                    this.loading.delete(page);
+                }
+            });
+    }
+
+    render() {
+        this.frame = null;
+        if (this.total === 0) {
+            this.rows.style.height = '';
+            this.rows.innerHTML = this.emptyHtml;
+            return;
+        }
+        const height = this.rowHeight;
+        const scrollTop = this.container.scrollTop;
+        const first = Math.max(0, Math.floor(scrollTop / height) - VIRTUAL_LIST_OVERSCAN);
+        const last = Math.min(this.total, Math.ceil((scrollTop + this.container.clientHeight) / height) + VIRTUAL_LIST_OVERSCAN);
+        this.rows.style.height = `${this.total * height}px`;
+
+        let html = '';
+        for (let index = first; index < last; index++) {
+            const page = Math.floor(index / this.pageSize);
+            const items = this.pages.get(page);
+            const style = `top: ${index * height}px; height: ${height - this.gap}px`;
+            if (items === undefined) {
+                this.load(page);
+                html += `<div class="virtual-row virtual-placeholder" style="${style}"></div>`;
+            } else if (index - page * this.pageSize < items.length) {
+                html += `<div class="virtual-row" style="${style}">${this.renderRow(items[index - page * this.pageSize])}</div>`;
+            }
+        }
+        this.rows.innerHTML = html;
+
+        // Forget pages far from the visible ones
+        const firstPage = Math.floor(first / this.pageSize);
+        const lastPage = Math.floor(last / this.pageSize);
+        for (const page of this.pages.keys()) {
+            if (this.pages.size <= VIRTUAL_LIST_MAX_PAGES) {
+                break;
+            }
+            if (page < firstPage - 1 || page > lastPage + 1) {
+                this.pages.delete(page);
+            }
+        }
+    }
+}
@@ -0,0 +1,110 @@
+# stress.py
+"""Hammer the locked write paths from many processes and check nothing is lost.
+
+Runs against a throwaway copy of the JSON data files, so it is safe to run
+from a working checkout:
+
+    python stress.py --processes 8 --writes 50
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, HERE)
+
+import model  # noqa: E402
+
+
+def worker(worker_id, writes, journal_max_bytes):
+    """Register users and submit applications as fast as possible."""
+    model.JOURNAL_MAX_BYTES = journal_max_bytes
+    for i in range(writes):
+        with model.transaction('users', 'candidates') as tx:
+            user_id = model.generate_id(1)
+            candidate_id = model.generate_id(2)
+            tx['users'].append({
+                'id': user_id,
+                'username': f'stress_{worker_id}_{i}',
+                'password': 'stress123',
+                'user_type': 'candidate',
+                'candidate_id': candidate_id,
+            })
+            tx['candidates'].append({
+                'id': candidate_id,
+                'user_id': user_id,
+                'first_name': 'Stress',
+                'last_name': f'{worker_id}-{i}',
+                'email': f'stress_{worker_id}_{i}@example.edu',
+                'major': 'Load Testing',
+                'phone': '',
+                'gpa': '3.0',
+            })
+        with model.transaction('applications') as tx:
+            tx.insert('applications', {
+                'id': model.generate_id(4),
+                'candidate_id': candidate_id,
+                'job_id': 30000001,
+                'application_date': '2025-10-01',
+                'status': 'pending',
+            })
+
+
+def check(expected):
+    """Verify counts and ID uniqueness; return a list of problems found."""
+    model.invalidate_cache()
+    problems = []
+    for name, path in model.COLLECTIONS.items():
+        with open(path) as f:
+            json.load(f)  # must never be half-written
+    for name, count in expected.items():
+        ids = [record['id'] for record in getattr(model, f'load_{name}')()]
+        if len(ids) != count:
+            problems.append(f'{name}: expected {count} records, found {len(ids)}')
+        if len(set(ids)) != len(ids):
+            problems.append(f'{name}: {len(ids) - len(set(ids))} duplicate IDs')
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--processes', type=int, default=8)
+    parser.add_argument('--writes', type=int, default=50)
+    parser.add_argument('--journal-max-bytes', type=int, default=4096,
+                        help='small threshold so compactions race with appends')
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='stress-')
+    for path in model.COLLECTIONS.values():
+        shutil.copy(os.path.join(HERE, path), workdir)
+    os.chdir(workdir)
+
+    written = ('users', 'candidates', 'applications')
+    before = {name: len(getattr(model, f'load_{name}')()) for name in written}
+    model.invalidate_cache()
+
+    processes = [multiprocessing.Process(target=worker, args=(n, args.writes, args.journal_max_bytes))
+                 for n in range(args.processes)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    total = args.processes * args.writes
+    problems = check({name: count + total for name, count in before.items()})
+    shutil.rmtree(workdir)
+    if any(process.exitcode for process in processes):
+        problems.append('a worker process crashed')
+    if problems:
+        for problem in problems:
+            print(f'FAIL: {problem}')
+        sys.exit(1)
+    print(f'OK: {args.processes} processes x {args.writes} writes, no records lost.')
+
+
+if __name__ == '__main__':
+    main()
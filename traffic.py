@@ -0,0 +1,70 @@
+# traffic.py
+import json
+import os
+import random
+import threading
+import time
+
+# Opt-in capture of request metadata for replay.py. Each captured request
+# is appended to TRAFFIC_CAPTURE_FILE as one JSON line; with several
+# workers the appends interleave whole lines.
+TRAFFIC_CAPTURE = os.environ.get('TRAFFIC_CAPTURE', '0') == '1'
+TRAFFIC_CAPTURE_FILE = os.environ.get('TRAFFIC_CAPTURE_FILE', 'traffic.jsonl')
+TRAFFIC_CAPTURE_SAMPLE = float(os.environ.get('TRAFFIC_CAPTURE_SAMPLE', 1.0))
+
+# Form fields whose values are written to the log as they are: IDs and
+# statuses that identify no one. Every other field is logged by name only,
+# with its value replaced by REDACTED; replay.py synthesizes those values.
+LOGGED_FIELDS = ('applicant_id', 'application_id', 'status')
+REDACTED = '[redacted]'
+
+
+def sanitize(form):
+    """Copy of a form dict with the values of fields outside LOGGED_FIELDS replaced by REDACTED."""
+    return {key: value if key in LOGGED_FIELDS else REDACTED for key, value in form.items()}
+
+
+class TrafficRecorder:
+    """Append sanitized request metadata to a JSONL file."""
+
+    def __init__(self, path=TRAFFIC_CAPTURE_FILE, enabled=TRAFFIC_CAPTURE, sample=TRAFFIC_CAPTURE_SAMPLE):
+        self.path = path
+        self.enabled = enabled
+        self.sample = sample
+        self._lock = threading.Lock()
+
+    def record(self, method, route, path, args, form, user_type, status, duration):
+        if not self.enabled or (self.sample < 1.0 and random.random() >= self.sample):
+            return
+        line = json.dumps({
+            'ts': time.time(),
+            'method': method,
+            'route': route,
+            'path': path,
+            'args': args,
+            'form': sanitize(form),
+            'user_type': user_type,
+            'status': status,
+            'latency_ms': round(duration * 1000, 3),
+        }) + '\n'
+        with self._lock:
+            try:
+                with open(self.path, 'a') as f:
+                    f.write(line)
+            except IOError:
+                print(f"Warning: Could not write to {self.path}.")
+
+
+def read_traffic(path):
+    """Yield captured requests from a traffic log, skipping unreadable lines."""
+    with open(path) as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(entry, dict) and 'method' in entry and 'path' in entry:
+                yield entry
+
+
+traffic_recorder = TrafficRecorder()
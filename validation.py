@@ -0,0 +1,78 @@
+# validation.py
+import re
+
+from model import find_user_by_username, find_candidate_by_email
+
+def validate_email(email):
+    """Validate email format using regex."""
+    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+    return re.match(pattern, email) is not None
+
+def username_exists(username):
+    """Check if username already exists."""
+    return find_user_by_username(username) is not None
+
+def email_exists(email):
+    """Check if email already exists in candidates."""
+    return find_candidate_by_email(email) is not None
+
+def validate_registration(fields, check_uniqueness=True):
+    """Validate candidate registration fields and return a list of error messages.
+
+    ``fields`` holds stripped strings for username, password, confirm_password,
+    first_name, last_name, email, major, phone and gpa. With
+    check_uniqueness=False the username and email are not looked up, for
+    callers that check them later under the write lock.
+    """
+    username = fields.get('username', '')
+    password = fields.get('password', '')
+    email = fields.get('email', '')
+    gpa = fields.get('gpa', '')
+    errors = []
+    
+    # Required field validation
+    if not username:
+        errors.append('Username is required.')
+    elif len(username) < 3:
+        errors.append('Username must be at least 3 characters long.')
+    elif check_uniqueness and username_exists(username):
+        errors.append('Username already exists. Please choose a different one.')
+        
+    if not password:
+        errors.append('Password is required.')
+    elif len(password) < 6:
+        errors.append('Password must be at least 6 characters long.')
+        
+    if password != fields.get('confirm_password', ''):
+        errors.append('Passwords do not match.')
+        
+    if not fields.get('first_name'):
+        errors.append('First name is required.')
+        
+    if not fields.get('last_name'):
+        errors.append('Last name is required.')
+        
+    if not email:
+        errors.append('Email is required.')
+    elif not validate_email(email):
+        errors.append('Please enter a valid email address.')
+    elif check_uniqueness and email_exists(email):
+        errors.append('Email already registered. Please use a different email.')
+        
+    if not fields.get('major'):
+        errors.append('Major is required.')
+        
+    if not fields.get('phone'):
+        errors.append('Phone number is required.')
+        
+    if not gpa:
+        errors.append('GPA is required.')
+    else:
+        try:
+            gpa_float = float(gpa)
+            if gpa_float < 0.0 or gpa_float > 4.0:
+                errors.append('GPA must be between 0.0 and 4.0.')
+        except ValueError:
+            errors.append('Please enter a valid GPA (e.g., 3.5).')
+    
+    return errors